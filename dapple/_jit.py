@@ -0,0 +1,121 @@
+"""Optional Numba acceleration for pixel loops.
+
+Numba is not a dependency of dapple. When it is installed (``pip install
+dapple[fast]``), functions decorated with ``njit`` are compiled to native
+code; otherwise they run as plain Python, so results are the same either
+way.
+
+Numba itself is imported on the first call of a decorated function, not
+when dapple is imported. Importing it and loading the compiled kernels
+costs about half a second per process, more than the kernels save on a
+single render of a terminal-sized image, so callers that also have a
+NumPy or plain-Python path ask ``use_kernels()`` first: it only says yes
+for inputs large enough to pay for the import, or after
+``enable_kernels()``, which tools that render many frames call. If the
+import fails (say, a Numba build that does not match the installed
+NumPy), kernels run as plain Python and ``use_kernels()`` is always
+False.
+"""
+
+from __future__ import annotations
+
+from importlib.util import find_spec
+from typing import Any, Callable
+
+HAS_NUMBA = find_spec("numba") is not None
+
+# numba.njit once imported; None before the first attempt or if it failed
+_numba_njit: Callable | None = None
+_numba_import_failed = False
+
+# Set by enable_kernels(): run kernels on inputs of any size
+_kernels_enabled = False
+
+
+def _import_njit() -> Callable | None:
+    """Import ``numba.njit`` on first use, or None if Numba does not import."""
+    global _numba_njit, _numba_import_failed
+    if _numba_njit is None and not _numba_import_failed:
+        try:
+            if not HAS_NUMBA:
+                raise ImportError("numba is not installed")
+            from numba import njit as numba_njit
+        except ImportError:
+            _numba_import_failed = True
+        else:
+            _numba_njit = numba_njit
+    return _numba_njit
+
+
+def numba_ready() -> bool:
+    """Whether decorated functions are compiled by Numba.
+
+    True when Numba is installed and imports cleanly. The first call
+    imports Numba, so callers guard it with ``HAS_NUMBA`` to keep the
+    check free when Numba is absent.
+    """
+    return _import_njit() is not None
+
+
+def enable_kernels(enabled: bool = True) -> None:
+    """Run compiled kernels on inputs of any size from now on.
+
+    For callers that render many frames in one process, such as vidcat,
+    where importing Numba once pays off over the whole run.
+
+    Args:
+        enabled: False to go back to the size thresholds of ``use_kernels``.
+    """
+    global _kernels_enabled
+    _kernels_enabled = enabled
+
+
+def use_kernels(size: int, min_size: int | None = None) -> bool:
+    """Whether to run a compiled kernel rather than the NumPy or Python path.
+
+    True when Numba imports cleanly and either ``enable_kernels()`` was
+    called or the input is large enough that the kernel pays for importing
+    Numba in one call. Numba is not imported for smaller inputs.
+
+    Args:
+        size: Number of elements in the input.
+        min_size: Input size from which the kernel pays for the import, or
+            None if it only pays over repeated renders.
+    """
+    if not HAS_NUMBA:
+        return False
+    if not _kernels_enabled and (min_size is None or size < min_size):
+        return False
+    return numba_ready()
+
+
+class _LazyJit:
+    """Callable that compiles its Python function on first use."""
+
+    __slots__ = ("py_func", "_options", "_impl")
+
+    def __init__(self, func: Callable, options: dict[str, Any]) -> None:
+        self.py_func = func
+        self._options = options
+        self._impl: Callable | None = None
+
+    def __call__(self, *args: Any) -> Any:
+        if self._impl is None:
+            numba_njit = _import_njit()
+            if numba_njit is not None:
+                self._impl = numba_njit(**self._options)(self.py_func)
+            else:
+                self._impl = self.py_func
+        return self._impl(*args)
+
+
+def njit(func: Callable | None = None, **options: Any) -> Callable:
+    """Compile ``func`` with ``numba.njit`` if available, else run it as-is.
+
+    Usable bare (``@njit``) or with Numba options (``@njit(cache=True)``).
+    The original function stays available as ``.py_func``. Decorated
+    functions cannot call each other from compiled code.
+    """
+    if func is None:
+        return lambda f: _LazyJit(f, options)
+    return _LazyJit(func, options)
@@ -90,12 +90,9 @@ class CairoAdapter:
                 buffer=data,
             )[:, :width, :]
 
-            # Cairo uses BGRA ordering on little-endian systems
-            b = arr[:, :, 0].astype(np.float32) / 255.0
-            g = arr[:, :, 1].astype(np.float32) / 255.0
-            r = arr[:, :, 2].astype(np.float32) / 255.0
-
-            colors = np.stack([r, g, b], axis=2)
+            # Cairo uses BGRA ordering on little-endian systems; reverse the
+            # first three channels and scale them to float32 in one pass
+            colors = np.divide(arr[:, :, 2::-1], np.float32(255.0), dtype=np.float32)
             bitmap = luminance(colors)
 
             return Canvas(bitmap, colors=colors, renderer=self._renderer)
@@ -108,11 +105,7 @@ class CairoAdapter:
                 buffer=data,
             )[:, :width, :]
 
-            b = arr[:, :, 0].astype(np.float32) / 255.0
-            g = arr[:, :, 1].astype(np.float32) / 255.0
-            r = arr[:, :, 2].astype(np.float32) / 255.0
-
-            colors = np.stack([r, g, b], axis=2)
+            colors = np.divide(arr[:, :, 2::-1], np.float32(255.0), dtype=np.float32)
             bitmap = luminance(colors)
 
             return Canvas(bitmap, colors=colors, renderer=self._renderer)
@@ -125,7 +118,7 @@ class CairoAdapter:
                 buffer=data,
             )[:, :width]
 
-            bitmap = arr.astype(np.float32) / 255.0
+            bitmap = np.divide(arr, np.float32(255.0), dtype=np.float32)
             return Canvas(bitmap, renderer=self._renderer)
 
         else:
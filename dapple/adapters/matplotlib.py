@@ -104,14 +104,14 @@ class MatplotlibAdapter:
 
             img = Image.open(buf)
             rgb = img.convert("RGB")
-            colors = np.array(rgb, dtype=np.float32) / 255.0
+            colors = np.divide(np.asarray(rgb), np.float32(255.0), dtype=np.float32)
         except ImportError:
             # Fallback without PIL - use matplotlib's internal rendering
             fig.canvas.draw()
             # buffer_rgba is the modern API (tostring_rgb was deprecated)
             buf_rgba = np.asarray(fig.canvas.buffer_rgba())  # type: ignore[attr-defined]
             w, h = fig.canvas.get_width_height()
-            colors = buf_rgba[:, :, :3].astype(np.float32) / 255.0
+            colors = np.divide(buf_rgba[:, :, :3], np.float32(255.0), dtype=np.float32)
 
         from dapple.color import luminance
 
@@ -17,6 +17,8 @@ LUM_R: float = 0.299
 LUM_G: float = 0.587
 LUM_B: float = 0.114
 
+_LUM_VEC = np.array([LUM_R, LUM_G, LUM_B], dtype=np.float32)
+
 
 def luminance(rgb: NDArray[np.floating]) -> NDArray[np.floating]:
     """Compute perceptual luminance from RGB data.
@@ -24,7 +26,8 @@ def luminance(rgb: NDArray[np.floating]) -> NDArray[np.floating]:
     Uses ITU-R BT.601 coefficients: 0.299*R + 0.587*G + 0.114*B.
 
     Args:
-        rgb: Array with shape (..., 3) where the last dimension is RGB.
+        rgb: Array with shape (..., 3) where the last dimension is RGB;
+             further channels such as alpha in (..., 4) are ignored.
              Handles any number of leading dimensions (2D images, 4D blocks, etc.)
 
     Returns:
@@ -37,6 +40,7 @@ def luminance(rgb: NDArray[np.floating]) -> NDArray[np.floating]:
         >>> luminance(rgb)
         array([[0.299]], dtype=float32)
     """
-    return (
-        LUM_R * rgb[..., 0] + LUM_G * rgb[..., 1] + LUM_B * rgb[..., 2]
-    ).astype(np.float32)
+    # One matrix-vector product reads the RGB data once, instead of three
+    # weighted channel slices each allocating an intermediate array. Extra
+    # channels (e.g. alpha) are ignored; a single pixel gives a scalar.
+    return (rgb[..., :3] @ _LUM_VEC).astype(np.float32, copy=False)
@@ -79,7 +79,7 @@ def imgcat(
     """
     try:
         from PIL import Image
-        from dapple.adapters.pil import from_pil, load_image
+        from dapple.adapters.pil import from_pil
     except ImportError:
         raise ImportError(
             "PIL is required for imgcat. Install with: pip install dapple[imgcat]"
@@ -119,7 +119,12 @@ def imgcat(
 
     # Load image
     path = Path(image_path)
-    canvas = load_image(path, width=pixel_width, height=pixel_height)
+    pil_img: Image.Image = Image.open(path)
+
+    # Target size at the requested width, as load_image would scale it
+    orig_w, orig_h = pil_img.size
+    new_w = pixel_width
+    new_h = pixel_height if pixel_height else int(orig_h * new_w / orig_w)
 
     # Correct aspect ratio for character-based renderers
     # Pixel renderers (sixel, kitty) don't need aspect correction
@@ -132,17 +137,17 @@ def imgcat(
     if needs_aspect_correction:
         TERMINAL_CELL_RATIO = 0.5
         cell_aspect = (rend.cell_height / rend.cell_width) * TERMINAL_CELL_RATIO
-        pil_img = canvas.to_pil()
-        w, h = pil_img.size
-        new_h = int(h * cell_aspect)
-        if new_h > 0:
-            pil_img = pil_img.resize((w, new_h), Image.Resampling.LANCZOS)
-            canvas = from_pil(pil_img)
+        if int(new_h * cell_aspect) > 0:
+            new_h = int(new_h * cell_aspect)
+
+    # Resize once, straight to the corrected size, rather than converting
+    # to a canvas and back to PIL for a second resize
+    canvas = from_pil(pil_img, width=new_w, height=new_h)
 
     # Apply preprocessing
     if contrast or dither or invert:
         bitmap = apply_preprocessing(
-            canvas.bitmap.copy(), contrast=contrast, dither=dither, invert=invert
+            canvas.bitmap, contrast=contrast, dither=dither, invert=invert
         )
         canvas = Canvas(bitmap, colors=canvas.colors)
 
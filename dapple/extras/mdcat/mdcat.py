@@ -194,9 +194,9 @@ class DappleImageItem(ImageItem):
             new_h = int(new_h * cell_aspect)
 
             if new_h > 0:
-                pil_img = pil_img.resize((new_w, new_h), Image.Resampling.LANCZOS)
-
-            canvas = from_pil(pil_img)
+                canvas = from_pil(pil_img, width=new_w, height=new_h)
+            else:
+                canvas = from_pil(pil_img)
 
             # Render to string
             buf = StringIO()
@@ -142,8 +142,10 @@ def render_pdf_to_images(
             bitmap = page.render(scale=scale)
             pil_image = bitmap.to_pil()
 
-            img_path = temp_path / f"page_{page_num:04d}.png"
-            pil_image.save(img_path, "PNG")
+            # Pages are only read back by this process, so store them as
+            # uncompressed BMP: PNG's deflate pass costs far more than the I/O
+            img_path = temp_path / f"page_{page_num:04d}.bmp"
+            pil_image.save(img_path, "BMP")
 
             rendered.append(RenderedPage(number=page_num, image_path=img_path))
         except Exception:
@@ -275,7 +277,7 @@ def pdfcat(
             # The kitty protocol's columns parameter handles display scaling
             if renderer == "kitty":
                 # Don't resize - kitty will scale to fit columns
-                pass
+                new_w = new_h = None
             else:
                 # Calculate dimensions for other renderers
                 if renderer == "sixel":
@@ -285,27 +287,25 @@ def pdfcat(
                 else:
                     pixel_width = char_width * rend.cell_width
 
-                # Resize to fit width while maintaining aspect ratio
+                # Fit width while maintaining aspect ratio
                 w, h = pil_img.size
                 aspect = h / w
                 new_w = pixel_width
                 new_h = int(new_w * aspect)
-                pil_img = pil_img.resize((new_w, new_h), Image.Resampling.LANCZOS)
 
                 # Aspect ratio correction for character renderers
                 if renderer not in ("sixel", "kitty"):
                     cell_aspect = (rend.cell_height / rend.cell_width) * TERMINAL_CELL_RATIO
-                    w, h = pil_img.size
-                    new_h = int(h * cell_aspect)
-                    if new_h > 0:
-                        pil_img = pil_img.resize((w, new_h), Image.Resampling.LANCZOS)
+                    if int(new_h * cell_aspect) > 0:
+                        new_h = int(new_h * cell_aspect)
 
-            canvas = from_pil(pil_img)
+            # Resize once, straight to the corrected size
+            canvas = from_pil(pil_img, width=new_w, height=new_h)
 
             # Apply preprocessing
             if contrast or dither or invert:
                 bitmap = apply_preprocessing(
-                    canvas.bitmap.copy(), contrast=contrast, dither=dither, invert=invert
+                    canvas.bitmap, contrast=contrast, dither=dither, invert=invert
                 )
                 canvas = Canvas(bitmap, colors=canvas.colors)
 
@@ -35,6 +35,9 @@ class VidcatOptions:
         max_frames: Maximum number of frames to extract
         frames: Frame selection string (e.g., "1-10", "1,5,10", "-5", "100-")
         every: Extract interval (e.g., "1s", "30s", "1m")
+        hwaccel: ffmpeg hardware decode method ("auto", "cuda", "vaapi", ...),
+            or None to decode in software. Mostly helps with large
+            H.264/HEVC sources; negligible for a handful of 1080p frames.
     """
 
     renderer: str = "auto"
@@ -48,6 +51,14 @@ class VidcatOptions:
     max_frames: int = 10
     frames: str | None = None
     every: str | None = None
+    hwaccel: str | None = "auto"
+
+
+# Terminal control sequences for in-place animation
+_CLEAR_HOME = "\x1b[2J\x1b[H"
+_HOME = "\x1b[H"
+_SYNC_BEGIN = "\x1b[?2026h"
+_SYNC_END = "\x1b[?2026l"
 
 
 def check_ffmpeg() -> bool:
@@ -58,6 +69,11 @@ def check_ffmpeg() -> bool:
 def get_video_info(video_path: Path) -> dict:
     """Get video metadata using ffprobe.
 
+    The frame count comes from the stream's ``nb_frames`` when the container
+    reports it, and is otherwise estimated as ``duration * fps``. The estimate
+    can be off for variable frame rate video; use a generous ``--frames``
+    range when exact frame indices matter.
+
     Returns:
         Dict with 'duration', 'fps', 'width', 'height', 'frame_count'
     """
@@ -104,8 +120,15 @@ def get_video_info(video_path: Path) -> dict:
     width = int(video_stream.get("width", 0))
     height = int(video_stream.get("height", 0))
 
-    # Estimate frame count
-    frame_count = int(duration * fps) if duration and fps else 0
+    # Prefer the container's frame count. Never use -count_frames here:
+    # it makes ffprobe decode the whole file.
+    nb_frames = video_stream.get("nb_frames")
+    try:
+        frame_count = int(nb_frames) if nb_frames not in (None, "N/A") else 0
+    except ValueError:
+        frame_count = 0
+    if not frame_count:
+        frame_count = int(duration * fps) if duration and fps else 0
 
     return {
         "duration": duration,
@@ -179,6 +202,44 @@ def parse_frames(frames_str: str, total_frames: int) -> list[int]:
     return sorted(set(result))
 
 
+def frames_select_expr(frames_str: str) -> str:
+    """Translate a frame selection string into an ffmpeg select expression.
+
+    Unlike parse_frames(), this does not need the video's frame count:
+    open-ended ranges are left for ffmpeg to resolve while decoding.
+
+    Args:
+        frames_str: Frame selection (e.g., "1-10", "1,5,10", "-5", "100-")
+
+    Returns:
+        Expression over the 0-indexed frame number ``n``
+    """
+    terms: list[str] = []
+
+    for part in frames_str.split(","):
+        part = part.strip()
+
+        if "-" in part:
+            if part.startswith("-"):
+                # -5 means first 5 frames
+                terms.append(f"lt(n,{int(part[1:])})")
+            elif part.endswith("-"):
+                # 100- means frame 100 onwards
+                start_idx = max(0, int(part[:-1]) - 1)
+                terms.append(f"gte(n,{start_idx})")
+            else:
+                # 1-10 means frames 1 through 10
+                start_str, end_str = part.split("-")
+                start_idx = max(0, int(start_str) - 1)
+                end_idx = int(end_str) - 1
+                terms.append(f"between(n,{start_idx},{end_idx})")
+        else:
+            # Single frame number
+            terms.append(f"eq(n,{int(part) - 1})")
+
+    return "+".join(terms)
+
+
 def extract_frames(
     video_path: Path,
     options: VidcatOptions,
@@ -194,25 +255,26 @@ def extract_frames(
     Yields:
         Paths to extracted frame images
     """
-    info = get_video_info(video_path)
-
-    # Build ffmpeg command
-    cmd = ["ffmpeg", "-y", "-i", str(video_path)]
+    # Build ffmpeg command (input options must precede -i)
+    cmd = ["ffmpeg", "-y"]
+    if options.hwaccel:
+        cmd.extend(["-hwaccel", options.hwaccel])
+    cmd.extend(["-i", str(video_path)])
 
     if options.every:
-        # Extract at interval
+        # Extract at interval (no need to probe the video)
         interval = parse_interval(options.every)
         cmd.extend(["-vf", f"fps=1/{interval}"])
-    elif options.frames and info["frame_count"] > 0:
-        # Extract specific frames - use select filter
-        frame_list = parse_frames(options.frames, info["frame_count"])
-        if frame_list:
-            select_expr = "+".join(f"eq(n,{f})" for f in frame_list[:options.max_frames])
-            cmd.extend(["-vf", f"select='{select_expr}'", "-vsync", "vfr"])
+    elif options.frames:
+        # Extract specific frames - ffmpeg evaluates the selection itself,
+        # so the total frame count is not needed
+        select_expr = frames_select_expr(options.frames)
+        cmd.extend(["-vf", f"select='{select_expr}'", "-vsync", "vfr"])
     else:
         # Default: extract up to max_frames evenly spaced
-        if info["frame_count"] > options.max_frames:
-            step = info["frame_count"] // options.max_frames
+        frame_count = get_video_info(video_path)["frame_count"]
+        if frame_count > options.max_frames:
+            step = frame_count // options.max_frames
             cmd.extend(["-vf", f"select='not(mod(n,{step}))'", "-vsync", "vfr"])
 
     # Limit total frames
@@ -279,8 +341,10 @@ def vidcat(
     max_frames: int = 10,
     frames: str | None = None,
     every: str | None = None,
+    hwaccel: str | None = "auto",
     dest: TextIO | None = None,
     frame_delay: float = 0.0,
+    in_place: bool = False,
 ) -> None:
     """Extract and render video frames to the terminal.
 
@@ -297,8 +361,11 @@ def vidcat(
         max_frames: Maximum number of frames to extract
         frames: Frame selection string (e.g., "1-10", "1,5,10")
         every: Extract interval (e.g., "1s", "30s", "1m")
+        hwaccel: ffmpeg hardware decode method, or None for software decode
         dest: Output stream (default: stdout)
         frame_delay: Delay between frames in seconds (for animation)
+        in_place: Redraw each frame over the previous one using cursor-home
+            instead of scrolling. Ignored when dest is not a TTY.
 
     Example:
         >>> vidcat("animation.gif")
@@ -325,22 +392,49 @@ def vidcat(
         max_frames=max_frames,
         frames=frames,
         every=every,
+        hwaccel=hwaccel,
     )
 
     output = dest if dest is not None else sys.stdout
+    isatty = getattr(output, "isatty", None)
+    in_place = in_place and isatty is not None and isatty()
+
+    # Compiled renderer kernels pay for importing Numba over many frames
+    from dapple._jit import enable_kernels
+
+    enable_kernels()
 
     with tempfile.TemporaryDirectory() as tmpdir:
         tmppath = Path(tmpdir)
         frame_count = 0
+        # Frames are scheduled against absolute deadlines so render time
+        # does not accumulate as drift over long playbacks.
+        next_deadline = 0.0
 
         for frame_path in extract_frames(path, options, tmppath):
             if frame_count > 0:
-                output.write("\n")
+                if not in_place:
+                    output.write("\n")
                 if frame_delay > 0:
                     output.flush()
-                    time.sleep(frame_delay)
-
-            render_frame(frame_path, options, output)
+                    next_deadline += frame_delay
+                    remaining = next_deadline - time.perf_counter()
+                    if remaining > 0:
+                        time.sleep(remaining)
+                    else:
+                        # Fell behind; resync instead of bursting frames
+                        next_deadline = time.perf_counter()
+            else:
+                next_deadline = time.perf_counter()
+
+            if in_place:
+                # Clear once, then home the cursor and repaint atomically
+                # (synchronized output, mode 2026) to avoid scrolling.
+                output.write(_SYNC_BEGIN + (_HOME if frame_count else _CLEAR_HOME))
+                render_frame(frame_path, options, output)
+                output.write(_SYNC_END)
+            else:
+                render_frame(frame_path, options, output)
             frame_count += 1
 
         if frame_count == 0:
@@ -377,6 +471,7 @@ def to_asciinema(
     no_color: bool = False,
     max_frames: int = 100,
     title: str | None = None,
+    hwaccel: str | None = "auto",
 ) -> None:
     """Export video as asciinema cast file.
 
@@ -397,6 +492,7 @@ def to_asciinema(
         no_color: Disable color output
         max_frames: Maximum frames to extract
         title: Recording title
+        hwaccel: ffmpeg hardware decode method, or None for software decode
 
     Example:
         >>> to_asciinema("animation.gif", "output.cast", fps=15)
@@ -430,10 +526,16 @@ def to_asciinema(
         grayscale=grayscale,
         no_color=no_color,
         max_frames=max_frames,
+        hwaccel=hwaccel,
     )
 
     frame_interval = 1.0 / fps
 
+    # Compiled renderer kernels pay for importing Numba over many frames
+    from dapple._jit import enable_kernels
+
+    enable_kernels()
+
     with tempfile.TemporaryDirectory() as tmpdir:
         tmppath = Path(tmpdir)
 
@@ -443,44 +545,43 @@ def to_asciinema(
         if not frame_paths:
             raise RuntimeError("No frames extracted")
 
-        # Render each frame to string
-        frames_data = []
-        for frame_path in frame_paths:
-            buf = io.StringIO()
+        # Render frames into one reused buffer
+        buf = io.StringIO()
+
+        def render(frame_path: Path) -> str:
+            buf.seek(0)
+            buf.truncate()
             render_frame(frame_path, options, buf)
-            frames_data.append(buf.getvalue())
+            return buf.getvalue()
+
+        first_frame = render(frame_paths[0])
 
         # Calculate actual height needed (count newlines in first frame)
-        if frames_data:
-            actual_height = frames_data[0].count("\n") + 1
-        else:
-            actual_height = term_height
+        actual_height = first_frame.count("\n") + 1
 
         # Write asciicast v2 file
-        with open(out_path, "w", encoding="utf-8") as f:
-            # Header
-            header = {
-                "version": 2,
-                "width": term_width,
-                "height": actual_height + 1,  # +1 for padding
-                "timestamp": int(time.time()),
-                "env": {"TERM": "xterm-256color"},
-            }
-            if title:
-                header["title"] = title
-
+        header = {
+            "version": 2,
+            "width": term_width,
+            "height": actual_height + 1,  # +1 for padding
+            "timestamp": int(time.time()),
+            "env": {"TERM": "xterm-256color"},
+        }
+        if title:
+            header["title"] = title
+
+        # Clear screen escape sequence
+        clear = "\033[2J\033[H"
+
+        # Frames are streamed into the file as they are rendered, so only one
+        # frame is held in memory; the large write buffer keeps the number of
+        # actual writes small.
+        with open(out_path, "w", encoding="utf-8", buffering=1 << 20) as f:
             f.write(json.dumps(header) + "\n")
-
-            # Clear screen escape sequence
-            clear = "\033[2J\033[H"
-
-            # Frame events
-            timestamp = 0.0
-            for frame_data in frames_data:
-                # Clear and draw frame
-                event = [timestamp, "o", clear + frame_data]
+            f.write(json.dumps([0.0, "o", clear + first_frame]) + "\n")
+            for i, frame_path in enumerate(frame_paths[1:], start=1):
+                event = [i * frame_interval, "o", clear + render(frame_path)]
                 f.write(json.dumps(event) + "\n")
-                timestamp += frame_interval
 
     print(f"Created: {out_path}", file=sys.stderr)
     print(f"Play with: asciinema play {out_path}", file=sys.stderr)
@@ -584,6 +685,10 @@ def main() -> None:
         "--max-frames", type=int, default=10,
         help="Maximum frames to extract (default: 10)",
     )
+    parser.add_argument(
+        "--hwaccel", type=str, default="auto", metavar="METHOD",
+        help="ffmpeg hardware decode method, or 'none' to disable (default: auto)",
+    )
     parser.add_argument(
         "--dither", action="store_true",
         help="Apply Floyd-Steinberg dithering",
@@ -612,6 +717,10 @@ def main() -> None:
         "--delay", type=float, default=0.0,
         help="Delay between frames in seconds",
     )
+    parser.add_argument(
+        "--in-place", action="store_true",
+        help="Redraw frames in place instead of scrolling (TTY only)",
+    )
 
     # Asciinema output
     parser.add_argument(
@@ -660,6 +769,8 @@ def main() -> None:
         parser.print_help()
         sys.exit(1)
 
+    hwaccel = None if args.hwaccel.lower() == "none" else args.hwaccel
+
     # Determine output destination
     if args.output:
         dest = open(args.output, "w", encoding="utf-8")
@@ -694,6 +805,7 @@ def main() -> None:
                         no_color=args.no_color,
                         max_frames=args.max_frames,
                         title=args.title,
+                        hwaccel=hwaccel,
                     )
                 except Exception as e:
                     errors.append(f"{video_path}: {e}")
@@ -719,8 +831,10 @@ def main() -> None:
                     max_frames=args.max_frames,
                     frames=args.frames,
                     every=args.every,
+                    hwaccel=hwaccel,
                     dest=dest,
                     frame_delay=args.delay,
+                    in_place=args.in_place,
                 )
             except Exception as e:
                 errors.append(f"{video_path}: {e}")
@@ -8,13 +8,19 @@ dapple renderer — braille, sextants, sixel, kitty, etc.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Sequence
 
 import numpy as np
 
 from dapple.canvas import Canvas
 
-from dapple.extras.vizlib.colors import COLOR_PALETTE
+from dapple.extras.vizlib.colors import COLOR_PALETTE, COLOR_PALETTE_ARR
+
+try:
+    from fast_histogram import histogram1d as _histogram1d
+except ImportError:  # pragma: no cover - depends on environment
+    _histogram1d = None
 
 
 def sparkline(
@@ -23,6 +29,7 @@ def sparkline(
     width: int,
     height: int,
     color: tuple[float, float, float] | None = None,
+    with_colors: bool = True,
 ) -> Canvas:
     """Render a sparkline — a compact line chart without axes.
 
@@ -31,6 +38,8 @@ def sparkline(
         width: Bitmap width in pixels.
         height: Bitmap height in pixels.
         color: RGB color tuple (0-1). Defaults to cyan.
+        with_colors: Build the RGB color layer. Pass False for grayscale
+            renderers to skip allocating it (the Canvas then has no colors).
 
     Returns:
         Canvas with the sparkline rendered.
@@ -38,11 +47,11 @@ def sparkline(
     if len(values) == 0:
         return _empty_canvas(width, height)
 
-    vals = np.array(values, dtype=np.float64)
+    vals = np.asarray(values, dtype=np.float64)
     color = color or COLOR_PALETTE[0]
 
     bitmap = np.zeros((height, width), dtype=np.float32)
-    colors = np.zeros((height, width, 3), dtype=np.float32)
+    colors = np.zeros((height, width, 3), dtype=np.float32) if with_colors else None
 
     v_min, v_max = float(vals.min()), float(vals.max())
     if v_max == v_min:
@@ -54,19 +63,9 @@ def sparkline(
     pixel_rows = ((1 - normalized) * (height - 1)).astype(int)
     pixel_cols = np.linspace(0, width - 1, len(vals)).astype(int)
 
-    # Draw the line with vertical fill between consecutive points
-    for i in range(len(vals)):
-        col = pixel_cols[i]
-        row = np.clip(pixel_rows[i], 0, height - 1)
-        if 0 <= col < width:
-            bitmap[row, col] = 1.0
-            colors[row, col] = color
-
-        # Connect consecutive points vertically
-        if i > 0:
-            prev_row = np.clip(pixel_rows[i - 1], 0, height - 1)
-            prev_col = pixel_cols[i - 1]
-            _draw_line(bitmap, colors, prev_col, prev_row, col, row, color)
+    # Draw the points and connect consecutive ones
+    pixel_rows = np.clip(pixel_rows, 0, height - 1)
+    _draw_polyline(bitmap, colors, pixel_cols, pixel_rows, color)
 
     return Canvas(bitmap, colors=colors)
 
@@ -78,6 +77,7 @@ def line_plot(
     height: int,
     color: tuple[float, float, float] | None = None,
     show_axes: bool = True,
+    with_colors: bool = True,
 ) -> Canvas:
     """Render a line plot with optional axes.
 
@@ -87,6 +87,8 @@ def line_plot(
         height: Bitmap height in pixels.
         color: RGB color tuple (0-1). Defaults to cyan.
         show_axes: Draw a baseline axis at y=0 if in range.
+        with_colors: Build the RGB color layer. Pass False for grayscale
+            renderers to skip allocating it (the Canvas then has no colors).
 
     Returns:
         Canvas with the line plot rendered.
@@ -94,12 +96,12 @@ def line_plot(
     if len(values) == 0:
         return _empty_canvas(width, height)
 
-    vals = np.array(values, dtype=np.float64)
+    vals = np.asarray(values, dtype=np.float64)
     color = color or COLOR_PALETTE[0]
     axis_color = (0.5, 0.5, 0.5)
 
     bitmap = np.zeros((height, width), dtype=np.float32)
-    colors = np.zeros((height, width, 3), dtype=np.float32)
+    colors = np.zeros((height, width, 3), dtype=np.float32) if with_colors else None
 
     v_min, v_max = float(vals.min()), float(vals.max())
     if v_max == v_min:
@@ -109,26 +111,18 @@ def line_plot(
     # Draw baseline axis
     if show_axes and v_min <= 0 <= v_max:
         zero_row = int((1 - (0 - v_min) / (v_max - v_min)) * (height - 1))
-        zero_row = np.clip(zero_row, 0, height - 1)
+        zero_row = min(max(zero_row, 0), height - 1)
         bitmap[zero_row, :] = 0.3
-        colors[zero_row, :] = axis_color
+        if colors is not None:
+            colors[zero_row, :] = axis_color
 
     # Map and draw the line
     normalized = (vals - v_min) / (v_max - v_min)
     pixel_rows = ((1 - normalized) * (height - 1)).astype(int)
     pixel_cols = np.linspace(0, width - 1, len(vals)).astype(int)
 
-    for i in range(len(vals)):
-        col = pixel_cols[i]
-        row = np.clip(pixel_rows[i], 0, height - 1)
-        if 0 <= col < width:
-            bitmap[row, col] = 1.0
-            colors[row, col] = color
-
-        if i > 0:
-            prev_row = np.clip(pixel_rows[i - 1], 0, height - 1)
-            prev_col = pixel_cols[i - 1]
-            _draw_line(bitmap, colors, prev_col, prev_row, col, row, color)
+    pixel_rows = np.clip(pixel_rows, 0, height - 1)
+    _draw_polyline(bitmap, colors, pixel_cols, pixel_rows, color)
 
     return Canvas(bitmap, colors=colors)
 
@@ -141,6 +135,7 @@ def bar_chart(
     height: int,
     horizontal: bool = True,
     color: tuple[float, float, float] | None = None,
+    with_colors: bool = True,
 ) -> Canvas:
     """Render a bar chart.
 
@@ -151,6 +146,8 @@ def bar_chart(
         height: Bitmap height in pixels.
         horizontal: If True, bars go left-to-right. If False, bottom-to-top.
         color: RGB color tuple (0-1). Defaults to cycling palette.
+        with_colors: Build the RGB color layer. Pass False for grayscale
+            renderers to skip allocating it (the Canvas then has no colors).
 
     Returns:
         Canvas with the bar chart rendered.
@@ -159,44 +156,43 @@ def bar_chart(
     if n == 0:
         return _empty_canvas(width, height)
 
-    vals = np.array(values, dtype=np.float64)
+    vals = np.asarray(values, dtype=np.float64)
     v_max = float(np.abs(vals).max())
     if v_max == 0:
         v_max = 1.0
 
     bitmap = np.zeros((height, width), dtype=np.float32)
-    colors = np.zeros((height, width, 3), dtype=np.float32)
+    colors = np.zeros((height, width, 3), dtype=np.float32) if with_colors else None
+
+    # Bar lengths in pixels along the value axis
+    extent = width if horizontal else height
+    lengths = np.maximum(1, (np.abs(vals) / v_max * (extent - 1)).astype(int))
+
+    # Lay bars out across the other axis as bands separated by gaps
+    span = height if horizontal else width
+    band = max(1, span // n)
+    gap = max(1, band // 4)
+    band = max(1, (span - gap * (n - 1)) // n) if n > 1 else span
+    bar_of = _band_index(span, band, gap, n)
 
     if horizontal:
         # Horizontal bars: each bar is a horizontal row band
-        bar_height = max(1, height // n)
-        gap = max(1, bar_height // 4)
-        bar_height = max(1, (height - gap * (n - 1)) // n) if n > 1 else height
-
-        for i, val in enumerate(vals):
-            bar_color = color or COLOR_PALETTE[i % len(COLOR_PALETTE)]
-            y_start = i * (bar_height + gap)
-            y_end = min(y_start + bar_height, height)
-            bar_width = int(abs(val) / v_max * (width - 1))
-            bar_width = max(1, bar_width)
-
-            bitmap[y_start:y_end, 0:bar_width] = 1.0
-            colors[y_start:y_end, 0:bar_width] = bar_color
+        pos = np.arange(width)[None, :]
+        bar = np.broadcast_to(bar_of[:, None], (height, width))
+        filled = (bar >= 0) & (pos < lengths[bar])
     else:
-        # Vertical bars: each bar is a vertical column band
-        bar_width = max(1, width // n)
-        gap = max(1, bar_width // 4)
-        bar_width = max(1, (width - gap * (n - 1)) // n) if n > 1 else width
-
-        for i, val in enumerate(vals):
-            bar_color = color or COLOR_PALETTE[i % len(COLOR_PALETTE)]
-            x_start = i * (bar_width + gap)
-            x_end = min(x_start + bar_width, width)
-            bar_height_px = int(abs(val) / v_max * (height - 1))
-            bar_height_px = max(1, bar_height_px)
-
-            bitmap[height - bar_height_px:height, x_start:x_end] = 1.0
-            colors[height - bar_height_px:height, x_start:x_end] = bar_color
+        # Vertical bars: each bar is a vertical column band, bottom-up
+        pos = np.arange(height)[::-1, None]
+        bar = np.broadcast_to(bar_of[None, :], (height, width))
+        filled = (bar >= 0) & (pos < lengths[bar])
+
+    bitmap[filled] = 1.0
+    if colors is not None:
+        if color is not None:
+            colors[filled] = color
+        else:
+            # Cycle through the palette by bar index
+            colors[filled] = COLOR_PALETTE_ARR[bar[filled] % len(COLOR_PALETTE_ARR)]
 
     return Canvas(bitmap, colors=colors)
 
@@ -208,6 +204,7 @@ def histogram(
     height: int,
     bins: int = 20,
     color: tuple[float, float, float] | None = None,
+    with_colors: bool = True,
 ) -> Canvas:
     """Render a histogram of value distribution.
 
@@ -217,6 +214,8 @@ def histogram(
         height: Bitmap height in pixels.
         bins: Number of histogram bins.
         color: RGB color tuple (0-1). Defaults to cyan.
+        with_colors: Build the RGB color layer. Pass False for grayscale
+            renderers to skip allocating it (the Canvas then has no colors).
 
     Returns:
         Canvas with the histogram rendered.
@@ -224,32 +223,31 @@ def histogram(
     if len(values) == 0:
         return _empty_canvas(width, height)
 
-    vals = np.array(values, dtype=np.float64)
+    vals = np.asarray(values, dtype=np.float64)
     color = color or COLOR_PALETTE[0]
 
-    counts, _ = np.histogram(vals, bins=bins)
+    counts = _bin_counts(vals, bins)
     max_count = float(counts.max())
     if max_count == 0:
         max_count = 1.0
 
     bitmap = np.zeros((height, width), dtype=np.float32)
-    colors = np.zeros((height, width, 3), dtype=np.float32)
+    colors = np.zeros((height, width, 3), dtype=np.float32) if with_colors else None
 
-    bin_width = max(1, width // bins)
+    bar_heights = (counts / max_count * (height - 1)).astype(int)
+    bar_heights = np.where(counts > 0, np.maximum(1, bar_heights), 0)
 
-    for i, count in enumerate(counts):
-        x_start = i * bin_width
-        x_end = min(x_start + bin_width, width)
-        # Leave 1px gap between bins for visual separation
-        if bin_width > 2 and x_end > x_start + 1:
-            x_end -= 1
+    # Leave 1px gap between bins for visual separation
+    bin_width = max(1, width // bins)
+    gap = 1 if bin_width > 2 else 0
+    bin_of = _band_index(width, bin_width - gap, gap, bins)
 
-        bar_height = int(count / max_count * (height - 1))
-        bar_height = max(1, bar_height) if count > 0 else 0
+    col_heights = np.where(bin_of >= 0, bar_heights[bin_of], 0)
+    filled = np.arange(height)[::-1, None] < col_heights[None, :]
 
-        if bar_height > 0:
-            bitmap[height - bar_height:height, x_start:x_end] = 1.0
-            colors[height - bar_height:height, x_start:x_end] = color
+    bitmap[filled] = 1.0
+    if colors is not None:
+        colors[filled] = color
 
     return Canvas(bitmap, colors=colors)
 
@@ -259,6 +257,7 @@ def heatmap(
     *,
     width: int,
     height: int,
+    with_colors: bool = True,
 ) -> Canvas:
     """Render a heatmap from a 2D array of values.
 
@@ -269,11 +268,13 @@ def heatmap(
         values: 2D array of numeric values.
         width: Bitmap width in pixels.
         height: Bitmap height in pixels.
+        with_colors: Build the RGB color layer. Pass False for grayscale
+            renderers to skip allocating it (the Canvas then has no colors).
 
     Returns:
         Canvas with the heatmap rendered.
     """
-    data = np.array(values, dtype=np.float64)
+    data = np.asarray(values, dtype=np.float64)
     if data.ndim == 1:
         data = data.reshape(1, -1)
     if data.size == 0:
@@ -287,30 +288,37 @@ def heatmap(
 
     normalized = (data - v_min) / (v_max - v_min)
 
-    bitmap = np.zeros((height, width), dtype=np.float32)
-    colors = np.zeros((height, width, 3), dtype=np.float32)
-
+    # Upscale cells to pixel blocks; cells past the edge are cropped and
+    # any leftover border stays blank
     cell_h = max(1, height // rows)
     cell_w = max(1, width // cols)
+    block_h = min(rows * cell_h, height)
+    block_w = min(cols * cell_w, width)
 
-    for r in range(rows):
-        for c in range(cols):
-            val = normalized[r, c]
-            y_start = r * cell_h
-            y_end = min(y_start + cell_h, height)
-            x_start = c * cell_w
-            x_end = min(x_start + cell_w, width)
-
-            # Blue (cold) -> White (mid) -> Red (hot)
-            if val < 0.5:
-                t = val * 2
-                rgb = (t, t, 1.0)
-            else:
-                t = (val - 0.5) * 2
-                rgb = (1.0, 1.0 - t, 1.0 - t)
-
-            bitmap[y_start:y_end, x_start:x_end] = max(0.2, val)
-            colors[y_start:y_end, x_start:x_end] = rgb
+    bitmap = np.zeros((height, width), dtype=np.float32)
+    brightness = np.fmax(0.2, normalized)
+    bitmap[:block_h, :block_w] = (
+        brightness.repeat(cell_h, axis=0).repeat(cell_w, axis=1)[:block_h, :block_w]
+    )
+
+    colors = None
+    if with_colors:
+        # Blue (cold) -> White (mid) -> Red (hot), per data cell
+        low = normalized < 0.5
+        t_low = normalized * 2
+        t_high = (normalized - 0.5) * 2
+        rgb = np.stack(
+            [
+                np.where(low, t_low, 1.0),
+                np.where(low, t_low, 1.0 - t_high),
+                np.where(low, 1.0, 1.0 - t_high),
+            ],
+            axis=-1,
+        )
+        colors = np.zeros((height, width, 3), dtype=np.float32)
+        colors[:block_h, :block_w] = (
+            rgb.repeat(cell_h, axis=0).repeat(cell_w, axis=1)[:block_h, :block_w]
+        )
 
     return Canvas(bitmap, colors=colors)
 
@@ -318,39 +326,120 @@ def heatmap(
 # ── Helpers ──────────────────────────────────────────────────────────
 
 
-def _empty_canvas(width: int, height: int) -> Canvas:
-    """Return a blank canvas."""
+@lru_cache(maxsize=32)
+def _zeros(height: int, width: int) -> np.ndarray:
+    """Return a shared read-only zero bitmap of the given size."""
     bitmap = np.zeros((height, width), dtype=np.float32)
-    return Canvas(bitmap)
+    bitmap.flags.writeable = False
+    return bitmap
+
 
+def _empty_canvas(width: int, height: int) -> Canvas:
+    """Return a blank canvas.
 
-def _draw_line(
+    Canvas never writes to its bitmap, so blank canvases of the same size
+    share one read-only buffer.
+    """
+    return Canvas(_zeros(height, width))
+
+
+def _bin_counts(vals: np.ndarray, bins: int) -> np.ndarray:
+    """Count values in equal-width bins spanning their range.
+
+    Equivalent to ``np.histogram(vals, bins=bins)[0]``, but uses the much
+    faster ``fast_histogram`` package when it is installed.
+    """
+    if _histogram1d is not None:
+        lo, hi = float(vals.min()), float(vals.max())
+        if lo < hi and np.isfinite(lo) and np.isfinite(hi):
+            counts = _histogram1d(vals, bins=bins, range=(lo, hi))
+            # histogram1d bins are half-open; np.histogram puts the maximum
+            # in the last bin
+            counts[-1] += np.count_nonzero(vals == hi)
+            return counts
+    return np.histogram(vals, bins=bins)[0]
+
+
+def _band_index(length: int, band: int, gap: int, count: int) -> np.ndarray:
+    """Map positions along an axis to the band covering them.
+
+    Bands of ``band`` pixels are laid out from position 0, each followed
+    by ``gap`` empty pixels, for ``count`` bands.
+
+    Returns:
+        Integer array of shape (length,) with the band index at each
+        position, or -1 for gaps and positions past the last band.
+    """
+    pos = np.arange(length)
+    index = pos // (band + gap)
+    inside = (pos % (band + gap) < band) & (index < count)
+    return np.where(inside, index, -1)
+
+
+def _line_pixels(
+    x0: np.ndarray,
+    y0: np.ndarray,
+    x1: np.ndarray,
+    y1: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Rasterize line segments with Bresenham's algorithm, all at once.
+
+    Segment ``k`` runs from ``(x0[k], y0[k])`` to ``(x1[k], y1[k])``,
+    endpoints included. Rather than stepping pixel by pixel, step ``i``
+    along the major axis uses the closed form of Bresenham's error term,
+    ``minor = (2*i*d_minor + d_major - 1) // (2*d_major)``, which yields
+    the same pixels as the classic integer loop.
+
+    Returns:
+        (xs, ys) integer arrays with the pixels of every segment.
+    """
+    dx = np.abs(x1 - x0)
+    dy = np.abs(y1 - y0)
+    sx = np.where(x0 < x1, 1, -1)
+    sy = np.where(y0 < y1, 1, -1)
+    d_major = np.maximum(dx, dy)
+    d_minor = np.minimum(dx, dy)
+
+    # Expand to one entry per pixel: seg is the segment, i the step index
+    lengths = d_major + 1
+    seg = np.repeat(np.arange(len(lengths)), lengths)
+    i = np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+    d_major = d_major[seg]
+    minor = np.where(
+        d_major > 0,
+        (2 * i * d_minor[seg] + d_major - 1) // np.maximum(2 * d_major, 1),
+        0,
+    )
+    x_major = (dx >= dy)[seg]
+
+    xs = x0[seg] + sx[seg] * np.where(x_major, i, minor)
+    ys = y0[seg] + sy[seg] * np.where(x_major, minor, i)
+    return xs, ys
+
+
+def _draw_polyline(
     bitmap: np.ndarray,
-    colors: np.ndarray,
-    x0: int,
-    y0: int,
-    x1: int,
-    y1: int,
+    colors: np.ndarray | None,
+    cols: np.ndarray,
+    rows: np.ndarray,
     color: tuple[float, float, float],
 ) -> None:
-    """Draw a line between two points using Bresenham's algorithm."""
-    dx = abs(x1 - x0)
-    dy = abs(y1 - y0)
-    sx = 1 if x0 < x1 else -1
-    sy = 1 if y0 < y1 else -1
-    err = dx - dy
-    h, w = bitmap.shape
+    """Draw points and the Bresenham lines connecting consecutive ones."""
+    cols = np.asarray(cols, dtype=np.intp)
+    rows = np.asarray(rows, dtype=np.intp)
+    # A leading zero-length segment plots the first point on its own,
+    # which also covers the single-point case.
+    xs, ys = _line_pixels(
+        np.concatenate([cols[:1], cols[:-1]]),
+        np.concatenate([rows[:1], rows[:-1]]),
+        cols,
+        rows,
+    )
 
-    while True:
-        if 0 <= y0 < h and 0 <= x0 < w:
-            bitmap[y0, x0] = 1.0
-            colors[y0, x0] = color
-        if x0 == x1 and y0 == y1:
-            break
-        e2 = 2 * err
-        if e2 > -dy:
-            err -= dy
-            x0 += sx
-        if e2 < dx:
-            err += dx
-            y0 += sy
+    h, w = bitmap.shape
+    inside = (ys >= 0) & (ys < h) & (xs >= 0) & (xs < w)
+    ys, xs = ys[inside], xs[inside]
+    bitmap[ys, xs] = 1.0
+    if colors is not None:
+        colors[ys, xs] = color
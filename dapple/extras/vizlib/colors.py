@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+import numpy as np
+
 # Named colors (RGB 0-1) — bright, saturated for terminal visibility
 NAMED_COLORS: dict[str, tuple[float, float, float]] = {
     "cyan": (0.0, 0.8, 1.0),
@@ -28,7 +32,16 @@ COLOR_PALETTE: list[tuple[float, float, float]] = [
     NAMED_COLORS["pink"],
 ]
 
+# COLOR_PALETTE as a (P, 3) float32 array, for indexing many bars at once
+COLOR_PALETTE_ARR = np.array(COLOR_PALETTE, dtype=np.float32)
+COLOR_PALETTE_ARR.flags.writeable = False
+
 
+# Byte value -> channel intensity (0-1)
+_BYTE_TO_FLOAT: tuple[float, ...] = tuple(i / 255 for i in range(256))
+
+
+@lru_cache(maxsize=256)
 def parse_color(color_str: str) -> tuple[float, float, float]:
     """Parse a color name or #RRGGBB hex string.
 
@@ -47,10 +60,11 @@ def parse_color(color_str: str) -> tuple[float, float, float]:
             hex_str = "".join(c * 2 for c in hex_str)
         if len(hex_str) != 6:
             raise ValueError(f"Invalid hex color: {color_str}")
-        r = int(hex_str[0:2], 16) / 255
-        g = int(hex_str[2:4], 16) / 255
-        b = int(hex_str[4:6], 16) / 255
-        return (r, g, b)
+        try:
+            r, g, b = bytes.fromhex(hex_str)
+        except ValueError:
+            raise ValueError(f"Invalid hex color: {color_str}") from None
+        return (_BYTE_TO_FLOAT[r], _BYTE_TO_FLOAT[g], _BYTE_TO_FLOAT[b])
 
     color_lower = color_str.lower()
     if color_lower not in NAMED_COLORS:
@@ -59,11 +73,23 @@ def parse_color(color_str: str) -> tuple[float, float, float]:
     return NAMED_COLORS[color_lower]
 
 
+ANSI_RESET = "\033[0m"
+
+
+@lru_cache(maxsize=4096)
+def _ansi_fg_int(r: int, g: int, b: int) -> str:
+    return f"\033[38;2;{r};{g};{b}m"
+
+
 def ansi_fg(r: float, g: float, b: float) -> str:
-    """Return ANSI escape for 24-bit foreground color."""
-    return f"\033[38;2;{int(r*255)};{int(g*255)};{int(b*255)}m"
+    """Return ANSI escape for 24-bit foreground color.
+
+    Escapes are cached per quantized (0-255) color, since a frame
+    typically uses only a few distinct colors.
+    """
+    return _ansi_fg_int(int(r * 255), int(g * 255), int(b * 255))
 
 
 def ansi_reset() -> str:
     """Return ANSI reset escape."""
-    return "\033[0m"
+    return ANSI_RESET
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import shutil
+from functools import lru_cache
 
 from dapple import braille, quadrants, sextants, ascii, sixel, kitty
 from dapple.renderers import Renderer
@@ -17,9 +18,13 @@ RENDERERS: dict[str, Renderer] = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_renderer(name: str) -> Renderer:
     """Get a renderer by name, configured for chart output.
 
+    Renderers are immutable, so the configured instance is built once per
+    name and shared by later calls.
+
     Args:
         name: Renderer name (braille, quadrants, sextants, ascii, sixel, kitty).
 
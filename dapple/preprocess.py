@@ -10,10 +10,17 @@ from typing import TYPE_CHECKING, Literal
 
 import numpy as np
 
+from dapple._jit import njit, use_kernels
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
 
+# Pixels from which compiled error diffusion saves more than importing Numba
+# costs; smaller bitmaps run the kernel as plain Python
+_DITHER_KERNEL_MIN_PIXELS = 1 << 17
+
+
 def auto_contrast(bitmap: NDArray[np.floating]) -> NDArray[np.floating]:
     """Stretch histogram to full 0-1 range.
 
@@ -69,8 +76,18 @@ def floyd_steinberg(
         >>> np.unique(dithered)
         array([0., 1.], dtype=float32)
     """
-    # Work on a copy to avoid modifying input
-    img = bitmap.astype(np.float64).copy()
+    # Work on a contiguous float32 copy to avoid modifying input
+    img = np.array(bitmap, dtype=np.float32, order="C")
+    if use_kernels(img.size, _DITHER_KERNEL_MIN_PIXELS):
+        _floyd_steinberg_inplace(img, np.float32(threshold))
+    else:
+        _floyd_steinberg_inplace.py_func(img, np.float32(threshold))
+    return img
+
+
+@njit(cache=True, boundscheck=False)
+def _floyd_steinberg_inplace(img: NDArray[np.float32], threshold: float) -> None:
+    """Error-diffusion kernel for floyd_steinberg(); compiled when Numba is available."""
     h, w = img.shape
 
     for y in range(h):
@@ -92,8 +109,6 @@ def floyd_steinberg(
                 if x + 1 < w:
                     img[y + 1, x + 1] += error * 1 / 16
 
-    return img.astype(np.float32)
-
 
 def invert(bitmap: NDArray[np.floating]) -> NDArray[np.floating]:
     """Invert bitmap values (0 becomes 1, 1 becomes 0).
@@ -136,9 +151,11 @@ def gamma_correct(
         >>> gamma_correct(img, 2.2)[0, 0]  # Darker
         0.21763764
     """
-    # Clamp to valid range before gamma
-    clamped = np.clip(bitmap, 0.0, 1.0)
-    return np.power(clamped, gamma).astype(np.float32)
+    # Clamp to valid range before gamma, then raise to the power in place
+    # on the float32 result
+    result = np.clip(bitmap, 0.0, 1.0).astype(np.float32, copy=False)
+    np.power(result, np.float32(gamma), out=result)
+    return result
 
 
 def sharpen(
@@ -162,25 +179,23 @@ def sharpen(
         ...                 [0.5, 0.5, 0.5]], dtype=np.float32)
         >>> sharpened = sharpen(img, strength=1.0)
     """
-    # Simple 3x3 Laplacian kernel for edge detection
-    h, w = bitmap.shape
-
     # Pad image with edge values
     padded = np.pad(bitmap, 1, mode="edge")
 
-    # Compute Laplacian (center - average of neighbors)
-    laplacian = (
-        4 * padded[1:-1, 1:-1]
-        - padded[:-2, 1:-1]  # top
-        - padded[2:, 1:-1]  # bottom
-        - padded[1:-1, :-2]  # left
-        - padded[1:-1, 2:]  # right
-    )
+    # Compute 3x3 Laplacian (4 * center - neighbors), accumulating in place
+    # to avoid a temporary per neighbor
+    laplacian = padded[1:-1, 1:-1] * 4.0
+    np.subtract(laplacian, padded[:-2, 1:-1], out=laplacian)  # top
+    np.subtract(laplacian, padded[2:, 1:-1], out=laplacian)  # bottom
+    np.subtract(laplacian, padded[1:-1, :-2], out=laplacian)  # left
+    np.subtract(laplacian, padded[1:-1, 2:], out=laplacian)  # right
 
     # Add scaled Laplacian to original
-    sharpened = bitmap + strength * laplacian
+    laplacian *= strength
+    laplacian += bitmap
+    np.clip(laplacian, 0.0, 1.0, out=laplacian)
 
-    return np.clip(sharpened, 0.0, 1.0).astype(np.float32)
+    return laplacian.astype(np.float32, copy=False)
 
 
 def threshold(
@@ -235,20 +250,17 @@ def resize(
     y_frac = y_coords - y0
     x_frac = x_coords - x0
 
-    # Bilinear interpolation
-    result = np.zeros((new_height, new_width), dtype=np.float32)
-    for y in range(new_height):
-        for x in range(new_width):
-            top_left = bitmap[y0[y], x0[x]]
-            top_right = bitmap[y0[y], x1[x]]
-            bottom_left = bitmap[y1[y], x0[x]]
-            bottom_right = bitmap[y1[y], x1[x]]
+    # Bilinear interpolation: gather all four corners at once by
+    # broadcasting row indices (column vector) against column indices
+    yf = y_frac[:, None]
+    xf = x_frac[None, :]
+    rows0 = y0[:, None]
+    rows1 = y1[:, None]
 
-            top = top_left * (1 - x_frac[x]) + top_right * x_frac[x]
-            bottom = bottom_left * (1 - x_frac[x]) + bottom_right * x_frac[x]
-            result[y, x] = top * (1 - y_frac[y]) + bottom * y_frac[y]
+    top = bitmap[rows0, x0] * (1 - xf) + bitmap[rows0, x1] * xf
+    bottom = bitmap[rows1, x0] * (1 - xf) + bitmap[rows1, x1] * xf
 
-    return result
+    return (top * (1 - yf) + bottom * yf).astype(np.float32)
 
 
 def crop(
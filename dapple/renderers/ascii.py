@@ -8,7 +8,8 @@ terminal character aspect ratio (~2:1 height:width).
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, TextIO
+from functools import lru_cache
+from typing import TYPE_CHECKING, Sequence, TextIO
 
 import numpy as np
 
@@ -23,6 +24,35 @@ CHARSET_BLOCKS = " ░▒▓█"
 CHARSET_SIMPLE = " .oO@"
 
 
+@lru_cache(maxsize=32)
+def _charset_lut(charset: str) -> tuple[NDArray[np.unsignedinteger], str]:
+    """Encode a charset as a code unit lookup table.
+
+    ASCII charsets map to one byte per character; anything else (e.g. the
+    block charset) uses fixed-width UTF-32 so indexing still selects whole
+    characters.
+
+    Returns:
+        Tuple of (lookup table, codec to decode gathered code units with).
+    """
+    if charset.isascii():
+        return np.frombuffer(charset.encode("ascii"), dtype=np.uint8), "ascii"
+    return np.frombuffer(charset.encode("utf-32-le"), dtype="<u4"), "utf-32-le"
+
+
+@lru_cache(maxsize=32)
+def _breakpoint_array(breakpoints: tuple[float, ...]) -> NDArray[np.float64]:
+    """Convert brightness breakpoints to the array np.digitize searches.
+
+    Raises:
+        ValueError: If the breakpoints are not increasing.
+    """
+    edges = np.array(breakpoints, dtype=np.float64)
+    if np.any(np.diff(edges) <= 0):
+        raise ValueError("breakpoints must be strictly increasing")
+    return edges
+
+
 @dataclass(frozen=True)
 class AsciiRenderer:
     """Render bitmap as ASCII characters by brightness.
@@ -34,16 +64,32 @@ class AsciiRenderer:
     Attributes:
         charset: String of characters from dark to bright.
         invert: If True, invert brightness (dark becomes light).
+        breakpoints: Optional brightness thresholds for charsets that are
+            not evenly spaced in perceived density. Must hold
+            ``len(charset) - 1`` increasing values; a cell uses character
+            ``i`` when ``breakpoints[i-1] <= brightness < breakpoints[i]``.
+            None spaces the characters evenly over 0-1. Lists and arrays
+            are stored as a tuple.
 
     Example:
         >>> from dapple import Canvas, ascii
         >>> canvas = Canvas(np.random.rand(24, 40))
         >>> canvas.out(ascii)                       # to stdout
         >>> canvas.out(ascii(charset=" .oO@"))      # simple charset
+        >>> canvas.out(ascii(charset=" .oO@", breakpoints=(0.1, 0.2, 0.5, 0.8)))
     """
 
     charset: str = CHARSET_STANDARD
     invert: bool = False
+    breakpoints: tuple[float, ...] | None = None
+
+    def __post_init__(self) -> None:
+        # Store breakpoints as a hashable tuple, whatever sequence was given,
+        # so the renderer stays hashable and _breakpoint_array can cache them
+        if self.breakpoints is not None:
+            object.__setattr__(
+                self, "breakpoints", tuple(float(b) for b in self.breakpoints)
+            )
 
     @property
     def cell_width(self) -> int:
@@ -59,12 +105,14 @@ class AsciiRenderer:
         self,
         charset: str | None = None,
         invert: bool | None = None,
+        breakpoints: Sequence[float] | NDArray[np.floating] | None = None,
     ) -> AsciiRenderer:
         """Create a new renderer with modified options.
 
         Args:
             charset: New character set (None to keep current)
             invert: New invert setting (None to keep current)
+            breakpoints: New brightness thresholds (None to keep current)
 
         Returns:
             New AsciiRenderer with updated settings.
@@ -72,6 +120,7 @@ class AsciiRenderer:
         return AsciiRenderer(
             charset=charset if charset is not None else self.charset,
             invert=invert if invert is not None else self.invert,
+            breakpoints=breakpoints if breakpoints is not None else self.breakpoints,
         )
 
     def render(
@@ -89,7 +138,8 @@ class AsciiRenderer:
             dest: Stream to write output to.
 
         Raises:
-            ValueError: If bitmap is not 2D.
+            ValueError: If bitmap is not 2D, or charset and breakpoints
+                don't fit together.
         """
         if bitmap.ndim != 2:
             raise ValueError(f"bitmap must be 2D, got shape {bitmap.shape}")
@@ -97,6 +147,12 @@ class AsciiRenderer:
         if len(self.charset) == 0:
             raise ValueError("charset must not be empty")
 
+        if self.breakpoints is not None and len(self.breakpoints) != len(self.charset) - 1:
+            raise ValueError(
+                f"breakpoints must have len(charset) - 1 = {len(self.charset) - 1} "
+                f"values, got {len(self.breakpoints)}"
+            )
+
         h, w = bitmap.shape
         rows = h // 2
         cols = w
@@ -104,26 +160,39 @@ class AsciiRenderer:
         if rows == 0:
             return
 
-        # Average each 2-row vertical strip for aspect ratio correction
-        block_data = bitmap[: rows * 2, :cols].reshape(rows, 2, cols).mean(axis=1)
-
-        if self.invert:
-            block_data = 1.0 - block_data
-
-        # Map brightness to character indices
-        n_chars = len(self.charset)
-        indices = (block_data * (n_chars - 0.001)).astype(int)
-        indices = np.clip(indices, 0, n_chars - 1)
-
-        # Write output
-        first_row = True
-        for y in range(rows):
-            if not first_row:
-                dest.write("\n")
-            first_row = False
-
-            line = "".join(self.charset[idx] for idx in indices[y])
-            dest.write(line)
+        lut, codec = _charset_lut(self.charset)
+        n_chars = len(lut)
+        scale = n_chars - 0.001
+
+        # Average each 2-row vertical strip for aspect ratio correction; the
+        # rest of the mapping works in place on this one buffer. Halving is
+        # exact in floating point, so the mean's divide by two folds into
+        # the brightness scale without changing a single index.
+        dtype = bitmap.dtype if np.issubdtype(bitmap.dtype, np.floating) else np.float64
+        block_data = np.add(bitmap[0 : rows * 2 : 2], bitmap[1 : rows * 2 : 2], dtype=dtype)
+
+        # Map brightness to character indices. Inverting the brightness is
+        # not the same as reversing the charset, since the scale is slightly
+        # below the character count, so it is done before scaling.
+        if self.invert or self.breakpoints is not None:
+            block_data *= 0.5
+            if self.invert:
+                np.subtract(1.0, block_data, out=block_data)
+        if self.breakpoints is not None:
+            indices = np.digitize(block_data, _breakpoint_array(self.breakpoints))
+        else:
+            block_data *= scale if self.invert else 0.5 * scale
+            # Clip before truncating so any charset that fits a byte can use
+            # uint8 indices: an eighth of the index traffic of intp
+            np.clip(block_data, 0, n_chars - 1, out=block_data)
+            indices = block_data.astype(np.uint8 if n_chars <= 256 else np.intp)
+
+        # Gather code units for every cell at once, with a newline column
+        # appended so the whole frame decodes (and writes) in one go
+        out = np.empty((rows, cols + 1), dtype=lut.dtype)
+        np.take(lut, indices, out=out[:, :cols])
+        out[:, cols] = ord("\n")
+        dest.write(out.tobytes().decode(codec)[:-1])
 
 
 # Convenience instance for default usage
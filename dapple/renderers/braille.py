@@ -12,6 +12,8 @@ from typing import TYPE_CHECKING, Literal, TextIO
 
 import numpy as np
 
+from dapple._jit import njit, use_kernels
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
@@ -42,21 +44,32 @@ DOT_MAP = [
 ]
 
 
-def _region_to_braille_code(region: NDArray[np.floating], threshold: float) -> int:
-    """Convert a 2x4 region to a braille codepoint offset.
-
-    Args:
-        region: 4x2 array of brightness values (row-major: 4 rows, 2 cols)
-        threshold: Brightness threshold for dot activation
-
-    Returns:
-        Integer offset from U+2800 (0-255)
-    """
-    code = 0
-    for row, col, bit in DOT_MAP:
-        if region[row, col] > threshold:
-            code |= 1 << bit
-    return code
+@njit(cache=True, boundscheck=False)
+def _braille_codes(padded: NDArray[np.float32], threshold: float, out: NDArray[np.uint16]) -> None:
+    """Fill ``out`` with codepoints for a bitmap padded to whole cells; compiled with Numba."""
+    rows, cols = out.shape
+    for y in range(rows):
+        y0 = y * 4
+        for x in range(cols):
+            x0 = x * 2
+            code = 0x2800
+            if padded[y0, x0] > threshold:
+                code |= 1
+            if padded[y0 + 1, x0] > threshold:
+                code |= 2
+            if padded[y0 + 2, x0] > threshold:
+                code |= 4
+            if padded[y0, x0 + 1] > threshold:
+                code |= 8
+            if padded[y0 + 1, x0 + 1] > threshold:
+                code |= 16
+            if padded[y0 + 2, x0 + 1] > threshold:
+                code |= 32
+            if padded[y0 + 3, x0] > threshold:
+                code |= 64
+            if padded[y0 + 3, x0 + 1] > threshold:
+                code |= 128
+            out[y, x] = code
 
 
 def _grayscale_fg(level: int) -> str:
@@ -87,6 +100,15 @@ def _truecolor_fg(r: int, g: int, b: int) -> str:
     return f"\033[38;2;{r};{g};{b}m"
 
 
+# Lookup tables for building colored output with NumPy gathers instead of
+# per-cell formatting: each cell becomes a few table entries joined at once
+_BRAILLE_CHARS = np.array([chr(0x2800 + i) for i in range(256)], dtype=object)
+_GRAY_ESCAPES = np.array([_grayscale_fg(level) for level in range(24)], dtype=object)
+_RED_ESCAPES = np.array([f"\033[38;2;{i};" for i in range(256)], dtype=object)
+_GREEN_FIELDS = np.array([f"{i};" for i in range(256)], dtype=object)
+_BLUE_FIELDS = np.array([f"{i}m" for i in range(256)], dtype=object)
+
+
 @dataclass(frozen=True)
 class BrailleRenderer:
     """Render bitmap as Unicode braille (2x4 dots per character).
@@ -175,49 +197,83 @@ class BrailleRenderer:
             threshold = max(0.1, min(0.9, float(bitmap.mean())))
 
         h, w = bitmap.shape
-        first_row = True
-
-        for cy in range(0, h, 4):
-            if not first_row:
-                dest.write("\n")
-            first_row = False
-
-            row_parts = []
-            for cx in range(0, w, 2):
-                # Extract 2x4 region, pad with zeros if needed
-                region = np.zeros((4, 2), dtype=np.float32)
-                region_h = min(4, h - cy)
-                region_w = min(2, w - cx)
-                region[:region_h, :region_w] = bitmap[cy : cy + region_h, cx : cx + region_w]
-
-                # Encode to braille codepoint
-                code = _region_to_braille_code(region, threshold)
-                braille_char = chr(0x2800 + code)
-
-                if self.color_mode == "none":
-                    row_parts.append(braille_char)
-                elif self.color_mode == "grayscale":
-                    avg_brightness = region[:region_h, :region_w].mean()
-                    level = int(avg_brightness * 23.999)
-                    row_parts.append(f"{_grayscale_fg(level)}{braille_char}")
-                else:  # truecolor
-                    if colors is not None:
-                        color_region = colors[cy : cy + region_h, cx : cx + region_w]
-                        avg_color = color_region.mean(axis=(0, 1))
-                        r = int(avg_color[0] * 255.999)
-                        g = int(avg_color[1] * 255.999)
-                        b = int(avg_color[2] * 255.999)
-                    else:
-                        avg_brightness = region[:region_h, :region_w].mean()
-                        gray = int(avg_brightness * 255.999)
-                        r = g = b = gray
-                    row_parts.append(f"{_truecolor_fg(r, g, b)}{braille_char}")
-
-            # Add reset at end of row if using color
-            row = "".join(row_parts)
-            if self.color_mode != "none":
-                row += RESET
-            dest.write(row)
+        if h == 0 or w == 0:
+            return
+        rows = -(-h // 4)
+        cols = -(-w // 2)
+
+        # Pad to whole cells with zeros and view as (rows, 4, cols, 2)
+        padded = np.zeros((rows * 4, cols * 2), dtype=np.float32)
+        padded[:h, :w] = bitmap
+        cells = padded.reshape(rows, 4, cols, 2)
+
+        # Encode every cell to its braille codepoint at once: one strided OR
+        # per dot over all cells, or one fused Numba pass once kernels are
+        # enabled, as it never repays importing Numba in a single render.
+        # The codes are UTF-16 code units (braille is all in the BMP), laid
+        # out with a trailing newline column so plain output decodes in one go.
+        lines = np.empty((rows, cols + 1), dtype=np.uint16)
+        lines[:, cols] = ord("\n")
+        codes = lines[:, :cols]
+        if use_kernels(padded.size):
+            _braille_codes(padded, np.float32(threshold), codes)
+        else:
+            lit = padded > threshold
+            codes[...] = 0x2800
+            for row, col, bit in DOT_MAP:
+                codes |= lit[row::4, col::2].astype(np.uint16) << bit
+
+        if self.color_mode == "none":
+            dest.write(lines.astype("<u2", copy=False).tobytes().decode("utf-16-le")[:-1])
+            return
+
+        # Per-cell averages over the real (unpadded) pixels only, in the
+        # input's float dtype (float32 for brightness, whose cells are
+        # float32) so levels truncate exactly as a per-cell mean would.
+        # Brightness is summed in the order NumPy uses for a cell's values:
+        # pairwise for full cells, left to right for the partial edge cells.
+        counts = np.outer(
+            np.minimum(4, h - 4 * np.arange(rows)),
+            np.minimum(2, w - 2 * np.arange(cols)),
+        )
+        pairs = cells.sum(axis=3)
+        totals = (pairs[:, 0] + pairs[:, 1]) + (pairs[:, 2] + pairs[:, 3])
+        if h % 4:
+            totals[-1] = sum(cells[-1, r, :, c] for r in range(4) for c in range(2))
+        if w % 2:
+            totals[:, -1] = sum(cells[:, r, -1, c] for r in range(4) for c in range(2))
+        avg_brightness = np.divide(totals, counts, dtype=np.float32)
+        if self.color_mode == "truecolor" and colors is not None:
+            rgb_dtype = colors.dtype if np.issubdtype(colors.dtype, np.floating) else np.float64
+            padded_rgb = np.zeros((rows * 4, cols * 2, 3), dtype=rgb_dtype)
+            padded_rgb[:h, :w] = colors
+            avg_color = padded_rgb.reshape(rows, 4, cols, 2, 3).sum(axis=(1, 3))
+            np.divide(avg_color, counts[:, :, np.newaxis], out=avg_color, dtype=rgb_dtype)
+
+        chars = _BRAILLE_CHARS[codes - 0x2800]
+        if self.color_mode == "grayscale":
+            levels = np.clip((avg_brightness * 23.999).astype(np.intp), 0, 23)
+            fields = [_GRAY_ESCAPES[levels], chars]
+        else:  # truecolor
+            if colors is not None:
+                rgb = (avg_color * 255.999).astype(np.intp)
+            else:
+                gray = (avg_brightness * 255.999).astype(np.intp)
+                rgb = np.repeat(gray[:, :, np.newaxis], 3, axis=2)
+            np.clip(rgb, 0, 255, out=rgb)
+            fields = [
+                _RED_ESCAPES[rgb[:, :, 0]],
+                _GREEN_FIELDS[rgb[:, :, 1]],
+                _BLUE_FIELDS[rgb[:, :, 2]],
+                chars,
+            ]
+
+        # Interleave the fields per cell, end each row with a reset and
+        # newline, and write the frame as one string
+        pieces = np.empty((rows, cols * len(fields) + 1), dtype=object)
+        pieces[:, :-1] = np.stack(fields, axis=2).reshape(rows, -1)
+        pieces[:, -1] = RESET + "\n"
+        dest.write("".join(pieces.ravel().tolist())[:-1])
 
 
 # Convenience instance for default usage
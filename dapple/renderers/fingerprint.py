@@ -7,7 +7,10 @@ bitmaps and finds the best match for each input region.
 
 from __future__ import annotations
 
+import hashlib
+import os
 from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING, Literal, TextIO
 
 import numpy as np
@@ -32,6 +35,10 @@ GLYPH_SETS = {
     "extended": None,  # Built dynamically
 }
 
+# Rendered glyph stacks are saved here so PIL only rasterizes each
+# (glyph set, cell size, font) combination once per machine
+_GLYPH_CACHE_DIR = Path.home() / ".cache" / "dapple" / "glyphs"
+
 # Build extended set
 GLYPH_SETS["extended"] = (
     (GLYPH_SETS["basic"] or "") + (GLYPH_SETS["blocks"] or "") + (GLYPH_SETS["braille"] or "")
@@ -43,8 +50,8 @@ def _render_glyph_bitmap(
     width: int,
     height: int,
     font_path: str | None = None,
-) -> NDArray[np.floating]:
-    """Render a single character to a grayscale bitmap.
+) -> NDArray[np.uint8]:
+    """Render a single character to an 8-bit ink bitmap.
 
     Args:
         char: Single character to render.
@@ -53,7 +60,7 @@ def _render_glyph_bitmap(
         font_path: Optional path to TTF/OTF font file.
 
     Returns:
-        2D numpy array of shape (height, width) with values 0.0-1.0.
+        2D uint8 array of shape (height, width); 0 is background, 255 full ink.
 
     Raises:
         ImportError: If PIL is not available.
@@ -99,9 +106,8 @@ def _render_glyph_bitmap(
     # Draw character in black on white background
     draw.text((x, y), char, font=font, fill=0)
 
-    # Convert to numpy array and normalize to 0-1 (invert so black=1, white=0)
-    arr = np.array(img, dtype=np.float32) / 255.0
-    return 1.0 - arr  # Invert: ink (dark) becomes high value
+    # Invert so ink (black) is high; PIL's L mode is already 8-bit, keep it
+    return 255 - np.asarray(img, dtype=np.uint8)
 
 
 class GlyphCache:
@@ -118,13 +124,16 @@ class GlyphCache:
         self.cell_width = cell_width
         self.cell_height = cell_height
         self.font_path = font_path
-        self._cache: dict[str, NDArray[np.floating]] | None = None
+        self._loaded = False
         self._glyphs: str | None = None
+        self._level_stack: NDArray[np.uint8] | None = None
         self._bitmap_stack: NDArray[np.floating] | None = None
+        self._squared_norms: NDArray[np.floating] | None = None
+        self._codepoints: NDArray[np.uint32] | None = None
 
     def _ensure_loaded(self) -> None:
         """Load glyph bitmaps on first access."""
-        if self._cache is not None:
+        if self._loaded:
             return
 
         glyphs = GLYPH_SETS.get(self.glyph_set)
@@ -132,25 +141,106 @@ class GlyphCache:
             raise ValueError(f"Unknown glyph set: {self.glyph_set}")
 
         self._glyphs = glyphs
-        self._cache = {}
+        self._loaded = True
+
+        # chars lists the glyphs that made it into the stack, one per row
+        cache_path = self._disk_cache_path(glyphs)
+        loaded = self._load_from_disk(cache_path)
+        rendered = loaded is None
+        if loaded is not None:
+            chars, levels = loaded
+        else:
+            # Pre-render all glyphs
+            kept: list[str] = []
+            bitmaps = []
+            # dict.fromkeys drops repeats: sets can overlap (" " is in both
+            # basic and blocks), and a repeat would misalign chars and rows
+            for char in dict.fromkeys(glyphs):
+                try:
+                    bitmap = _render_glyph_bitmap(
+                        char, self.cell_width, self.cell_height, self.font_path
+                    )
+                except Exception:
+                    # Skip glyphs that fail to render
+                    continue
+                kept.append(char)
+                bitmaps.append(bitmap.ravel())
+            if not bitmaps:
+                return
+            chars = "".join(kept)
+            levels = np.array(bitmaps, dtype=np.uint8)
+
+        # Glyphs that rasterize identically (e.g. different whitespace
+        # characters) can never beat one another; keep only the first
+        _, first = np.unique(levels, axis=0, return_index=True)
+        if len(first) < len(levels):
+            keep = np.sort(first)
+            chars = "".join(chars[i] for i in keep)
+            levels = levels[keep]
+        if rendered:
+            self._save_to_disk(cache_path, chars, levels)
 
-        # Pre-render all glyphs
-        bitmaps = []
-        for char in glyphs:
+        # Stack all bitmaps for vectorized comparison
+        self._glyphs = chars
+        self._level_stack = levels
+        self._bitmap_stack = self._level_stack.astype(np.float32) / np.float32(255)
+        self._squared_norms = np.einsum("gp,gp->g", self._bitmap_stack, self._bitmap_stack)
+        self._codepoints = np.frombuffer(chars.encode("utf-32-le"), dtype="<u4")
+
+    def _disk_cache_path(self, glyphs: str) -> Path:
+        """Path of the on-disk stack for this glyph set, cell size, and font."""
+        try:
+            from PIL import __version__ as pil_version
+        except ImportError:
+            pil_version = ""
+        font_mtime = 0
+        if self.font_path:
             try:
-                bitmap = _render_glyph_bitmap(
-                    char, self.cell_width, self.cell_height, self.font_path
-                )
-                self._cache[char] = bitmap
-                bitmaps.append(bitmap.flatten())
-            except Exception:
-                # Skip glyphs that fail to render
-                continue
+                font_mtime = os.stat(self.font_path).st_mtime_ns
+            except OSError:
+                pass
+        key = "|".join(
+            [
+                glyphs,
+                str(self.cell_width),
+                str(self.cell_height),
+                str(self.font_path),
+                str(font_mtime),
+                pil_version,
+            ]
+        )
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return _GLYPH_CACHE_DIR / f"{digest}.npz"
 
-        # Stack all bitmaps for vectorized comparison
-        if bitmaps:
-            self._bitmap_stack = np.array(bitmaps, dtype=np.float32)
-            self._glyphs = "".join(self._cache.keys())
+    def _load_from_disk(self, path: Path) -> tuple[str, NDArray[np.uint8]] | None:
+        """Load a saved (glyphs, level stack) pair; None on a miss."""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                glyphs = str(data["glyphs"])
+                levels = data["levels"]
+        except Exception:
+            # Missing, empty or truncated files (EOFError, BadZipFile, ...)
+            # are all misses; the stack is rendered and the file rewritten
+            return None
+        if levels.dtype != np.uint8 or levels.shape != (
+            len(glyphs),
+            self.cell_width * self.cell_height,
+        ):
+            return None
+        return glyphs, levels
+
+    def _save_to_disk(self, path: Path, glyphs: str, levels: NDArray[np.uint8]) -> None:
+        """Save the glyph stack; failures (e.g. read-only home) are ignored."""
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            np.savez(tmp, glyphs=np.array(glyphs), levels=levels)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
 
     @property
     def glyphs(self) -> str:
@@ -166,6 +256,38 @@ class GlyphCache:
             raise RuntimeError("No glyphs were successfully rendered")
         return self._bitmap_stack
 
+    @property
+    def level_stack(self) -> NDArray[np.uint8]:
+        """Get stacked 8-bit glyph bitmaps (N, cell_width*cell_height)."""
+        self._ensure_loaded()
+        if self._level_stack is None:
+            raise RuntimeError("No glyphs were successfully rendered")
+        return self._level_stack
+
+    @property
+    def squared_norms(self) -> NDArray[np.floating]:
+        """Get the squared L2 norm of each glyph bitmap (N,)."""
+        self._ensure_loaded()
+        if self._squared_norms is None:
+            raise RuntimeError("No glyphs were successfully rendered")
+        return self._squared_norms
+
+    @property
+    def codepoints(self) -> NDArray[np.uint32]:
+        """Get the glyphs as UTF-32 code units (N,), for gathering output."""
+        self._ensure_loaded()
+        if self._codepoints is None:
+            raise RuntimeError("No glyphs were successfully rendered")
+        return self._codepoints
+
+
+# Working-set budget per tile of regions in FingerprintRenderer.render(),
+# sized to stay resident in a typical L2 cache
+_TILE_BYTES = 1 << 18
+
+# Glyphs compared per pass of the MAE metric (no GEMM form, so the glyph
+# axis is blocked as well)
+_MAE_GLYPH_BLOCK = 64
 
 # Global cache for glyph bitmaps (keyed by (glyph_set, cell_width, cell_height))
 _glyph_caches: dict[tuple[str, int, int, str | None], GlyphCache] = {}
@@ -293,34 +415,61 @@ class FingerprintRenderer:
             .reshape(rows * cols, self.cell_height * self.cell_width)
         )
 
-        # Compute distances from each region to all glyphs
+        # Match regions to glyphs a tile of regions at a time, so the
+        # per-tile temporaries stay cache-sized and the full (R, G) distance
+        # matrix is never built
         # regions: (R, P) where R = rows*cols, P = pixels per cell
         # glyph_bitmaps: (G, P) where G = number of glyphs
-        # distances: (R, G)
+        n_regions, n_pixels = regions.shape
+        n_glyphs = glyph_bitmaps.shape[0]
+        best_indices = np.empty(n_regions, dtype=np.intp)
+
         if self.metric == "mse":
-            # Vectorized MSE: ||region - glyph||^2 / P
-            # Expand dims for broadcasting
-            diff = regions[:, np.newaxis, :] - glyph_bitmaps[np.newaxis, :, :]
-            distances = (diff ** 2).mean(axis=2)
+            # ||r - g||^2 = ||r||^2 - 2 r.g + ||g||^2, so the only (R, G) work
+            # is a matrix product instead of an (R, G, P) broadcast. The
+            # 1/P factor and ||r||^2 are constant per region and don't change
+            # the argmin, so they are dropped. Stay in float32 so BLAS runs
+            # sgemm even for float64 input.
+            regions = regions.astype(np.float32, copy=False)
+            glyph_sq = cache.squared_norms
+            tile = max(1, _TILE_BYTES // (4 * max(n_pixels, n_glyphs)))
+            cross = np.empty((min(tile, n_regions), n_glyphs), dtype=np.float32)
+            for r0 in range(0, n_regions, tile):
+                r1 = min(r0 + tile, n_regions)
+                dist = cross[: r1 - r0]
+                np.matmul(regions[r0:r1], glyph_bitmaps.T, out=dist)
+                dist *= -2.0
+                dist += glyph_sq
+                dist.argmin(axis=1, out=best_indices[r0:r1])
         else:  # mae
-            diff = regions[:, np.newaxis, :] - glyph_bitmaps[np.newaxis, :, :]
-            distances = np.abs(diff).mean(axis=2)
-
-        # Find best glyph for each region
-        best_indices = distances.argmin(axis=1)
-
-        # Write output
-        first_row = True
-        for y in range(rows):
-            if not first_row:
-                dest.write("\n")
-            first_row = False
-
-            row_chars = []
-            for x in range(cols):
-                idx = y * cols + x
-                row_chars.append(glyphs[best_indices[idx]])
-            dest.write("".join(row_chars))
+            # Sum of absolute differences on 8-bit levels: glyphs are 8-bit
+            # rasters anyway, and int16 halves the broadcast temporary. MAE
+            # has no matrix-product form, so the (tile, G, P) difference is
+            # also split into blocks of glyphs, each written into one
+            # reused buffer.
+            levels = np.rint(np.clip(regions, 0.0, 1.0) * 255).astype(np.int16)
+            level_stack = cache.level_stack
+            block = min(_MAE_GLYPH_BLOCK, n_glyphs)
+            tile = min(n_regions, max(1, _TILE_BYTES // (2 * block * n_pixels)))
+            buf = np.empty((tile, block, n_pixels), dtype=np.int16)
+            dist = np.empty((tile, n_glyphs), dtype=np.int32)
+            for r0 in range(0, n_regions, tile):
+                r1 = min(r0 + tile, n_regions)
+                tile_levels = levels[r0:r1, np.newaxis, :]
+                for g0 in range(0, n_glyphs, block):
+                    g1 = min(g0 + block, n_glyphs)
+                    diff = buf[: r1 - r0, : g1 - g0]
+                    np.subtract(tile_levels, level_stack[np.newaxis, g0:g1], out=diff)
+                    np.abs(diff, out=diff)
+                    diff.sum(axis=2, out=dist[: r1 - r0, g0:g1])
+                dist[: r1 - r0].argmin(axis=1, out=best_indices[r0:r1])
+
+        # Gather the chosen glyphs' code units with a newline column
+        # appended, and decode the whole frame in one go
+        out = np.empty((rows, cols + 1), dtype="<u4")
+        np.take(cache.codepoints, best_indices.reshape(rows, cols), out=out[:, :cols])
+        out[:, cols] = ord("\n")
+        dest.write(out.tobytes().decode("utf-32-le")[:-1])
 
 
 # Convenience instance for default usage
@@ -21,10 +21,15 @@ import base64
 import io
 import zlib
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Literal, TextIO
+from typing import TYPE_CHECKING, Any, Literal, TextIO
 
 import numpy as np
 
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:  # pragma: no cover - depends on environment
+    _b64encode = base64.b64encode
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
@@ -35,19 +40,103 @@ APC_END = "\033\\"  # ESC \
 # Maximum chunk size for base64 data (4096 is commonly used)
 MAX_CHUNK_SIZE = 4096
 
+# Chunks encoded and written per dest.write() call, bounding the base64
+# text held in memory to about 256 KB regardless of image size
+_CHUNKS_PER_WRITE = 64
+
+# Filtered PNG scanline bytes compressed per call, so the minimal encoder
+# never holds a framed copy of the whole image
+_PNG_BLOCK_BYTES = 1 << 18
+
+# zlib-style compression level (0-9) used for PNG and compressed raw data
+# when the renderer's deflate_level is None
+DEFAULT_DEFLATE_LEVEL = 6
+
+# Level for compressed raw data written straight to a terminal, where the
+# link is local and encoding time is what the user waits for
+INTERACTIVE_DEFLATE_LEVEL = 1
+
+
+def _deflate_level(level: int | None) -> int:
+    """Clamp a zlib level to 0-9; None means DEFAULT_DEFLATE_LEVEL."""
+    if level is None:
+        level = DEFAULT_DEFLATE_LEVEL
+    return min(9, max(0, level))
+
+
+def _deflate(data: bytes | memoryview, level: int | None = None) -> bytes:
+    """Compress data into a zlib stream, using ISA-L when installed.
+
+    python-isal (``pip install dapple[fast]``) produces standard zlib
+    streams roughly ten times faster than stock zlib, at a slightly lower
+    ratio. Its levels run 0-3, so the zlib level is mapped onto that range.
+
+    Args:
+        data: Bytes (or any contiguous buffer) to compress.
+        level: zlib level 0-9 (None: see ``_deflate_level``).
+
+    Returns:
+        zlib-format compressed bytes.
+    """
+    level = _deflate_level(level)
+    try:
+        from isal import isal_zlib
+    except ImportError:
+        return zlib.compress(data, level=level)
+    return isal_zlib.compress(data, (level + 2) // 3)
+
+
+def _compressor(level: int | None = None) -> Any:
+    """Streaming counterpart of ``_deflate``: a ``compressobj`` for the level.
+
+    Feeding it data piecewise and calling ``flush()`` yields the same kind
+    of zlib stream ``_deflate`` produces for the whole input at once.
+    """
+    level = _deflate_level(level)
+    try:
+        from isal import isal_zlib
+    except ImportError:
+        return zlib.compressobj(level)
+    return isal_zlib.compressobj((level + 2) // 3)
+
+
+def _to_uint8(values: NDArray[np.floating] | NDArray[np.uint8]) -> NDArray[np.uint8]:
+    """Quantize 0.0-1.0 values to 0-255 bytes; uint8 input passes through.
+
+    Values are scaled and truncated (as ``int(v * 255)`` would) in a single
+    float buffer that is clipped in place, so out-of-range input saturates
+    instead of wrapping around.
+    """
+    if values.dtype == np.uint8:
+        return values
+    scaled = np.multiply(values, 255, dtype=np.result_type(values.dtype, np.float32))
+    np.clip(scaled, 0, 255, out=scaled)
+    return scaled.astype(np.uint8)
+
+
+def _byte_view(pixels: NDArray[np.uint8]) -> memoryview:
+    """Flat byte view of a pixel array, copying only if it is not contiguous.
+
+    The deflate and base64 encoders read any buffer, so the raw formats hand
+    them the pixel array itself instead of a ``tobytes()`` copy of it.
+    """
+    return memoryview(np.ascontiguousarray(pixels).reshape(-1))
+
 
 def _make_png_minimal(
     bitmap: NDArray[np.floating],
     colors: NDArray[np.floating] | None = None,
+    level: int | None = None,
 ) -> bytes:
     """Create a minimal PNG without external dependencies.
 
-    Uses raw DEFLATE compression (zlib). This is a minimal implementation
-    that creates valid PNG files without PIL.
+    Uses DEFLATE compression (zlib, or ISA-L if installed). This is a
+    minimal implementation that creates valid PNG files without PIL.
 
     Args:
-        bitmap: 2D array (H, W) with values 0.0-1.0
-        colors: Optional 3D array (H, W, 3) with RGB values 0.0-1.0
+        bitmap: 2D array (H, W) with values 0.0-1.0 (or uint8 0-255)
+        colors: Optional 3D array (H, W, 3) with RGB values 0.0-1.0 (or uint8)
+        level: zlib level 0-9 for the image data (None: see ``_deflate_level``)
 
     Returns:
         PNG file bytes
@@ -56,23 +145,13 @@ def _make_png_minimal(
 
     if colors is not None:
         # RGB mode
-        rgb = (colors * 255).astype(np.uint8)
-        # PNG requires filter byte at start of each row
-        raw = bytearray()
-        for y in range(h):
-            raw.append(0)  # Filter type: None
-            raw.extend(rgb[y].tobytes())
+        pixels = _to_uint8(colors).reshape(h, w * 3)
         color_type = 2  # RGB
-        bit_depth = 8
     else:
         # Grayscale mode
-        gray = (bitmap * 255).astype(np.uint8)
-        raw = bytearray()
-        for y in range(h):
-            raw.append(0)  # Filter type: None
-            raw.extend(gray[y].tobytes())
+        pixels = _to_uint8(bitmap)
         color_type = 0  # Grayscale
-        bit_depth = 8
+    bit_depth = 8
 
     # PNG signature
     signature = b"\x89PNG\r\n\x1a\n"
@@ -92,8 +171,21 @@ def _make_png_minimal(
     )
     ihdr = make_chunk(b"IHDR", ihdr_data)
 
-    # IDAT chunk (compressed image data)
-    compressed = zlib.compress(bytes(raw), level=6)
+    # IDAT chunk (compressed image data). PNG requires a filter byte at the
+    # start of each row (filter type: None); rows are framed into a reused
+    # block buffer with a leading zero column and streamed to the
+    # compressor, so peak memory is the output plus one block
+    stride = pixels.shape[1] + 1
+    block_rows = max(1, _PNG_BLOCK_BYTES // stride)
+    raw = np.zeros((min(h, block_rows), stride), dtype=np.uint8)
+    compressor = _compressor(level)
+    parts = []
+    for start in range(0, h, block_rows):
+        block = pixels[start : start + block_rows]
+        raw[: len(block), 1:] = block
+        parts.append(compressor.compress(raw[: len(block)]))
+    parts.append(compressor.flush())
+    compressed = b"".join(parts)
     idat = make_chunk(b"IDAT", compressed)
 
     # IEND chunk (image end)
@@ -105,10 +197,21 @@ def _make_png_minimal(
 def _try_pil_png(
     bitmap: NDArray[np.floating],
     colors: NDArray[np.floating] | None = None,
+    level: int | None = None,
+    optimize: bool = False,
 ) -> bytes | None:
     """Try to create PNG using PIL if available.
 
     PIL produces smaller/better compressed PNGs than our minimal implementation.
+    Accepts the same float or uint8 inputs as _make_png_minimal().
+
+    Args:
+        bitmap: 2D array (H, W) with values 0.0-1.0 (or uint8 0-255)
+        colors: Optional 3D array (H, W, 3) with RGB values 0.0-1.0 (or uint8)
+        level: zlib level 0-9 (None: see ``_deflate_level``)
+        optimize: Let PIL search for the smallest encoding. This is about
+            a third slower for a few percent smaller files, and overrides
+            ``level``.
 
     Returns:
         PNG bytes or None if PIL not available.
@@ -121,14 +224,12 @@ def _try_pil_png(
     h, w = bitmap.shape
 
     if colors is not None:
-        rgb = (colors * 255).astype(np.uint8)
-        img = Image.fromarray(rgb)
+        img = Image.fromarray(_to_uint8(colors))
     else:
-        gray = (bitmap * 255).astype(np.uint8)
-        img = Image.fromarray(gray)
+        img = Image.fromarray(_to_uint8(bitmap))
 
     buf = io.BytesIO()
-    img.save(buf, format="PNG", optimize=True)
+    img.save(buf, format="PNG", compress_level=_deflate_level(level), optimize=optimize)
     return buf.getvalue()
 
 
@@ -144,6 +245,9 @@ class KittyRenderer:
         compression: Use zlib compression for raw formats (default True).
         columns: Display width in terminal columns (None = native pixel size).
         rows: Display height in terminal rows (None = native pixel size).
+        deflate_level: zlib level 0-9 for PNG and compressed raw data. None
+            uses level 1 for raw data written to a terminal and
+            DEFAULT_DEFLATE_LEVEL (6) otherwise.
 
     Example:
         >>> from dapple import Canvas, kitty
@@ -156,6 +260,7 @@ class KittyRenderer:
     compression: bool = True
     columns: int | None = None
     rows: int | None = None
+    deflate_level: int | None = None
 
     @property
     def cell_width(self) -> int:
@@ -173,6 +278,7 @@ class KittyRenderer:
         compression: bool | None = None,
         columns: int | None = None,
         rows: int | None = None,
+        deflate_level: int | None = None,
     ) -> KittyRenderer:
         """Create a new renderer with modified options.
 
@@ -181,6 +287,7 @@ class KittyRenderer:
             compression: New compression setting (None to keep current)
             columns: Display width in terminal columns (None to keep current)
             rows: Display height in terminal rows (None to keep current)
+            deflate_level: zlib level 0-9 (None to keep current)
 
         Returns:
             New KittyRenderer with updated settings.
@@ -190,6 +297,7 @@ class KittyRenderer:
             compression=compression if compression is not None else self.compression,
             columns=columns if columns is not None else self.columns,
             rows=rows if rows is not None else self.rows,
+            deflate_level=deflate_level if deflate_level is not None else self.deflate_level,
         )
 
     def render(
@@ -222,42 +330,50 @@ class KittyRenderer:
 
         h, w = bitmap.shape
 
+        # Quantize once; both the PNG encoders and the raw path take bytes
+        if colors is not None:
+            rgb = _to_uint8(colors)
+            gray = None
+        else:
+            rgb = None
+            gray = _to_uint8(bitmap)
+
         if self.format == "png":
             # Try PIL first for better compression
-            data = _try_pil_png(bitmap, colors)
+            pixels = gray if gray is not None else bitmap
+            data = _try_pil_png(pixels, rgb, self.deflate_level)
             if data is None:
-                data = _make_png_minimal(bitmap, colors)
+                data = _make_png_minimal(pixels, rgb, self.deflate_level)
             fmt_code = 100  # PNG format
             params = f"a=T,f={fmt_code}"
         else:
             # Raw RGB or RGBA
-            if colors is not None:
-                rgb = (colors * 255).astype(np.uint8)
-                if self.format == "rgba":
-                    # Add alpha channel (fully opaque)
-                    alpha = np.full((h, w, 1), 255, dtype=np.uint8)
-                    rgba = np.concatenate([rgb, alpha], axis=2)
-                    data = rgba.tobytes()
-                    fmt_code = 32  # RGBA
-                else:
-                    data = rgb.tobytes()
-                    fmt_code = 24  # RGB
+            if self.format == "rgba":
+                # Fill color channels and a fully opaque alpha in one buffer
+                rgba = np.empty((h, w, 4), dtype=np.uint8)
+                rgba[:, :, :3] = rgb if rgb is not None else gray[:, :, np.newaxis]
+                rgba[:, :, 3] = 255
+                data = _byte_view(rgba)
+                fmt_code = 32  # RGBA
+            elif rgb is not None:
+                data = _byte_view(rgb)
+                fmt_code = 24  # RGB
             else:
-                # Grayscale to RGB
-                gray = (bitmap * 255).astype(np.uint8)
-                rgb = np.stack([gray, gray, gray], axis=2)
-                if self.format == "rgba":
-                    alpha = np.full((h, w, 1), 255, dtype=np.uint8)
-                    rgba = np.concatenate([rgb, alpha], axis=2)
-                    data = rgba.tobytes()
-                    fmt_code = 32
-                else:
-                    data = rgb.tobytes()
-                    fmt_code = 24
+                # Grayscale to RGB: one allocation, broadcast into each channel
+                rgb = np.empty((h, w, 3), dtype=np.uint8)
+                rgb[...] = gray[:, :, np.newaxis]
+                data = _byte_view(rgb)
+                fmt_code = 24
 
             # Optionally compress raw data
             if self.compression:
-                data = zlib.compress(data, level=6)
+                level = self.deflate_level
+                if level is None:
+                    # Live terminal output: the link is local, so favour speed
+                    isatty = getattr(dest, "isatty", None)
+                    if isatty is not None and isatty():
+                        level = INTERACTIVE_DEFLATE_LEVEL
+                data = _deflate(data, level)
                 params = f"a=T,f={fmt_code},o=z,s={w},v={h}"
             else:
                 params = f"a=T,f={fmt_code},s={w},v={h}"
@@ -268,26 +384,33 @@ class KittyRenderer:
         if self.rows is not None:
             params += f",r={self.rows}"
 
-        # Encode as base64
-        b64_data = base64.b64encode(data).decode("ascii")
-
-        # Write escape sequence, chunking if necessary
+        # Encode as base64 and write the escape sequence in chunks. Every
+        # 3 input bytes become 4 base64 chars, so encoding the data a few
+        # dozen chunks' worth of bytes at a time yields whole chunks with
+        # padding only at the very end, without building the full base64
+        # string at once.
+        chunk_bytes = MAX_CHUNK_SIZE // 4 * 3
+        batch_bytes = chunk_bytes * _CHUNKS_PER_WRITE
+        view = memoryview(data)
         first_chunk = True
-        offset = 0
-        while offset < len(b64_data):
-            chunk = b64_data[offset : offset + MAX_CHUNK_SIZE]
-            offset += MAX_CHUNK_SIZE
-
-            # m=1 if more chunks follow, m=0 for last chunk
-            more = 1 if offset < len(b64_data) else 0
-
-            if first_chunk:
-                # First chunk includes all parameters
-                dest.write(f"{APC_START}{params},m={more};{chunk}{APC_END}")
-                first_chunk = False
-            else:
-                # Continuation chunk - only m parameter needed
-                dest.write(f"{APC_START}m={more};{chunk}{APC_END}")
+        for start in range(0, len(data), batch_bytes):
+            b64_data = _b64encode(view[start : start + batch_bytes]).decode("ascii")
+            last_batch = start + batch_bytes >= len(data)
+            frames = []
+            for offset in range(0, len(b64_data), MAX_CHUNK_SIZE):
+                chunk = b64_data[offset : offset + MAX_CHUNK_SIZE]
+
+                # m=1 if more chunks follow, m=0 for last chunk
+                more = 0 if last_batch and offset + MAX_CHUNK_SIZE >= len(b64_data) else 1
+
+                if first_chunk:
+                    # First chunk includes all parameters
+                    frames.append(f"{APC_START}{params},m={more};{chunk}{APC_END}")
+                    first_chunk = False
+                else:
+                    # Continuation chunk - only m parameter needed
+                    frames.append(f"{APC_START}m={more};{chunk}{APC_END}")
+            dest.write("".join(frames))
 
 
 # Convenience instance for default usage
@@ -12,6 +12,8 @@ from typing import TYPE_CHECKING, TextIO
 
 import numpy as np
 
+from dapple._jit import njit, use_kernels
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
@@ -28,6 +30,8 @@ _UNIFORM_THRESHOLD = 0.001  # Threshold for treating a block as uniform color
 # ITU-R BT.601 luminance coefficients
 from dapple.color import LUM_R as _LUM_R, LUM_G as _LUM_G, LUM_B as _LUM_B
 
+_LUM_VEC = np.array([_LUM_R, _LUM_G, _LUM_B])
+
 # Quadrant block characters indexed by 4-bit pattern.
 # Bit positions: TL=8, TR=4, BL=2, BR=1
 QUADRANT_CHARS = [
@@ -49,46 +53,215 @@ QUADRANT_CHARS = [
     "█",  # 0b1111 - full
 ]
 
-# Bit weights for pattern calculation: TL, TR, BL, BR
-_BITS = np.array([8, 4, 2, 1], dtype=np.uint8)
+# UTF-8 encodings of QUADRANT_CHARS, for assembling output as bytes
+QUADRANT_BYTES = tuple(c.encode("utf-8") for c in QUADRANT_CHARS)
+
 
+def _block_patterns(
+    quads: tuple[NDArray[np.floating], ...],
+    hi: NDArray[np.floating],
+    lo: NDArray[np.floating],
+) -> NDArray[np.uint8]:
+    """Pack which of a block's TL, TR, BL, BR values exceed its midpoint.
 
-def _gray_code(brightness: float, fg: bool, true_color: bool = False) -> str:
-    """Generate ANSI escape code for grayscale color.
+    Bits are or-ed straight into a uint8 pattern (TL=8, TR=4, BL=2, BR=1)
+    instead of summing a (rows, cols, 4) mask times bit weights. Uniform
+    blocks get the full block.
 
     Args:
-        brightness: Value from 0.0 (black) to 1.0 (white).
-        fg: True for foreground, False for background.
-        true_color: Use 24-bit RGB mode instead of 256-color mode.
+        quads: Per-block TL, TR, BL and BR values, each (rows, cols).
+        hi: Per-block maximum.
+        lo: Per-block minimum.
 
     Returns:
-        ANSI escape sequence string for setting color.
+        (rows, cols) array of 4-bit patterns.
     """
-    prefix = 38 if fg else 48
-    if true_color:
-        v = int(brightness * 255)
-        return f"\033[{prefix};2;{v};{v};{v}m"
-    level = int(brightness * _GRAY_LEVELS)
-    return f"\033[{prefix};5;{_GRAY_BASE + level}m"
-
+    thresh = (hi + lo) / 2
+    patterns = (quads[0] > thresh).astype(np.uint8) << 3
+    for shift, quad in zip((2, 1, 0), quads[1:]):
+        patterns |= (quad > thresh).astype(np.uint8) << shift
+    patterns[(hi - lo) < _UNIFORM_THRESHOLD] = 0b1111
+    return patterns
+
+
+@njit(cache=True, boundscheck=False)
+def _quadrant_gray(
+    bitmap: NDArray[np.floating],
+    patterns: NDArray[np.uint8],
+    fg: NDArray[np.floating],
+    bg: NDArray[np.floating],
+) -> None:
+    """Fill the pattern and fg/bg brightness of each 2x2 block; compiled with Numba."""
+    rows, cols = patterns.shape
+    for y in range(rows):
+        y0 = y * 2
+        for x in range(cols):
+            x0 = x * 2
+            tl = bitmap[y0, x0]
+            tr = bitmap[y0, x0 + 1]
+            bl = bitmap[y0 + 1, x0]
+            br = bitmap[y0 + 1, x0 + 1]
+            hi = max(max(tl, tr), max(bl, br))
+            lo = min(min(tl, tr), min(bl, br))
+            if hi - lo < _UNIFORM_THRESHOLD:
+                pattern = 0b1111
+            else:
+                thresh = (hi + lo) / 2
+                pattern = 0
+                if tl > thresh:
+                    pattern |= 8
+                if tr > thresh:
+                    pattern |= 4
+                if bl > thresh:
+                    pattern |= 2
+                if br > thresh:
+                    pattern |= 1
+            patterns[y, x] = pattern
+            fg[y, x] = hi
+            bg[y, x] = lo
+
+
+@njit(cache=True, boundscheck=False)
+def _quadrant_rgb(
+    lum: NDArray[np.floating],
+    colors: NDArray[np.floating],
+    patterns: NDArray[np.uint8],
+    fg: NDArray[np.floating],
+    bg: NDArray[np.floating],
+) -> None:
+    """Fill the pattern and fg/bg colors of each 2x2 block; compiled with Numba.
+
+    The brightest and darkest pixels (first one on ties, in TL, TR, BL, BR
+    order) give the colors; uniform blocks use the block's mean color.
+    """
+    rows, cols = patterns.shape
+    for y in range(rows):
+        y0 = y * 2
+        for x in range(cols):
+            x0 = x * 2
+            hi = lo = lum[y0, x0]
+            hi_k = lo_k = 0
+            for k in range(1, 4):
+                v = lum[y0 + k // 2, x0 + k % 2]
+                if v > hi:
+                    hi = v
+                    hi_k = k
+                if v < lo:
+                    lo = v
+                    lo_k = k
+            if hi - lo < _UNIFORM_THRESHOLD:
+                patterns[y, x] = 0b1111
+                for c in range(3):
+                    mean = (
+                        colors[y0, x0, c]
+                        + colors[y0, x0 + 1, c]
+                        + colors[y0 + 1, x0, c]
+                        + colors[y0 + 1, x0 + 1, c]
+                    ) / 4
+                    fg[y, x, c] = mean
+                    bg[y, x, c] = mean
+                continue
+            thresh = (hi + lo) / 2
+            pattern = 0
+            if lum[y0, x0] > thresh:
+                pattern |= 8
+            if lum[y0, x0 + 1] > thresh:
+                pattern |= 4
+            if lum[y0 + 1, x0] > thresh:
+                pattern |= 2
+            if lum[y0 + 1, x0 + 1] > thresh:
+                pattern |= 1
+            patterns[y, x] = pattern
+            for c in range(3):
+                fg[y, x, c] = colors[y0 + hi_k // 2, x0 + hi_k % 2, c]
+                bg[y, x, c] = colors[y0 + lo_k // 2, x0 + lo_k % 2, c]
+
+
+# ANSI escape tables indexed by quantized level, so each cell's colors are
+# table lookups rather than freshly formatted escape codes. Grayscale uses
+# one level for all three channels; true color RGB is assembled from a
+# per-channel field table, since a table of all 16M colors is too big.
+# Entries are bytes: rows are appended to a bytearray and decoded once.
+_FG_GRAY_TRUE = tuple(b"\033[38;2;%d;%d;%dm" % (v, v, v) for v in range(256))
+_BG_GRAY_TRUE = tuple(b"\033[48;2;%d;%d;%dm" % (v, v, v) for v in range(256))
+_FG_GRAY_256 = tuple(b"\033[38;5;%dm" % (_GRAY_BASE + i) for i in range(_GRAY_LEVELS + 1))
+_BG_GRAY_256 = tuple(b"\033[48;5;%dm" % (_GRAY_BASE + i) for i in range(_GRAY_LEVELS + 1))
+_FG_CUBE = tuple(b"\033[38;5;%dm" % (_RGB_BASE + i) for i in range((_RGB_LEVELS + 1) ** 3))
+_BG_CUBE = tuple(b"\033[48;5;%dm" % (_RGB_BASE + i) for i in range((_RGB_LEVELS + 1) ** 3))
+_FG_RED = tuple(b"\033[38;2;%d;" % i for i in range(256))
+_BG_RED = tuple(b"\033[48;2;%d;" % i for i in range(256))
+_GREEN = tuple(b"%d;" % i for i in range(256))
+_BLUE = tuple(b"%dm" % i for i in range(256))
+_RESET_BYTES = RESET.encode("ascii")
+
+
+def _quantize(values: NDArray[np.floating], levels: int) -> NDArray[np.intp]:
+    """Scale 0-1 values to integer levels 0..levels, truncating like ``int()``.
+
+    Values are clamped first, so the result always indexes the escape tables.
+    """
+    return (np.clip(values, 0.0, 1.0) * levels).astype(np.intp)
 
-def _color_code(r: float, g: float, b: float, fg: bool, true_color: bool = False) -> str:
-    """Generate ANSI escape code for RGB color.
 
-    Args:
-        r, g, b: Color channels, 0.0 to 1.0.
-        fg: True for foreground, False for background.
-        true_color: Use 24-bit RGB mode instead of 216-color cube.
+def _table_frame(
+    fg_index: list[list[int]],
+    bg_index: list[list[int]],
+    patterns: list[list[int]],
+    fg_codes: tuple[bytes, ...],
+    bg_codes: tuple[bytes, ...],
+) -> str:
+    """Build a frame whose cell colors are single entries of escape tables.
 
-    Returns:
-        ANSI escape sequence string for setting color.
+    Used for grayscale and the 256-color cube. A color is only emitted when
+    it differs from the one already set in the row; a full block hides the
+    background, so it keeps the old one.
+    """
+    frame = bytearray()
+    for y, (fg_row, bg_row, pattern_row) in enumerate(zip(fg_index, bg_index, patterns)):
+        if y:
+            frame += b"\n"
+        prev_fg = prev_bg = -1
+        for fg, bg, pattern in zip(fg_row, bg_row, pattern_row):
+            if fg != prev_fg:
+                frame += fg_codes[fg]
+                prev_fg = fg
+            if bg != prev_bg and pattern != 0b1111:
+                frame += bg_codes[bg]
+                prev_bg = bg
+            frame += QUADRANT_BYTES[pattern]
+        frame += _RESET_BYTES
+    return frame.decode("utf-8")
+
+
+def _true_color_frame(
+    fg_rgb: list[list[int]],
+    bg_rgb: list[list[int]],
+    patterns: list[list[int]],
+) -> str:
+    """Build a frame of 24-bit colors packed as ``0xRRGGBB`` ints.
+
+    Packing makes the repeated-color check one int comparison; escapes are
+    assembled from the per-channel field tables only when a color changes.
     """
-    prefix = 38 if fg else 48
-    if true_color:
-        ri, gi, bi = int(r * 255), int(g * 255), int(b * 255)
-        return f"\033[{prefix};2;{ri};{gi};{bi}m"
-    ri, gi, bi = int(r * _RGB_LEVELS), int(g * _RGB_LEVELS), int(b * _RGB_LEVELS)
-    return f"\033[{prefix};5;{_RGB_BASE + 36 * ri + 6 * gi + bi}m"
+    frame = bytearray()
+    for y, (fg_row, bg_row, pattern_row) in enumerate(zip(fg_rgb, bg_rgb, patterns)):
+        if y:
+            frame += b"\n"
+        prev_fg = prev_bg = -1
+        for fg, bg, pattern in zip(fg_row, bg_row, pattern_row):
+            if fg != prev_fg:
+                frame += _FG_RED[fg >> 16]
+                frame += _GREEN[(fg >> 8) & 0xFF]
+                frame += _BLUE[fg & 0xFF]
+                prev_fg = fg
+            if bg != prev_bg and pattern != 0b1111:
+                frame += _BG_RED[bg >> 16]
+                frame += _GREEN[(bg >> 8) & 0xFF]
+                frame += _BLUE[bg & 0xFF]
+                prev_bg = bg
+            frame += QUADRANT_BYTES[pattern]
+        frame += _RESET_BYTES
+    return frame.decode("utf-8")
 
 
 @dataclass(frozen=True)
@@ -191,41 +364,40 @@ class QuadrantsRenderer:
         dest: TextIO,
     ) -> None:
         """Render grayscale bitmap using vectorized numpy operations."""
-        # Reshape to blocks: (rows, 2, cols, 2) -> (rows, cols, 4)
-        block_data = (
-            bitmap[: rows * 2, : cols * 2]
-            .reshape(rows, 2, cols, 2)
-            .transpose(0, 2, 1, 3)
-            .reshape(rows, cols, 4)
-        )
+        if use_kernels(bitmap.size):
+            # Once kernels are enabled (vidcat), one fused pass over the
+            # blocks instead of the temporaries below
+            patterns = np.empty((rows, cols), dtype=np.uint8)
+            fg = np.empty((rows, cols), dtype=bitmap.dtype)
+            bg = np.empty_like(fg)
+            _quadrant_gray(bitmap, patterns, fg, bg)
+        else:
+            # TL, TR, BL, BR pixel of every block as strided views
+            crop = bitmap[: rows * 2, : cols * 2]
+            quads = (crop[0::2, 0::2], crop[0::2, 1::2], crop[1::2, 0::2], crop[1::2, 1::2])
 
-        # Min/max per block for fg/bg
-        fg = np.amax(block_data, axis=2)
-        bg = np.amin(block_data, axis=2)
-
-        # Threshold at midpoint, compute pattern
-        thresh = ((fg + bg) / 2)[:, :, np.newaxis]
-        patterns = np.sum((block_data > thresh).astype(np.uint8) * _BITS, axis=2)
-
-        # Uniform blocks -> full block
-        uniform = (fg - bg) < _UNIFORM_THRESHOLD
-        patterns[uniform] = 0b1111
-
-        # Write output
-        first_row = True
-        for y in range(rows):
-            if not first_row:
-                dest.write("\n")
-            first_row = False
-
-            parts = []
-            for x in range(cols):
-                parts.append(
-                    f"{_gray_code(fg[y, x], True, self.true_color)}"
-                    f"{_gray_code(bg[y, x], False, self.true_color)}"
-                    f"{QUADRANT_CHARS[patterns[y, x]]}"
-                )
-            dest.write("".join(parts) + RESET)
+            # Min/max per block for fg/bg
+            fg = np.maximum(np.maximum(quads[0], quads[1]), np.maximum(quads[2], quads[3]))
+            bg = np.minimum(np.minimum(quads[0], quads[1]), np.minimum(quads[2], quads[3]))
+
+            # Threshold at midpoint, compute pattern
+            patterns = _block_patterns(quads, fg, bg)
+
+        if self.true_color:
+            fg_codes, bg_codes, scale = _FG_GRAY_TRUE, _BG_GRAY_TRUE, 255
+        else:
+            fg_codes, bg_codes, scale = _FG_GRAY_256, _BG_GRAY_256, _GRAY_LEVELS
+
+        # Quantize to table indices for all cells at once, as plain ints
+        dest.write(
+            _table_frame(
+                _quantize(fg, scale).tolist(),
+                _quantize(bg, scale).tolist(),
+                patterns.tolist(),
+                fg_codes,
+                bg_codes,
+            )
+        )
 
     def _render_rgb(
         self,
@@ -236,63 +408,72 @@ class QuadrantsRenderer:
         dest: TextIO,
     ) -> None:
         """Render RGB bitmap using vectorized numpy operations."""
-        # Reshape blocks: (rows, cols, 4, 3)
-        block_data = (
-            colors[: rows * 2, : cols * 2]
-            .reshape(rows, 2, cols, 2, 3)
-            .transpose(0, 2, 1, 3, 4)
-            .reshape(rows, cols, 4, 3)
-        )
-
-        # Luminance per pixel (ITU-R BT.601)
-        lum = (
-            _LUM_R * block_data[:, :, :, 0]
-            + _LUM_G * block_data[:, :, :, 1]
-            + _LUM_B * block_data[:, :, :, 2]
-        )
-
-        # Min/max luminance for thresholding
-        fg_lum = np.amax(lum, axis=2)
-        bg_lum = np.amin(lum, axis=2)
-        fg_idx = lum.argmax(axis=2)
-        bg_idx = lum.argmin(axis=2)
-
-        # Pattern from lum > threshold
-        thresh = ((fg_lum + bg_lum) / 2)[:, :, np.newaxis]
-        patterns = np.sum((lum > thresh).astype(np.uint8) * _BITS, axis=2)
-
-        # Uniform blocks -> full block
-        uniform = (fg_lum - bg_lum) < _UNIFORM_THRESHOLD
-        patterns[uniform] = 0b1111
-
-        # Extract fg/bg colors
-        y_idx, x_idx = np.ogrid[:rows, :cols]
-        fg_colors = block_data[y_idx, x_idx, fg_idx]
-        bg_colors = block_data[y_idx, x_idx, bg_idx]
-
-        # Uniform blocks use mean color
-        if np.any(uniform):
-            mean_colors = np.mean(block_data[uniform], axis=1)
-            fg_colors[uniform] = mean_colors
-            bg_colors[uniform] = mean_colors
-
-        # Write output
-        first_row = True
-        for y in range(rows):
-            if not first_row:
-                dest.write("\n")
-            first_row = False
-
-            parts = []
-            for x in range(cols):
-                fg = fg_colors[y, x]
-                bg = bg_colors[y, x]
-                parts.append(
-                    f"{_color_code(fg[0], fg[1], fg[2], True, self.true_color)}"
-                    f"{_color_code(bg[0], bg[1], bg[2], False, self.true_color)}"
-                    f"{QUADRANT_CHARS[patterns[y, x]]}"
-                )
-            dest.write("".join(parts) + RESET)
+        # Luminance per pixel (ITU-R BT.601) as one matrix-vector product
+        pixels = colors[: rows * 2, : cols * 2]
+        lum_dtype = np.result_type(pixels.dtype, np.float32)
+        lum = pixels @ _LUM_VEC.astype(lum_dtype, copy=False)
+
+        if use_kernels(bitmap.size):
+            # Once kernels are enabled (vidcat), one fused pass over the
+            # blocks instead of the temporaries below
+            patterns = np.empty((rows, cols), dtype=np.uint8)
+            fg_colors = np.empty((rows, cols, 3), dtype=colors.dtype)
+            bg_colors = np.empty_like(fg_colors)
+            _quadrant_rgb(lum, pixels, patterns, fg_colors, bg_colors)
+        else:
+            # TL, TR, BL, BR pixel of every block as strided views
+            lum_quads = (lum[0::2, 0::2], lum[0::2, 1::2], lum[1::2, 0::2], lum[1::2, 1::2])
+            color_quads = (
+                pixels[0::2, 0::2],
+                pixels[0::2, 1::2],
+                pixels[1::2, 0::2],
+                pixels[1::2, 1::2],
+            )
+
+            # Brightest and darkest pixel per block (first one on ties)
+            fg_lum = lum_quads[0].copy()
+            bg_lum = lum_quads[0].copy()
+            fg_colors = color_quads[0].copy()
+            bg_colors = color_quads[0].copy()
+            for quad_lum, quad_colors in zip(lum_quads[1:], color_quads[1:]):
+                brighter = quad_lum > fg_lum
+                np.copyto(fg_lum, quad_lum, where=brighter)
+                np.copyto(fg_colors, quad_colors, where=brighter[:, :, np.newaxis])
+                darker = quad_lum < bg_lum
+                np.copyto(bg_lum, quad_lum, where=darker)
+                np.copyto(bg_colors, quad_colors, where=darker[:, :, np.newaxis])
+
+            # Pattern from lum > threshold
+            patterns = _block_patterns(lum_quads, fg_lum, bg_lum)
+
+            # Uniform blocks use mean color
+            uniform = (fg_lum - bg_lum) < _UNIFORM_THRESHOLD
+            if np.any(uniform):
+                mean_colors = sum(quad[uniform] for quad in color_quads) / 4
+                fg_colors[uniform] = mean_colors
+                bg_colors[uniform] = mean_colors
+
+        # Quantize to table indices for all cells at once, as plain ints:
+        # packed 0xRRGGBB for true color, cube entries for 256-color mode
+        if self.true_color:
+            fg_rgb = _quantize(fg_colors, 255)
+            bg_rgb = _quantize(bg_colors, 255)
+            frame = _true_color_frame(
+                (fg_rgb[:, :, 0] << 16 | fg_rgb[:, :, 1] << 8 | fg_rgb[:, :, 2]).tolist(),
+                (bg_rgb[:, :, 0] << 16 | bg_rgb[:, :, 1] << 8 | bg_rgb[:, :, 2]).tolist(),
+                patterns.tolist(),
+            )
+        else:
+            fg_cube = _quantize(fg_colors, _RGB_LEVELS)
+            bg_cube = _quantize(bg_colors, _RGB_LEVELS)
+            frame = _table_frame(
+                (36 * fg_cube[:, :, 0] + 6 * fg_cube[:, :, 1] + fg_cube[:, :, 2]).tolist(),
+                (36 * bg_cube[:, :, 0] + 6 * bg_cube[:, :, 1] + bg_cube[:, :, 2]).tolist(),
+                patterns.tolist(),
+                _FG_CUBE,
+                _BG_CUBE,
+            )
+        dest.write(frame)
 
 
 # Convenience instance for default usage
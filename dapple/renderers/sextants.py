@@ -8,10 +8,12 @@ pattern, providing 6 pixels per character position.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, TextIO
+from typing import TYPE_CHECKING, Sequence, TextIO
 
 import numpy as np
 
+from dapple._jit import njit, use_kernels
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
@@ -28,6 +30,8 @@ _UNIFORM_THRESHOLD = 0.001
 # ITU-R BT.601 luminance coefficients
 from dapple.color import LUM_R as _LUM_R, LUM_G as _LUM_G, LUM_B as _LUM_B
 
+_LUM_VEC = np.array([_LUM_R, _LUM_G, _LUM_B])
+
 
 def _build_sextant_table() -> list[str]:
     """Build the 64-entry sextant character lookup table.
@@ -67,63 +71,174 @@ def _build_sextant_table() -> list[str]:
     # - Pattern 42 (right half) -> "▐" (U+2590)
     # - Pattern 63 (full) -> "█" (U+2588)
 
+    special = {0: " ", 21: "▌", 42: "▐", 63: "█"}
     table = []
     for my_pattern in range(64):
-        # Convert my bit layout to Unicode bit layout
-        # My bits: [bit5=cell0, bit4=cell1, bit3=cell2, bit2=cell3, bit1=cell4, bit0=cell5]
-        # Unicode: cell_i contributes 2^(i) where i is 0-indexed now
-        # So unicode_pattern = cell0*1 + cell1*2 + cell2*4 + cell3*8 + cell4*16 + cell5*32
-
-        cell0 = (my_pattern >> 5) & 1
-        cell1 = (my_pattern >> 4) & 1
-        cell2 = (my_pattern >> 3) & 1
-        cell3 = (my_pattern >> 2) & 1
-        cell4 = (my_pattern >> 1) & 1
-        cell5 = my_pattern & 1
-
-        unicode_pattern = cell0 * 1 + cell1 * 2 + cell2 * 4 + cell3 * 8 + cell4 * 16 + cell5 * 32
-
-        if unicode_pattern == 0:
-            table.append(" ")
-        elif unicode_pattern == 63:
-            table.append("█")
-        elif unicode_pattern == 21:  # Left half in Unicode encoding
-            table.append("▌")
-        elif unicode_pattern == 42:  # Right half in Unicode encoding
-            table.append("▐")
-        else:
-            # Count how many special patterns (21, 42) are below unicode_pattern
-            offset = sum(1 for x in (21, 42) if x < unicode_pattern)
-            table.append(chr(0x1FB00 + unicode_pattern - 1 - offset))
+        # Reverse the bit order: internal cell k is bit 5-k, Unicode cell k is bit k
+        u = sum(((my_pattern >> (5 - k)) & 1) << k for k in range(6))
+        # Sextants skip the special patterns, so subtract those below u
+        table.append(special.get(u) or chr(0x1FB00 + u - 1 - (u > 21) - (u > 42)))
 
     return table
 
 
 SEXTANT_CHARS = _build_sextant_table()
 
-# Bit weights for pattern calculation: cells 0-5 in row-major order
-# Cell layout: row0: [0,1], row1: [2,3], row2: [4,5]
-_BITS = np.array([32, 16, 8, 4, 2, 1], dtype=np.uint8)
 
+def _block_patterns(
+    cells: NDArray[np.floating],
+    hi: NDArray[np.floating],
+    lo: NDArray[np.floating],
+) -> NDArray[np.uint8]:
+    """Pack which of a block's six cells exceed its midpoint.
 
-def _gray_code(brightness: float, fg: bool, true_color: bool = False) -> str:
-    """Generate ANSI escape code for grayscale color."""
-    prefix = 38 if fg else 48
-    if true_color:
-        v = int(brightness * 255)
-        return f"\033[{prefix};2;{v};{v};{v}m"
-    level = int(brightness * _GRAY_LEVELS)
-    return f"\033[{prefix};5;{_GRAY_BASE + level}m"
+    Bits are or-ed straight into a uint8 pattern (cell 0 = 32 down to
+    cell 5 = 1) instead of summing a (rows, cols, 6) mask times bit
+    weights. Uniform blocks are left to the caller, which also needs
+    their mask for colors.
 
+    Args:
+        cells: (rows, cols, 6) values of each block's cells in row-major order.
+        hi: Per-block maximum.
+        lo: Per-block minimum.
 
-def _color_code(r: float, g: float, b: float, fg: bool, true_color: bool = False) -> str:
-    """Generate ANSI escape code for RGB color."""
-    prefix = 38 if fg else 48
-    if true_color:
-        ri, gi, bi = int(r * 255), int(g * 255), int(b * 255)
-        return f"\033[{prefix};2;{ri};{gi};{bi}m"
-    ri, gi, bi = int(r * _RGB_LEVELS), int(g * _RGB_LEVELS), int(b * _RGB_LEVELS)
-    return f"\033[{prefix};5;{_RGB_BASE + 36 * ri + 6 * gi + bi}m"
+    Returns:
+        (rows, cols) array of 6-bit patterns.
+    """
+    thresh = (hi + lo) / 2
+    patterns = (cells[:, :, 0] > thresh).astype(np.uint8) << 5
+    for k in range(1, 6):
+        patterns |= (cells[:, :, k] > thresh).astype(np.uint8) << (5 - k)
+    return patterns
+
+
+@njit(cache=True, boundscheck=False)
+def _sextant_gray(
+    bitmap: NDArray[np.floating],
+    patterns: NDArray[np.uint8],
+    fg: NDArray[np.floating],
+    bg: NDArray[np.floating],
+) -> None:
+    """Fill the pattern and fg/bg brightness of each 2x3 block; compiled with Numba."""
+    rows, cols = patterns.shape
+    for y in range(rows):
+        y0 = y * 3
+        for x in range(cols):
+            x0 = x * 2
+            hi = lo = bitmap[y0, x0]
+            for k in range(1, 6):
+                v = bitmap[y0 + k // 2, x0 + k % 2]
+                hi = max(hi, v)
+                lo = min(lo, v)
+            if hi - lo < _UNIFORM_THRESHOLD:
+                pattern = 0b111111
+            else:
+                thresh = (hi + lo) / 2
+                pattern = 0
+                for k in range(6):
+                    if bitmap[y0 + k // 2, x0 + k % 2] > thresh:
+                        pattern |= 32 >> k
+            patterns[y, x] = pattern
+            fg[y, x] = hi
+            bg[y, x] = lo
+
+
+@njit(cache=True, boundscheck=False)
+def _sextant_rgb(
+    lum: NDArray[np.floating],
+    blocks: NDArray[np.floating],
+    patterns: NDArray[np.uint8],
+    fg: NDArray[np.floating],
+    bg: NDArray[np.floating],
+) -> None:
+    """Fill the pattern and fg/bg colors of each 2x3 block; compiled with Numba.
+
+    ``lum`` is (rows, cols, 6) and ``blocks`` the channel-major
+    (3, rows, cols, 6) colors. The brightest and darkest cells (first one
+    on ties) give the colors; uniform blocks use the block's mean color.
+    """
+    rows, cols = patterns.shape
+    for y in range(rows):
+        for x in range(cols):
+            hi = lo = lum[y, x, 0]
+            hi_k = lo_k = 0
+            for k in range(1, 6):
+                v = lum[y, x, k]
+                if v > hi:
+                    hi = v
+                    hi_k = k
+                if v < lo:
+                    lo = v
+                    lo_k = k
+            if hi - lo < _UNIFORM_THRESHOLD:
+                patterns[y, x] = 0b111111
+                for c in range(3):
+                    total = blocks[c, y, x, 0]
+                    for k in range(1, 6):
+                        total += blocks[c, y, x, k]
+                    fg[y, x, c] = total / 6
+                    bg[y, x, c] = total / 6
+                continue
+            thresh = (hi + lo) / 2
+            pattern = 0
+            for k in range(6):
+                if lum[y, x, k] > thresh:
+                    pattern |= 32 >> k
+            patterns[y, x] = pattern
+            for c in range(3):
+                fg[y, x, c] = blocks[c, y, x, hi_k]
+                bg[y, x, c] = blocks[c, y, x, lo_k]
+
+
+# Escape tables indexed by quantized level, so each cell's colors are table
+# lookups rather than freshly formatted escape codes: 24-bit and 256-color
+# grays and the 256-color cube. True color RGB is assembled from
+# per-channel field tables, since a table of all 16M colors is too big.
+# They are object arrays so that a whole frame of levels is looked up in
+# one step.
+_FG_GRAY_TRUE = np.array([f"\033[38;2;{v};{v};{v}m" for v in range(256)], dtype=object)
+_BG_GRAY_TRUE = np.array([f"\033[48;2;{v};{v};{v}m" for v in range(256)], dtype=object)
+_FG_GRAY_256 = np.array(
+    [f"\033[38;5;{_GRAY_BASE + i}m" for i in range(_GRAY_LEVELS + 1)], dtype=object
+)
+_BG_GRAY_256 = np.array(
+    [f"\033[48;5;{_GRAY_BASE + i}m" for i in range(_GRAY_LEVELS + 1)], dtype=object
+)
+_FG_CUBE = np.array(
+    [f"\033[38;5;{_RGB_BASE + i}m" for i in range((_RGB_LEVELS + 1) ** 3)], dtype=object
+)
+_BG_CUBE = np.array(
+    [f"\033[48;5;{_RGB_BASE + i}m" for i in range((_RGB_LEVELS + 1) ** 3)], dtype=object
+)
+_FG_RED = np.array([f"\033[38;2;{i};" for i in range(256)], dtype=object)
+_BG_RED = np.array([f"\033[48;2;{i};" for i in range(256)], dtype=object)
+_GREEN = np.array([f"{i};" for i in range(256)], dtype=object)
+_BLUE = np.array([f"{i}m" for i in range(256)], dtype=object)
+_SEXTANT_ARRAY = np.array(SEXTANT_CHARS, dtype=object)
+
+
+def _quantize(values: NDArray[np.floating], levels: int) -> NDArray[np.intp]:
+    """Scale 0-1 values to integer levels 0..levels, truncating like ``int()``.
+
+    Values are clamped first, so the result always indexes the escape tables.
+    """
+    return (np.clip(values, 0.0, 1.0) * levels).astype(np.intp)
+
+
+def _frame(codes: Sequence[NDArray[np.object_]], patterns: NDArray[np.uint8]) -> str:
+    """Assemble a frame from the escape codes and pattern of each cell.
+
+    ``codes`` holds (rows, cols) arrays of the strings that precede each
+    cell's character, in order. They are interleaved with the characters
+    into one object array, so each row is a single ``str.join`` rather than
+    a string formatted per cell.
+    """
+    rows, cols = patterns.shape
+    cells = np.empty((rows, cols, len(codes) + 1), dtype=object)
+    for k, part in enumerate(codes):
+        cells[:, :, k] = part
+    cells[:, :, -1] = _SEXTANT_ARRAY[patterns]
+    return "\n".join("".join(row) + RESET for row in cells.reshape(rows, -1).tolist())
 
 
 @dataclass(frozen=True)
@@ -227,41 +342,45 @@ class SextantsRenderer:
         dest: TextIO,
     ) -> None:
         """Render grayscale bitmap using vectorized numpy operations."""
-        # Reshape to sextant blocks: (rows, 3, cols, 2) -> (rows, cols, 6)
-        block_data = (
-            bitmap[: rows * 3, : cols * 2]
-            .reshape(rows, 3, cols, 2)
-            .transpose(0, 2, 1, 3)
-            .reshape(rows, cols, 6)
-        )
+        if use_kernels(bitmap.size):
+            # Once kernels are enabled (vidcat), one fused pass over the
+            # blocks instead of the temporaries below
+            patterns = np.empty((rows, cols), dtype=np.uint8)
+            fg = np.empty((rows, cols), dtype=bitmap.dtype)
+            bg = np.empty_like(fg)
+            _sextant_gray(bitmap, patterns, fg, bg)
+        else:
+            # Reshape to sextant blocks: (rows, 3, cols, 2) -> (rows, cols, 6)
+            block_data = (
+                bitmap[: rows * 3, : cols * 2]
+                .reshape(rows, 3, cols, 2)
+                .transpose(0, 2, 1, 3)
+                .reshape(rows, cols, 6)
+            )
+
+            # Min/max per block for fg/bg
+            fg = np.amax(block_data, axis=2)
+            bg = np.amin(block_data, axis=2)
+
+            # Threshold at midpoint, compute pattern
+            patterns = _block_patterns(block_data, fg, bg)
+
+            # Uniform blocks -> full block; most images have few, so skip the
+            # masked write when there are none
+            uniform = (fg - bg) < _UNIFORM_THRESHOLD
+            if uniform.any():
+                patterns[uniform] = 0b111111
+
+        if self.true_color:
+            fg_table, bg_table, scale = _FG_GRAY_TRUE, _BG_GRAY_TRUE, 255
+        else:
+            fg_table, bg_table, scale = _FG_GRAY_256, _BG_GRAY_256, _GRAY_LEVELS
 
-        # Min/max per block for fg/bg
-        fg = np.amax(block_data, axis=2)
-        bg = np.amin(block_data, axis=2)
-
-        # Threshold at midpoint, compute pattern
-        thresh = ((fg + bg) / 2)[:, :, np.newaxis]
-        patterns = np.sum((block_data > thresh).astype(np.uint8) * _BITS, axis=2)
-
-        # Uniform blocks -> full block
-        uniform = (fg - bg) < _UNIFORM_THRESHOLD
-        patterns[uniform] = 0b111111
-
-        # Write output
-        first_row = True
-        for y in range(rows):
-            if not first_row:
-                dest.write("\n")
-            first_row = False
-
-            parts = []
-            for x in range(cols):
-                parts.append(
-                    f"{_gray_code(fg[y, x], True, self.true_color)}"
-                    f"{_gray_code(bg[y, x], False, self.true_color)}"
-                    f"{SEXTANT_CHARS[patterns[y, x]]}"
-                )
-            dest.write("".join(parts) + RESET)
+        # Quantize all cells at once and look the escapes up
+        fg_codes = fg_table[_quantize(fg, scale)]
+        bg_codes = bg_table[_quantize(bg, scale)]
+
+        dest.write(_frame((fg_codes, bg_codes), patterns))
 
     def _render_rgb(
         self,
@@ -272,63 +391,74 @@ class SextantsRenderer:
         dest: TextIO,
     ) -> None:
         """Render RGB bitmap using vectorized numpy operations."""
-        # Reshape blocks: (rows, cols, 6, 3)
+        # Reshape blocks channel-major: (3, rows, cols, 6), so each channel's
+        # block values are contiguous rather than interleaved per pixel
         block_data = (
             colors[: rows * 3, : cols * 2]
             .reshape(rows, 3, cols, 2, 3)
-            .transpose(0, 2, 1, 3, 4)
-            .reshape(rows, cols, 6, 3)
+            .transpose(4, 0, 2, 1, 3)
+            .reshape(3, rows, cols, 6)
         )
 
-        # Luminance per pixel (ITU-R BT.601)
-        lum = (
-            _LUM_R * block_data[:, :, :, 0]
-            + _LUM_G * block_data[:, :, :, 1]
-            + _LUM_B * block_data[:, :, :, 2]
-        )
+        # Luminance per pixel (ITU-R BT.601) as one vector-matrix product
+        # over the channel planes
+        lum_vec = _LUM_VEC.astype(np.result_type(block_data.dtype, np.float32), copy=False)
+        lum = (lum_vec @ block_data.reshape(3, -1)).reshape(rows, cols, 6)
+
+        if use_kernels(bitmap.size):
+            # Once kernels are enabled (vidcat), one fused pass over the
+            # blocks instead of the temporaries below
+            patterns = np.empty((rows, cols), dtype=np.uint8)
+            fg_colors = np.empty((rows, cols, 3), dtype=colors.dtype)
+            bg_colors = np.empty_like(fg_colors)
+            _sextant_rgb(lum, block_data, patterns, fg_colors, bg_colors)
+        else:
+            # Min/max luminance for thresholding
+            fg_lum = np.amax(lum, axis=2)
+            bg_lum = np.amin(lum, axis=2)
+            fg_idx = lum.argmax(axis=2)
+            bg_idx = lum.argmin(axis=2)
+
+            # Pattern from lum > threshold
+            patterns = _block_patterns(lum, fg_lum, bg_lum)
+            uniform = (fg_lum - bg_lum) < _UNIFORM_THRESHOLD
+
+            # Extract fg/bg colors as (rows, cols, 3)
+            fg_colors = np.take_along_axis(block_data, fg_idx[np.newaxis, :, :, np.newaxis], axis=3)
+            bg_colors = np.take_along_axis(block_data, bg_idx[np.newaxis, :, :, np.newaxis], axis=3)
+            fg_colors = fg_colors[:, :, :, 0].transpose(1, 2, 0)
+            bg_colors = bg_colors[:, :, :, 0].transpose(1, 2, 0)
+
+            # Uniform blocks -> full block in the mean color. The masked reads
+            # and writes only happen when there are any; for the few usually
+            # present, gathering them beats a full-frame mean plus copyto.
+            if uniform.any():
+                patterns[uniform] = 0b111111
+                mean_colors = np.mean(block_data[:, uniform], axis=2).T
+                fg_colors[uniform] = mean_colors
+                bg_colors[uniform] = mean_colors
+
+        # Quantize all cells at once and look the escapes up: per-channel
+        # fields for true color, cube entries for 256-color mode
+        if self.true_color:
+            fg_rgb = _quantize(fg_colors, 255)
+            bg_rgb = _quantize(bg_colors, 255)
+            codes = (
+                _FG_RED[fg_rgb[:, :, 0]],
+                _GREEN[fg_rgb[:, :, 1]],
+                _BLUE[fg_rgb[:, :, 2]],
+                _BG_RED[bg_rgb[:, :, 0]],
+                _GREEN[bg_rgb[:, :, 1]],
+                _BLUE[bg_rgb[:, :, 2]],
+            )
+        else:
+            fg_cube = _quantize(fg_colors, _RGB_LEVELS)
+            bg_cube = _quantize(bg_colors, _RGB_LEVELS)
+            fg_index = 36 * fg_cube[:, :, 0] + 6 * fg_cube[:, :, 1] + fg_cube[:, :, 2]
+            bg_index = 36 * bg_cube[:, :, 0] + 6 * bg_cube[:, :, 1] + bg_cube[:, :, 2]
+            codes = (_FG_CUBE[fg_index], _BG_CUBE[bg_index])
 
-        # Min/max luminance for thresholding
-        fg_lum = np.amax(lum, axis=2)
-        bg_lum = np.amin(lum, axis=2)
-        fg_idx = lum.argmax(axis=2)
-        bg_idx = lum.argmin(axis=2)
-
-        # Pattern from lum > threshold
-        thresh = ((fg_lum + bg_lum) / 2)[:, :, np.newaxis]
-        patterns = np.sum((lum > thresh).astype(np.uint8) * _BITS, axis=2)
-
-        # Uniform blocks -> full block
-        uniform = (fg_lum - bg_lum) < _UNIFORM_THRESHOLD
-        patterns[uniform] = 0b111111
-
-        # Extract fg/bg colors
-        y_idx, x_idx = np.ogrid[:rows, :cols]
-        fg_colors = block_data[y_idx, x_idx, fg_idx]
-        bg_colors = block_data[y_idx, x_idx, bg_idx]
-
-        # Uniform blocks use mean color
-        if np.any(uniform):
-            mean_colors = np.mean(block_data[uniform], axis=1)
-            fg_colors[uniform] = mean_colors
-            bg_colors[uniform] = mean_colors
-
-        # Write output
-        first_row = True
-        for y in range(rows):
-            if not first_row:
-                dest.write("\n")
-            first_row = False
-
-            parts = []
-            for x in range(cols):
-                fg = fg_colors[y, x]
-                bg = bg_colors[y, x]
-                parts.append(
-                    f"{_color_code(fg[0], fg[1], fg[2], True, self.true_color)}"
-                    f"{_color_code(bg[0], bg[1], bg[2], False, self.true_color)}"
-                    f"{SEXTANT_CHARS[patterns[y, x]]}"
-                )
-            dest.write("".join(parts) + RESET)
+        dest.write(_frame(codes, patterns))
 
 
 # Convenience instance for default usage
@@ -21,6 +21,8 @@ from typing import TYPE_CHECKING, TextIO
 
 import numpy as np
 
+from dapple._jit import njit, use_kernels
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
@@ -33,51 +35,339 @@ DCS_END = "\033\\"  # ESC \ (string terminator)
 # Character = '?' (0x3F) + 6-bit pattern
 # Bits: 0=top, 5=bottom
 
+_MAX_RUN = 255  # Longest run written as one "!<count><char>" repeat
+
+# Index used for the rows that pad the image to a multiple of 6. Palettes
+# stay below it, so the encoders skip these rows and leave them unpainted.
+_PAD_INDEX = 255
+
+# Pixels from which the band kernel saves more than importing Numba costs
+_KERNEL_MIN_PIXELS = 1 << 20
+
+
+@njit(cache=True, boundscheck=False)
+def _encode_band(
+    band: NDArray[np.uint8],
+    present: NDArray[np.bool_],
+    out: NDArray[np.uint8],
+) -> int:
+    """Encode a 6-row band of palette indices as sixel data; compiled with Numba.
+
+    For each palette color that appears in the band, in ascending order,
+    writes the color select, the band's sixel characters for that color
+    (runs of more than 3 identical columns are run-length encoded) and a
+    carriage return, then ends with the line feed. All colors are encoded
+    in this one call while the band is in cache; indices outside the
+    palette are ignored.
+
+    Args:
+        band: (6, W) palette indices.
+        present: Scratch array with one entry per palette color.
+        out: ASCII output buffer, at least ``len(present) * (W + 5) + 1``
+            bytes: a color's data never exceeds one byte per column.
+
+    Returns:
+        Number of bytes written.
+    """
+    w = band.shape[1]
+    n_colors = present.shape[0]
+    present[:] = False
+    for bit in range(6):
+        for x in range(w):
+            if band[bit, x] < n_colors:
+                present[band[bit, x]] = True
+
+    n = 0
+    for color in range(n_colors):
+        if not present[color]:
+            continue
+
+        # Select color
+        out[n] = 0x23  # '#'
+        n += 1
+        if color >= 100:
+            out[n] = 0x30 + color // 100
+            n += 1
+        if color >= 10:
+            out[n] = 0x30 + color // 10 % 10
+            n += 1
+        out[n] = 0x30 + color % 10
+        n += 1
+
+        x = 0
+        while x < w:
+            # 6-bit pattern for this column
+            pattern = 0
+            for bit in range(6):
+                if band[bit, x] == color:
+                    pattern |= 1 << bit
+
+            # Extend the run while the following columns match
+            run_len = 1
+            while x + run_len < w and run_len < _MAX_RUN:
+                next_pattern = 0
+                for bit in range(6):
+                    if band[bit, x + run_len] == color:
+                        next_pattern |= 1 << bit
+                if next_pattern != pattern:
+                    break
+                run_len += 1
+
+            char = 0x3F + pattern  # '?' = 0, '~' = 63
+            if run_len > 3:
+                out[n] = 0x21  # '!'
+                n += 1
+                if run_len >= 100:
+                    out[n] = 0x30 + run_len // 100
+                    n += 1
+                if run_len >= 10:
+                    out[n] = 0x30 + run_len // 10 % 10
+                    n += 1
+                out[n] = 0x30 + run_len % 10
+                out[n + 1] = char
+                n += 2
+            else:
+                for _ in range(run_len):
+                    out[n] = char
+                    n += 1
+
+            x += run_len
+
+        # Carriage return to start of row (for next color)
+        out[n] = 0x24  # '$'
+        n += 1
+
+    # Line feed to next 6-row band
+    out[n] = 0x2D  # '-'
+    return n + 1
+
+
+def _column_patterns(band: NDArray[np.uint8], n_colors: int) -> NDArray[np.uint8]:
+    """Pack the sixel pattern of every color in every column of a band.
+
+    Each pixel belongs to exactly one color, so row ``bit`` adds ``1 << bit``
+    to one (color, column) entry per column and no entry is hit twice.
+
+    Args:
+        band: (6, W) palette indices.
+        n_colors: Palette size; indices at or above it are ignored.
+
+    Returns:
+        (n_colors, W) array of 6-bit patterns.
+    """
+    w = band.shape[1]
+    patterns = np.zeros((256, w), dtype=np.uint8)
+    columns = np.arange(w)
+    for bit in range(6):
+        patterns[band[bit], columns] += 1 << bit
+    return patterns[:n_colors]
+
+
+# Sixel character of each 6-bit pattern, for vectorized lookups
+_SIXEL_CHARS = np.array([chr(0x3F + pattern) for pattern in range(64)], dtype=object)
+
+
+def _encode_band_runs(band: NDArray[np.uint8], n_colors: int) -> str:
+    """Encode a 6-row band of palette indices with NumPy.
+
+    Same output as ``_encode_band``, for when Numba is not installed. Column
+    patterns of all colors are packed at once, and runs are found from where
+    consecutive patterns of a color differ, so Python only loops over runs
+    longer than ``_MAX_RUN`` rather than over pixels.
+    """
+    patterns = _column_patterns(band, n_colors)
+    present = np.flatnonzero(patterns.any(axis=1))
+    if not len(present):
+        return "-"
+    patterns = patterns[present]
+    k, w = patterns.shape
+
+    # Runs start at each color's first column and wherever its pattern changes
+    change = np.ones((k, w), dtype=np.bool_)
+    np.not_equal(patterns[:, 1:], patterns[:, :-1], out=change[:, 1:])
+    starts = np.flatnonzero(change)
+    lengths = np.diff(starts, append=k * w)
+
+    chars = _SIXEL_CHARS[patterns.ravel()[starts]]
+    runs = chars * np.minimum(lengths, 3)
+    for i in np.flatnonzero(lengths > 3).tolist():
+        run_len, char = int(lengths[i]), chars[i]
+        full, run_len = divmod(run_len, _MAX_RUN)
+        last = f"!{run_len}{char}" if run_len > 3 else char * run_len
+        runs[i] = f"!{_MAX_RUN}{char}" * full + last
+
+    # Select each color before its first run, carriage return after its last
+    firsts = np.flatnonzero(starts % w == 0)
+    runs[firsts] = np.array([f"#{c}" for c in present.tolist()], dtype=object) + runs[firsts]
+    lasts = np.append(firsts[1:], len(runs)) - 1
+    runs[lasts] += "$"
+    return "".join(runs.tolist()) + "-"
+
+
+# Wu quantization works on a histogram with 32 levels per channel; bin 0 of
+# each axis stays empty so cumulative moments can be differenced at box edges
+_WU_BINS = 32
+
+# Splitting stops once the palette's mean squared error is below that of a
+# uniform 6-level-per-channel palette on evenly spread colors; further
+# entries add more sixel output than visible detail
+_WU_TARGET_ERROR = 3 * (1 / 6) ** 2 / 12
+
+
+def _corner_bounds() -> NDArray[np.intp]:
+    """Index the box bounds at which to read moments when cutting along each axis.
+
+    Returns:
+        (3, 3, 4) array: for each coordinate and cut axis, the index into
+        ``[r0, r1, g0, g1, b0, b1]`` of the coordinate at the box's four
+        corners in the two axes other than the cut axis, ordered (hi, hi),
+        (hi, lo), (lo, hi), (lo, lo). Entries of the cut axis are unused.
+    """
+    corners = np.zeros((3, 3, 4), dtype=np.intp)
+    for axis in range(3):
+        first, second = (c for c in range(3) if c != axis)
+        corners[first, axis] = [2 * first + 1, 2 * first + 1, 2 * first, 2 * first]
+        corners[second, axis] = [2 * second + 1, 2 * second, 2 * second + 1, 2 * second]
+    return corners
+
+
+_WU_CORNERS = _corner_bounds()[..., np.newaxis]
+_WU_ON_AXIS = np.eye(3, dtype=np.bool_)[:, :, np.newaxis, np.newaxis]
+_WU_POSITIONS = np.arange(_WU_BINS + 1)
+
+
+def _best_cut(
+    moments: NDArray[np.float64], box: list[int]
+) -> tuple[int, int, NDArray[np.float64], NDArray[np.float64]] | None:
+    """Find where cutting a box best separates its colors.
+
+    A cut is scored by the summed squared color totals over the weight of
+    each half, which is largest where the halves' variance is smallest.
+    Every position on all three axes is scored at once; equal scores prefer
+    red, then green, then blue, and then the lower position.
+
+    Args:
+        moments: (5, 33, 33, 33) cumulative moments.
+        box: [r0, r1, g0, g1, b0, b1] bin bounds, lower bounds exclusive.
+
+    Returns:
+        (axis, position, lower, upper), where lower and upper are the
+        moments of the two halves, or None if no cut leaves pixels on both
+        sides.
+    """
+    bounds = np.asarray(box)
+    # Moments of the box up to each position along each axis, (5, 3, 33)
+    coords = np.where(_WU_ON_AXIS, _WU_POSITIONS, bounds[_WU_CORNERS])
+    corners = moments[:, coords[0], coords[1], coords[2]]
+    totals = corners[:, :, 0] - corners[:, :, 1] - corners[:, :, 2] + corners[:, :, 3]
+
+    # Moments of the lower half for each cut position, and of the upper half;
+    # positions outside the box leave one half without pixels
+    lower = totals - totals[:, [0, 1, 2], bounds[0::2]][:, :, np.newaxis]
+    upper = (totals[:, 0, box[1]] - totals[:, 0, box[0]])[:, np.newaxis, np.newaxis] - lower
+    valid = (lower[0] > 0) & (upper[0] > 0)
+    if not valid.any():
+        return None
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = (lower[1:4] ** 2).sum(axis=0) / lower[0] + (upper[1:4] ** 2).sum(axis=0) / upper[0]
+    axis, position = divmod(int(np.where(valid, scores, 0.0).argmax()), _WU_BINS + 1)
+    return axis, position, lower[:, axis, position], upper[:, axis, position]
+
 
 def _quantize_colors(
     colors: NDArray[np.floating],
     n_colors: int,
 ) -> tuple[NDArray[np.uint8], NDArray[np.floating]]:
-    """Quantize RGB colors to a limited palette using simple binning.
+    """Quantize RGB colors to an adaptive palette with Wu's algorithm.
+
+    Colors are binned into a 32x32x32 histogram with per-bin pixel counts
+    and color moments. Starting from the whole color cube, the box with the
+    largest color variance is repeatedly split along the axis and position
+    that best separates its pixels, until there are ``n_colors`` boxes, the
+    palette is as close as a uniform 216-color one, or no box can be split.
+    Each box's mean color becomes a palette entry.
 
     Args:
         colors: RGB array (H, W, 3) with values 0.0-1.0
-        n_colors: Maximum number of colors in palette
+        n_colors: Maximum number of colors in palette (at most 256 are used)
 
     Returns:
         Tuple of (indexed image, palette)
         - indexed: (H, W) array of palette indices
-        - palette: (n_colors, 3) array of RGB values
+        - palette: (n, 3) array of RGB values, n <= n_colors
     """
     h, w, _ = colors.shape
+    if h * w == 0:
+        return np.zeros((h, w), dtype=np.uint8), np.zeros((1, 3), dtype=np.float32)
+    n_colors = max(1, min(n_colors, 256))
+    side = _WU_BINS + 1
+
+    # Histogram of pixel counts, channel sums and squared norms per bin, from
+    # one contiguous row per channel
+    planes = np.empty((3, h * w), dtype=np.float32)
+    np.clip(colors.reshape(-1, 3).T, 0.0, 1.0, out=planes)
+    bins = (planes * np.float32(_WU_BINS - 0.001)).astype(np.intp)
+    cell = bins[0] * side * side
+    cell += bins[1] * side
+    cell += bins[2]
+    cell += side * side + side + 1
+    squares = planes[0] * planes[0]
+    squares += planes[1] * planes[1]
+    squares += planes[2] * planes[2]
+    moments = np.stack(
+        [np.bincount(cell, minlength=side**3)]
+        + [np.bincount(cell, weights=plane, minlength=side**3) for plane in planes]
+        + [np.bincount(cell, weights=squares, minlength=side**3)]
+    ).reshape(5, side, side, side)
+    for axis in (1, 2, 3):
+        np.cumsum(moments, axis=axis, out=moments)
+
+    def variance(box: list[int], box_moments: NDArray[np.float64]) -> float:
+        r0, r1, g0, g1, b0, b1 = box
+        if (r1 - r0) * (g1 - g0) * (b1 - b0) <= 1:
+            return 0.0
+        weight, *sums, squares = box_moments.tolist()
+        return squares - sum(v * v for v in sums) / weight
+
+    # Split the highest-variance box until the palette is good enough
+    boxes = [[0, _WU_BINS, 0, _WU_BINS, 0, _WU_BINS]]
+    box_moments = [moments[:, -1, -1, -1]]
+    variances = [variance(boxes[0], box_moments[0])]
+    target = _WU_TARGET_ERROR * h * w
+    while len(boxes) < n_colors and sum(variances) > target:
+        k = max(range(len(variances)), key=variances.__getitem__)
+        if variances[k] <= 0:
+            break
+        box = boxes[k]
+        cut = _best_cut(moments, box)
+        if cut is None:
+            variances[k] = 0.0
+            continue
+        axis, position, lower, upper = cut
+        upper_box = box.copy()
+        box[2 * axis + 1] = position
+        upper_box[2 * axis] = position
+        boxes.append(upper_box)
+        box_moments[k] = lower
+        box_moments.append(upper)
+        variances[k] = variance(box, lower)
+        variances.append(variance(upper_box, upper))
+
+    sums = np.array(box_moments)[:, :4]
+    palette = (sums[:, 1:] / sums[:, :1]).astype(np.float32)
+    # Boxes of equal variance can be split in either order, so number them by
+    # color instead, keeping output independent of how pixels are repeated
+    order = np.lexsort(palette.T[::-1])
+    palette = palette[order]
+
+    # Label every histogram bin with its box, then look up each pixel's box
+    labels = np.zeros((side, side, side), dtype=np.uint8)
+    for k, box_index in enumerate(order):
+        r0, r1, g0, g1, b0, b1 = boxes[box_index]
+        labels[r0 + 1 : r1 + 1, g0 + 1 : g1 + 1, b0 + 1 : b1 + 1] = k
+    indices = labels.reshape(-1)[cell].reshape(h, w)
 
-    # Simple uniform quantization
-    # Compute number of levels per channel
-    levels = int(np.cbrt(n_colors))
-    levels = max(2, min(levels, 6))
-
-    # Quantize each channel
-    r = (colors[:, :, 0] * (levels - 0.001)).astype(np.uint8)
-    g = (colors[:, :, 1] * (levels - 0.001)).astype(np.uint8)
-    b = (colors[:, :, 2] * (levels - 0.001)).astype(np.uint8)
-
-    # Compute palette index
-    indices = r * levels * levels + g * levels + b
-
-    # Build palette
-    n_actual = levels**3
-    palette = np.zeros((n_actual, 3), dtype=np.float32)
-    for i in range(n_actual):
-        ri = i // (levels * levels)
-        gi = (i // levels) % levels
-        bi = i % levels
-        palette[i] = [
-            (ri + 0.5) / levels,
-            (gi + 0.5) / levels,
-            (bi + 0.5) / levels,
-        ]
-
-    return indices.astype(np.uint8), palette
+    return indices, palette
 
 
 def _quantize_grayscale(
@@ -96,10 +386,8 @@ def _quantize_grayscale(
     levels = min(n_colors, 256)
     indices = (bitmap * (levels - 0.001)).astype(np.uint8)
 
-    palette = np.zeros((levels, 3), dtype=np.float32)
-    for i in range(levels):
-        v = (i + 0.5) / levels
-        palette[i] = [v, v, v]
+    v = ((np.arange(levels) + 0.5) / levels).astype(np.float32)
+    palette = np.repeat(v[:, np.newaxis], 3, axis=1)
 
     return indices, palette
 
@@ -113,7 +401,8 @@ class SixelRenderer:
     mlterm, WezTerm, foot, and some other terminals.
 
     Attributes:
-        max_colors: Maximum colors in palette (default 256).
+        max_colors: Maximum colors in palette (default 256; at most 255 are
+            used, as one index is reserved for padding rows).
         scale: Pixel scaling factor (default 1).
 
     Example:
@@ -182,88 +471,52 @@ class SixelRenderer:
                     f"colors shape {colors.shape[:2]} must match bitmap shape {bitmap.shape}"
                 )
 
+        # Quantize to palette. This is per pixel, so it is done before
+        # scaling and padding, which then copy uint8 indices rather than
+        # float colors.
+        if colors is not None:
+            indices, palette = _quantize_colors(colors, min(self.max_colors, _PAD_INDEX))
+        else:
+            indices, palette = _quantize_grayscale(bitmap, min(self.max_colors, 64))
+
         # Scale up if requested
         if self.scale > 1:
-            bitmap = np.repeat(np.repeat(bitmap, self.scale, axis=0), self.scale, axis=1)
-            if colors is not None:
-                colors = np.repeat(np.repeat(colors, self.scale, axis=0), self.scale, axis=1)
+            indices = np.repeat(np.repeat(indices, self.scale, axis=0), self.scale, axis=1)
 
-        h, w = bitmap.shape
+        h, w = indices.shape
 
-        # Pad height to multiple of 6
+        # Pad height to multiple of 6 with rows that are left unpainted
         pad_h = (6 - h % 6) % 6
         if pad_h > 0:
-            bitmap = np.pad(bitmap, ((0, pad_h), (0, 0)), constant_values=0)
-            if colors is not None:
-                colors = np.pad(colors, ((0, pad_h), (0, 0), (0, 0)), constant_values=0)
-            h = bitmap.shape[0]
-
-        # Quantize to palette
-        if colors is not None:
-            indices, palette = _quantize_colors(colors, self.max_colors)
-        else:
-            indices, palette = _quantize_grayscale(bitmap, min(self.max_colors, 64))
+            padded = np.empty((h + pad_h, w), dtype=indices.dtype)
+            padded[:h] = indices
+            padded[h:] = _PAD_INDEX
+            indices = padded
+            h += pad_h
 
         n_colors = len(palette)
 
-        # Write sixel sequence
-        dest.write(DCS_START)
-
-        # Define color palette (RGB percentages 0-100)
-        for i, (r, g, b) in enumerate(palette):
-            ri, gi, bi = int(r * 100), int(g * 100), int(b * 100)
-            dest.write(f"#{i};2;{ri};{gi};{bi}")
+        # Write sixel sequence, with the color palette (RGB percentages 0-100)
+        # in the header
+        palette_pct = (palette * 100).astype(int).tolist()
+        dest.write(
+            DCS_START
+            + "".join(f"#{i};2;{r};{g};{b}" for i, (r, g, b) in enumerate(palette_pct))
+        )
 
-        # Encode pixel data in 6-row bands
+        # Encode pixel data in 6-row bands, one write per band
+        use_numba = use_kernels(indices.size, _KERNEL_MIN_PIXELS)
+        if use_numba:
+            present = np.empty(n_colors, dtype=np.bool_)
+            buf = np.empty(n_colors * (w + 5) + 1, dtype=np.uint8)
         for band_y in range(0, h, 6):
             band = indices[band_y : band_y + 6, :]  # 6 x W
 
-            # For each color, output pixels that use that color
-            for color_idx in range(n_colors):
-                # Create mask of pixels with this color
-                mask = band == color_idx
-
-                # Skip if no pixels use this color
-                if not mask.any():
-                    continue
-
-                # Select color
-                dest.write(f"#{color_idx}")
-
-                # Encode each column
-                x = 0
-                while x < w:
-                    # Get 6-bit pattern for this column
-                    pattern = 0
-                    for bit in range(6):
-                        if mask[bit, x]:
-                            pattern |= 1 << bit
-
-                    # Check for run-length encoding opportunity
-                    run_len = 1
-                    while x + run_len < w and run_len < 255:
-                        next_pattern = 0
-                        for bit in range(6):
-                            if mask[bit, x + run_len]:
-                                next_pattern |= 1 << bit
-                        if next_pattern != pattern:
-                            break
-                        run_len += 1
-
-                    # Encode
-                    char = chr(0x3F + pattern)  # '?' = 0, '~' = 63
-                    if run_len > 3:
-                        dest.write(f"!{run_len}{char}")
-                    else:
-                        dest.write(char * run_len)
-
-                    x += run_len
-
-                # Carriage return to start of row (for next color)
-                dest.write("$")
-
-            # Line feed to next 6-row band
-            dest.write("-")
+            if use_numba:
+                n = _encode_band(band, present, buf)
+                dest.write(buf[:n].tobytes().decode("ascii"))
+            else:
+                dest.write(_encode_band_runs(band, n_colors))
 
         dest.write(DCS_END)
 
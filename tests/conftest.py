@@ -0,0 +1,21 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+import importlib
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _glyph_cache_dir(tmp_path, monkeypatch):
+    """Keep the fingerprint glyph cache out of the real ~/.cache during tests."""
+    fingerprint = importlib.import_module("dapple.renderers.fingerprint")
+    monkeypatch.setattr(fingerprint, "_GLYPH_CACHE_DIR", tmp_path / "glyph-cache")
+
+
+@pytest.fixture(autouse=True)
+def _kernel_thresholds(monkeypatch):
+    """Undo enable_kernels() calls, such as vidcat's, after each test."""
+    jit = importlib.import_module("dapple._jit")
+    monkeypatch.setattr(jit, "_kernels_enabled", False)
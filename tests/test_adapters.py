@@ -137,6 +137,19 @@ class TestPILAdapter:
         assert canvas.colors is not None
         assert canvas.colors.shape == (15, 30, 3)
 
+    def test_from_pil_scales_bytes_exactly(self):
+        """Every byte value maps to exactly value / 255 in float32."""
+        from PIL import Image
+        from dapple.adapters.pil import from_pil
+
+        values = np.arange(256, dtype=np.uint8).reshape(16, 16)
+        expected = values.astype(np.float32) / np.float32(255.0)
+        gray = from_pil(Image.fromarray(values))
+        rgb = from_pil(Image.fromarray(np.stack([values] * 3, axis=2)))
+        np.testing.assert_array_equal(gray.bitmap, expected)
+        np.testing.assert_array_equal(rgb.colors[..., 1], expected)
+        assert rgb.colors.dtype == np.float32
+
     def test_from_pil_palette_mode(self):
         """P mode (palette) image converts to grayscale."""
         from PIL import Image
@@ -237,6 +250,20 @@ class TestPILAdapter:
         assert canvas.pixel_height == 25
         assert canvas.pixel_width == 50  # proportional
 
+    def test_load_image_16bit_downscale(self, tmp_path):
+        """16-bit grayscale images can be shrunk by large factors."""
+        from PIL import Image
+        from dapple.adapters.pil import load_image
+
+        values = np.linspace(0, 65535, 1600 * 1200).reshape(1200, 1600)
+        path = tmp_path / "deep.png"
+        Image.fromarray(values.astype(np.uint16)).save(path)
+        assert Image.open(path).mode.startswith("I;16")
+
+        canvas = load_image(path, width=40)
+        assert canvas.shape == (30, 40)
+        assert canvas.colors is None
+
 
 # ─── MatplotlibAdapter ───────────────────────────────────────────────────────
 
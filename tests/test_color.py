@@ -69,3 +69,23 @@ class TestLuminance:
         expected = 0.299 * rgb[:, :, 0] + 0.587 * rgb[:, :, 1] + 0.114 * rgb[:, :, 2]
         result = luminance(rgb)
         np.testing.assert_allclose(result, expected, atol=1e-6)
+
+    def test_strided_view(self):
+        """RGB views into wider arrays (e.g. RGBA[..., :3]) are handled."""
+        rgba = np.random.rand(6, 7, 4).astype(np.float32)
+        np.testing.assert_allclose(
+            luminance(rgba[..., :3]), luminance(rgba[..., :3].copy()), atol=1e-6
+        )
+
+    def test_rgba_ignores_alpha(self):
+        """(..., 4) RGBA input uses the RGB channels only."""
+        rgba = np.random.rand(5, 6, 4).astype(np.float32)
+        result = luminance(rgba)
+        assert result.shape == (5, 6)
+        np.testing.assert_allclose(result, luminance(rgba[..., :3]), atol=1e-6)
+
+    def test_single_pixel_scalar(self):
+        """A single (3,) pixel gives a float32 scalar, not a 0-d array."""
+        result = luminance(np.array([1.0, 0.0, 0.0]))
+        assert isinstance(result, np.float32)
+        assert result == pytest.approx(0.299)
@@ -123,3 +123,13 @@ class TestApplyPreprocessing:
         assert result.shape == bitmap.shape
         unique = set(np.unique(result))
         assert unique <= {0.0, 1.0}
+
+    @pytest.mark.parametrize("flag", ["contrast", "dither", "invert"])
+    def test_read_only_input(self, flag):
+        """Transforms return new arrays, so read-only input needs no copy."""
+        bitmap = self._make_bitmap()
+        original = bitmap.copy()
+        bitmap.flags.writeable = False
+        result = apply_preprocessing(bitmap, **{flag: True})
+        assert result is not bitmap
+        np.testing.assert_array_equal(bitmap, original)
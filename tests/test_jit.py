@@ -0,0 +1,124 @@
+"""Tests for dapple._jit optional Numba support."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from io import StringIO
+
+import numpy as np
+import pytest
+
+from dapple import _jit
+
+
+@pytest.fixture
+def broken_numba(monkeypatch):
+    """Make Numba look installed but fail to import."""
+    monkeypatch.setattr(_jit, "HAS_NUMBA", True)
+    monkeypatch.setattr(_jit, "_numba_njit", None)
+    monkeypatch.setattr(_jit, "_numba_import_failed", False)
+    monkeypatch.setitem(sys.modules, "numba", None)  # import raises ImportError
+
+
+class TestNumbaFallback:
+    """Kernels and renderers keep working when Numba cannot be imported."""
+
+    def test_kernel_runs_as_python(self, broken_numba):
+        """A decorated function falls back to its Python definition."""
+
+        def add(a, b):
+            return a + b
+
+        kernel = _jit.njit(cache=True)(add)
+        assert kernel(2, 3) == 5
+        assert kernel._impl is add
+        assert not _jit.numba_ready()
+
+    def test_renderers_take_numpy_path(self, broken_numba, monkeypatch):
+        """Renderers use their NumPy path instead of uncompiled kernels."""
+        import importlib
+
+        from dapple import braille, quadrants, sextants, sixel
+
+        bitmap = np.random.rand(13, 17).astype(np.float32)
+        colors = np.random.rand(13, 17, 3).astype(np.float32)
+        monkeypatch.setattr(_jit, "_kernels_enabled", True)
+        for renderer in (braille, quadrants, sextants, sixel):
+            mod = importlib.import_module(type(renderer).__module__)
+            kernels = [v for v in vars(mod).values() if isinstance(v, _jit._LazyJit)]
+            for kernel in kernels:
+                monkeypatch.setattr(kernel, "_impl", None)
+
+            buf = StringIO()
+            renderer.render(bitmap, colors, dest=buf)
+            assert buf.getvalue()
+            assert all(kernel._impl is None for kernel in kernels)
+
+    def test_missing_numba(self, monkeypatch):
+        """Without Numba installed, nothing is imported and kernels are Python."""
+        monkeypatch.setattr(_jit, "HAS_NUMBA", False)
+        monkeypatch.setattr(_jit, "_numba_njit", None)
+        monkeypatch.setattr(_jit, "_numba_import_failed", False)
+        assert not _jit.numba_ready()
+
+
+class TestKernelThresholds:
+    """Numba is only imported for large inputs or after enable_kernels()."""
+
+    @pytest.fixture
+    def unimported(self, monkeypatch):
+        """Make Numba look installed but not yet imported."""
+        monkeypatch.setattr(_jit, "HAS_NUMBA", True)
+        monkeypatch.setattr(_jit, "_numba_njit", None)
+        monkeypatch.setattr(_jit, "_numba_import_failed", False)
+
+    def test_small_input_does_not_import(self, unimported):
+        """Inputs below the threshold take the fallback without importing."""
+        assert not _jit.use_kernels(100, 1000)
+        assert not _jit.use_kernels(10**9)
+        assert _jit._numba_njit is None
+        assert not _jit._numba_import_failed
+
+    def test_large_input_or_enabled(self, unimported):
+        """Large inputs, or any input after enable_kernels(), use kernels."""
+        ready = _jit.numba_ready()
+        assert _jit.use_kernels(1000, 1000) == ready
+        assert not _jit.use_kernels(1000)
+        _jit.enable_kernels()
+        assert _jit.use_kernels(1) == ready
+        _jit.enable_kernels(False)
+        assert not _jit.use_kernels(1)
+
+    def test_missing_numba(self, monkeypatch):
+        """Without Numba installed, kernels are never used."""
+        monkeypatch.setattr(_jit, "HAS_NUMBA", False)
+        _jit.enable_kernels()
+        assert not _jit.use_kernels(10**9, 1)
+
+    @pytest.mark.parametrize(
+        "call",
+        [
+            "braille.render(bitmap, colors, dest=io.StringIO())",
+            "braille(color_mode='truecolor').render(bitmap, colors, dest=io.StringIO())",
+            "quadrants.render(bitmap, dest=io.StringIO())",
+            "quadrants.render(bitmap, colors, dest=io.StringIO())",
+            "sextants.render(bitmap, dest=io.StringIO())",
+            "sextants.render(bitmap, colors, dest=io.StringIO())",
+            "sixel.render(bitmap, colors, dest=io.StringIO())",
+            "floyd_steinberg(bitmap)",
+        ],
+    )
+    def test_small_render_does_not_import_numba(self, call):
+        """A terminal-sized render stays on the NumPy path in a fresh process."""
+        code = (
+            "import io, sys; import numpy as np; "
+            "from dapple import braille, floyd_steinberg, quadrants, sextants, sixel; "
+            "bitmap = np.random.rand(96, 160).astype(np.float32); "
+            "colors = np.random.rand(96, 160, 3).astype(np.float32); "
+            f"{call}; print('numba' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
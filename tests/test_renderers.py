@@ -1,5 +1,6 @@
 """Tests for renderers."""
 
+import re
 from io import StringIO
 
 import numpy as np
@@ -128,6 +129,100 @@ class TestBrailleRenderer:
         result = render_to_string(braille(color_mode="truecolor"), bitmap, colors)
         assert "\033[38;2;255;0;0m" in result or "\033[38;2;254" in result
 
+    def test_render_dot_bits(self):
+        """render() sets the Unicode braille bit for each lit dot."""
+        for row, col, bit in [
+            (0, 0, 0), (1, 0, 1), (2, 0, 2), (3, 0, 6),
+            (0, 1, 3), (1, 1, 4), (2, 1, 5), (3, 1, 7),
+        ]:
+            bitmap = np.zeros((4, 2), dtype=np.float32)
+            bitmap[row, col] = 1.0
+            assert render_to_string(braille, bitmap) == chr(0x2800 + (1 << bit))
+
+    def test_render_partial_cells(self):
+        """render() pads partial cells with unlit dots."""
+        bitmap = np.ones((5, 3), dtype=np.float32)
+        result = render_to_string(braille, bitmap)
+        # Right column cells only have their left dots; bottom row only its top dots
+        assert result == "\u28ff\u2847\n\u2809\u2801"
+
+    def test_render_color_exact_output(self):
+        """Color modes prefix every cell with its escape and reset each row."""
+        bitmap = np.zeros((8, 4), dtype=np.float32)
+        bitmap[:4, :2] = 1.0
+        gray = render_to_string(braille(color_mode="grayscale"), bitmap)
+        assert gray == (
+            "\033[38;5;255m\u28ff\033[38;5;232m\u2800\033[0m\n"
+            "\033[38;5;232m\u2800\033[38;5;232m\u2800\033[0m"
+        )
+
+        colors = np.zeros((8, 4, 3), dtype=np.float32)
+        colors[:4, :2] = [1.0, 0.5, 0.0]
+        true = render_to_string(braille(color_mode="truecolor"), bitmap, colors)
+        assert true.split("\n")[0] == (
+            "\033[38;2;255;127;0m\u28ff\033[38;2;0;0;0m\u2800\033[0m"
+        )
+
+    def test_braille_codes_kernel_matches_dot_map(self):
+        """The Numba encoding kernel sets the DOT_MAP bits of each cell."""
+        from dapple._jit import HAS_NUMBA
+        from dapple.renderers.braille import DOT_MAP, _braille_codes
+
+        padded = np.random.rand(16, 12).astype(np.float32)
+        expected = np.full((4, 6), 0x2800, dtype=np.uint16)
+        for row, col, bit in DOT_MAP:
+            expected |= (padded[row::4, col::2] > 0.5).astype(np.uint16) << bit
+        for y in range(4):
+            for x in range(6):
+                cell = padded[y * 4 : y * 4 + 4, x * 2 : x * 2 + 2]
+                code = sum(1 << b for r, c, b in DOT_MAP if cell[r, c] > 0.5)
+                assert expected[y, x] == 0x2800 + code
+
+        python = np.empty((4, 6), dtype=np.uint16)
+        _braille_codes.py_func(padded, np.float32(0.5), python)
+        np.testing.assert_array_equal(python, expected)
+
+        if HAS_NUMBA:
+            compiled = np.empty((4, 6), dtype=np.uint16)
+            _braille_codes(padded, np.float32(0.5), compiled)
+            np.testing.assert_array_equal(compiled, expected)
+
+    def test_render_without_numba_matches(self, monkeypatch):
+        """The NumPy encoding path gives the same output as the kernel."""
+        import importlib
+
+        jit = importlib.import_module("dapple._jit")
+        bitmap = np.random.rand(37, 51).astype(np.float32)
+        monkeypatch.setattr(jit, "_kernels_enabled", True)
+        expected = render_to_string(braille, bitmap)
+        monkeypatch.setattr(jit, "_kernels_enabled", False)
+        assert render_to_string(braille, bitmap) == expected
+
+    def test_render_partial_cell_average(self):
+        """Color averages only cover pixels inside the bitmap."""
+        bitmap = np.ones((4, 3), dtype=np.float32)
+        result = render_to_string(braille(color_mode="grayscale"), bitmap)
+        # The half-width right cell is fully bright, not diluted by padding
+        assert result.count("\033[38;5;255m") == 2
+
+    def test_render_cell_average_matches_mean(self):
+        """Cell colors match a float32 per-cell mean, edge cells included."""
+        rng = np.random.default_rng(4)
+        bitmap = rng.random((203, 201)).astype(np.float32)
+        colors = rng.random((203, 201, 3)).astype(np.float32)
+        gray_expected, rgb_expected = [], []
+        for y in range(0, 203, 4):
+            for x in range(0, 201, 2):
+                level = int(bitmap[y:y + 4, x:x + 2].mean() * 23.999)
+                gray_expected.append(f"\033[38;5;{232 + level}m")
+                r, g, b = (colors[y:y + 4, x:x + 2].mean(axis=(0, 1)) * 255.999).astype(int)
+                rgb_expected.append(f"\033[38;2;{r};{g};{b}m")
+
+        gray = render_to_string(braille(color_mode="grayscale"), bitmap)
+        rgb = render_to_string(braille(color_mode="truecolor"), bitmap, colors)
+        assert re.findall(r"\033\[38;5;\d+m", gray) == gray_expected
+        assert re.findall(r"\033\[38;2;[\d;]+m", rgb) == rgb_expected
+
     def test_call_creates_new_instance(self):
         """__call__ creates new renderer with options."""
         custom = braille(threshold=0.3, color_mode="grayscale")
@@ -207,6 +302,121 @@ class TestQuadrantsRenderer:
         result = render_to_string(quadrants, bitmap)
         assert result == ""  # Too small for even one block
 
+    def test_render_exact_output(self):
+        """Cells set fg and bg colors before the block character."""
+        bitmap = np.array([[1.0, 0.0, 0.5, 0.5], [1.0, 0.0, 0.5, 0.5]], dtype=np.float32)
+        assert render_to_string(quadrants, bitmap) == (
+            "\033[38;2;255;255;255m\033[48;2;0;0;0m▌\033[38;2;127;127;127m█\033[0m"
+        )
+        assert render_to_string(quadrants(true_color=False), bitmap) == (
+            "\033[38;5;255m\033[48;5;232m▌\033[38;5;243m█\033[0m"
+        )
+
+        colors = np.zeros((2, 4, 3), dtype=np.float32)
+        colors[:, 0] = [1.0, 0.5, 0.0]
+        colors[:, 2:] = [0.0, 0.0, 1.0]
+        assert render_to_string(quadrants, bitmap, colors) == (
+            "\033[38;2;255;127;0m\033[48;2;0;0;0m▌\033[38;2;0;0;255m█\033[0m"
+        )
+        assert render_to_string(quadrants(true_color=False), bitmap, colors) == (
+            "\033[38;5;208m\033[48;5;16m▌\033[38;5;21m█\033[0m"
+        )
+
+    def test_render_skips_repeated_colors(self):
+        """Colors are only re-emitted when they change within a row."""
+        bitmap = np.zeros((4, 8), dtype=np.float32)
+        bitmap[:, ::2] = 1.0  # every block is ▌ in the same colors
+        result = render_to_string(quadrants, bitmap)
+        row = "\033[38;2;255;255;255m\033[48;2;0;0;0m▌▌▌▌\033[0m"
+        assert result == row + "\n" + row
+
+        colors = np.zeros((2, 8, 3), dtype=np.float32)
+        colors[:, 2:6] = [0.0, 1.0, 0.0]  # full blocks keep the previous bg
+        colors[:, 1] = [1.0, 0.0, 0.0]
+        result = render_to_string(quadrants(true_color=False), bitmap[:2], colors)
+        assert result == (
+            "\033[38;5;196m\033[48;5;16m▐\033[38;5;46m██\033[38;5;16m█\033[0m"
+        )
+
+    def test_quadrant_bytes_match_chars(self):
+        """QUADRANT_BYTES holds the UTF-8 encoding of each pattern's char."""
+        from dapple.renderers.quadrants import QUADRANT_BYTES, QUADRANT_CHARS
+
+        assert [b.decode("utf-8") for b in QUADRANT_BYTES] == QUADRANT_CHARS
+
+    @pytest.mark.parametrize("with_colors", [False, True])
+    def test_render_writes_once(self, with_colors):
+        """The whole frame goes to dest in a single write."""
+        writes = []
+
+        class Recorder(StringIO):
+            def write(self, s):
+                writes.append(s)
+                return super().write(s)
+
+        bitmap = np.random.rand(12, 10).astype(np.float32)
+        colors = np.random.rand(12, 10, 3).astype(np.float32) if with_colors else None
+        quadrants.render(bitmap, colors, dest=Recorder())
+        assert len(writes) == 1
+        assert writes[0].count("\n") == 5
+
+    def test_render_clamps_out_of_range(self):
+        """Values outside 0-1 give the nearest valid color codes."""
+        bitmap = np.array([[1.5, -0.5], [1.5, -0.5]], dtype=np.float32)
+        assert render_to_string(quadrants, bitmap) == (
+            "\033[38;2;255;255;255m\033[48;2;0;0;0m▌\033[0m"
+        )
+        colors = np.array([[[2.0, 0.5, -1.0], [-1.0, -1.0, -1.0]]] * 2, dtype=np.float32)
+        assert render_to_string(quadrants(true_color=False), bitmap, colors) == (
+            "\033[38;5;208m\033[48;5;16m▌\033[0m"
+        )
+
+    def test_quadrant_kernels_match_python(self):
+        """The Numba block kernels agree with their pure-Python versions."""
+        from dapple._jit import HAS_NUMBA
+        from dapple.renderers.quadrants import _quadrant_gray, _quadrant_rgb
+
+        colors = np.random.rand(10, 14, 3).astype(np.float32)
+        colors[:4, :4] = 0.25  # uniform blocks
+        lum = colors.mean(axis=2)
+
+        def run(gray, rgb):
+            out = (
+                np.empty((5, 7), np.uint8),
+                np.empty((5, 7), np.float32),
+                np.empty((5, 7), np.float32),
+            )
+            gray(lum, *out)
+            out_rgb = (
+                np.empty((5, 7), np.uint8),
+                np.empty((5, 7, 3), np.float32),
+                np.empty((5, 7, 3), np.float32),
+            )
+            rgb(lum, colors, *out_rgb)
+            return out + out_rgb
+
+        python = run(_quadrant_gray.py_func, _quadrant_rgb.py_func)
+        assert (python[0][:2, :2] == 0b1111).all()
+        np.testing.assert_array_equal(python[4][:2, :2], colors[:4:2, :4:2])
+        if HAS_NUMBA:
+            for got, expected in zip(run(_quadrant_gray, _quadrant_rgb), python):
+                np.testing.assert_array_equal(got, expected)
+
+    @pytest.mark.parametrize("true_color", [True, False])
+    def test_render_without_numba_matches(self, monkeypatch, true_color):
+        """The NumPy block path gives the same output as the kernels."""
+        import importlib
+
+        jit = importlib.import_module("dapple._jit")
+        renderer = quadrants(true_color=true_color)
+        bitmap = np.random.rand(31, 45).astype(np.float32)
+        colors = np.random.rand(31, 45, 3).astype(np.float32)
+        colors[4:10, 6:12] = 0.5  # uniform blocks
+        monkeypatch.setattr(jit, "_kernels_enabled", True)
+        expected = [render_to_string(renderer, bitmap, c) for c in (None, colors)]
+        monkeypatch.setattr(jit, "_kernels_enabled", False)
+        assert [render_to_string(renderer, bitmap, c) for c in (None, colors)] == expected
+
 
 class TestSextantsRenderer:
     """Tests for SextantsRenderer."""
@@ -254,6 +464,108 @@ class TestSextantsRenderer:
         assert "\033[38;5;" in result  # 256-color foreground
         assert "\033[48;5;" in result  # 256-color background
 
+    def test_render_clamps_out_of_range(self):
+        """Values outside 0-1 map to the nearest table entry."""
+        bitmap = np.array([[1.5, -0.5]] * 3, dtype=np.float32)
+        assert render_to_string(sextants(true_color=False), bitmap) == (
+            "\033[38;5;255m\033[48;5;232m▌\033[0m"
+        )
+        colors = np.array([[[2.0, 0.5, -1.0], [-1.0, -1.0, -1.0]]] * 3, dtype=np.float32)
+        assert render_to_string(sextants(true_color=False), bitmap, colors) == (
+            "\033[38;5;208m\033[48;5;16m▌\033[0m"
+        )
+        assert render_to_string(sextants, bitmap) == (
+            "\033[38;2;255;255;255m\033[48;2;0;0;0m▌\033[0m"
+        )
+        assert render_to_string(sextants, bitmap, colors) == (
+            "\033[38;2;255;127;0m\033[48;2;0;0;0m▌\033[0m"
+        )
+
+    def test_render_exact_output(self):
+        """Rows hold fg, bg and character per cell, each ending in a reset."""
+        bitmap = np.zeros((6, 4), dtype=np.float32)
+        bitmap[:3, 0] = 1.0  # left half of the first cell
+        bitmap[3:] = 0.5  # uniform second row
+        result = render_to_string(sextants(true_color=False), bitmap)
+        assert result == (
+            "\033[38;5;255m\033[48;5;232m▌\033[38;5;232m\033[48;5;232m█\033[0m\n"
+            "\033[38;5;243m\033[48;5;243m█\033[38;5;243m\033[48;5;243m█\033[0m"
+        )
+
+    def test_sextant_kernels_match_python(self):
+        """The Numba block kernels agree with their pure-Python versions."""
+        from dapple._jit import HAS_NUMBA
+        from dapple.renderers.sextants import _sextant_gray, _sextant_rgb
+
+        bitmap = np.random.rand(15, 14).astype(np.float32)
+        bitmap[:3, :2] = 0.25  # uniform block
+        lum = np.random.rand(5, 7, 6).astype(np.float32)
+        lum[0, 0] = 0.5  # uniform block
+        blocks = np.random.rand(3, 5, 7, 6).astype(np.float32)
+
+        def run(gray, rgb):
+            out = (
+                np.empty((5, 7), np.uint8),
+                np.empty((5, 7), np.float32),
+                np.empty((5, 7), np.float32),
+            )
+            gray(bitmap, *out)
+            out_rgb = (
+                np.empty((5, 7), np.uint8),
+                np.empty((5, 7, 3), np.float32),
+                np.empty((5, 7, 3), np.float32),
+            )
+            rgb(lum, blocks, *out_rgb)
+            return out + out_rgb
+
+        python = run(_sextant_gray.py_func, _sextant_rgb.py_func)
+        assert python[0][0, 0] == python[3][0, 0] == 0b111111
+        np.testing.assert_array_equal(python[4][0, 0], blocks[:, 0, 0].mean(axis=1))
+        if HAS_NUMBA:
+            for got, expected in zip(run(_sextant_gray, _sextant_rgb), python):
+                np.testing.assert_array_equal(got, expected)
+
+    @pytest.mark.parametrize("true_color", [True, False])
+    def test_render_without_numba_matches(self, monkeypatch, true_color):
+        """The NumPy block path gives the same output as the kernels."""
+        import importlib
+
+        jit = importlib.import_module("dapple._jit")
+        renderer = sextants(true_color=true_color)
+        bitmap = np.random.rand(31, 45).astype(np.float32)
+        colors = np.random.rand(31, 45, 3).astype(np.float32)
+        colors[6:12, 6:12] = 0.5  # uniform blocks
+        monkeypatch.setattr(jit, "_kernels_enabled", True)
+        expected = [render_to_string(renderer, bitmap, c) for c in (None, colors)]
+        monkeypatch.setattr(jit, "_kernels_enabled", False)
+        assert [render_to_string(renderer, bitmap, c) for c in (None, colors)] == expected
+
+    def test_sextant_table(self):
+        """Patterns map to the Unicode sextants, skipping the half blocks."""
+        from dapple.renderers.sextants import SEXTANT_CHARS
+
+        assert len(set(SEXTANT_CHARS)) == 64
+        assert SEXTANT_CHARS[0] == " "
+        assert SEXTANT_CHARS[63] == "█"
+        assert SEXTANT_CHARS[42] == "▌"  # cells 0, 2, 4
+        assert SEXTANT_CHARS[21] == "▐"  # cells 1, 3, 5
+        assert SEXTANT_CHARS[32] == "\U0001fb00"  # top-left only
+        assert SEXTANT_CHARS[62] == "\U0001fb1d"  # all but bottom-right
+        assert SEXTANT_CHARS[1] == "\U0001fb1e"  # bottom-right only
+
+    @pytest.mark.parametrize("pattern", range(1, 63))
+    def test_render_patterns(self, pattern):
+        """Lit cells map to the sextant with the matching bits (cell 0 = 32)."""
+        from dapple.renderers.sextants import SEXTANT_CHARS
+
+        bits = [(pattern >> (5 - k)) & 1 for k in range(6)]
+        bitmap = np.array(bits, dtype=np.float32).reshape(3, 2)
+        result = render_to_string(sextants, bitmap)
+        assert result.endswith(SEXTANT_CHARS[pattern] + "\033[0m")
+        colors = np.repeat(bitmap[:, :, np.newaxis], 3, axis=2)
+        result = render_to_string(sextants, bitmap, colors)
+        assert result.endswith(SEXTANT_CHARS[pattern] + "\033[0m")
+
     def test_render_with_rgb_colors(self):
         """render() uses RGB colors array."""
         bitmap = np.ones((6, 4), dtype=np.float32)
@@ -332,6 +644,83 @@ class TestAsciiRenderer:
         with pytest.raises(ValueError, match="charset must not be empty"):
             render_to_string(ascii(charset=""), np.zeros((4, 4)))
 
+    def test_render_exact_output(self):
+        """render() maps each cell to its charset entry, rows joined by newlines."""
+        bitmap = np.array(
+            [[0.0, 0.5, 1.0], [0.0, 0.5, 1.0], [1.0, 0.0, 0.3], [1.0, 0.0, 0.3]],
+            dtype=np.float32,
+        )
+        result = render_to_string(ascii(charset=" .oO@"), bitmap)
+        assert result == " o@\n@ ."
+
+    def test_render_leaves_bitmap_untouched(self):
+        """render() maps brightness in place without modifying the input."""
+        bitmap = np.linspace(0, 1, 16).reshape(4, 4)
+        original = bitmap.copy()
+        render_to_string(ascii(invert=True), bitmap)
+        np.testing.assert_array_equal(bitmap, original)
+
+    def test_render_invert_matches_inverted_bitmap(self):
+        """invert=True renders like the normal renderer on 1 - bitmap."""
+        bitmap = np.repeat(np.random.rand(10, 30), 2, axis=0)  # exact row means
+        charset = " .:-=+*#%@"
+        inverted = render_to_string(ascii(charset=charset, invert=True), bitmap)
+        assert inverted == render_to_string(ascii(charset=charset), 1.0 - bitmap)
+
+    def test_render_invert_mid_gray(self):
+        """Mid-gray maps to the same character inverted or not."""
+        bitmap = np.full((2, 3), 0.5, dtype=np.float32)
+        normal = render_to_string(ascii, bitmap)
+        assert normal == "==="
+        assert render_to_string(ascii(invert=True), bitmap) == normal
+
+    def test_render_breakpoints(self):
+        """breakpoints place the character boundaries explicitly."""
+        bitmap = np.array([[0.05, 0.15, 0.3, 0.6, 0.95]] * 2)
+        renderer = ascii(charset=" .oO@", breakpoints=(0.1, 0.2, 0.5, 0.8))
+        assert render_to_string(renderer, bitmap) == " .oO@"
+        inverted = renderer(invert=True)
+        assert render_to_string(inverted, bitmap) == "@@Oo "
+
+    @pytest.mark.parametrize(
+        "breakpoints", [[0.1, 0.2, 0.5, 0.8], np.array([0.1, 0.2, 0.5, 0.8])]
+    )
+    def test_breakpoints_from_sequence(self, breakpoints):
+        """Lists and arrays passed to the constructor are stored as tuples."""
+        renderer = AsciiRenderer(charset=" .oO@", breakpoints=breakpoints)
+        assert renderer.breakpoints == (0.1, 0.2, 0.5, 0.8)
+        bitmap = np.array([[0.05, 0.15, 0.3, 0.6, 0.95]] * 2)
+        assert render_to_string(renderer, bitmap) == " .oO@"
+        assert render_to_string(ascii(breakpoints=breakpoints, charset=" .oO@"), bitmap) == (
+            " .oO@"
+        )
+
+    def test_breakpoints_validation(self):
+        """breakpoints must match the charset and increase."""
+        bitmap = np.zeros((2, 2))
+        with pytest.raises(ValueError, match="len\\(charset\\) - 1"):
+            render_to_string(ascii(charset=" .o", breakpoints=(0.5,)), bitmap)
+        with pytest.raises(ValueError, match="strictly increasing"):
+            render_to_string(ascii(charset=" .o", breakpoints=(0.6, 0.3)), bitmap)
+
+    def test_render_clamps_out_of_range(self):
+        """Values outside 0-1 map to the first or last character."""
+        bitmap = np.array([[-3.0, 0.0, 1.0, 2.5]] * 2)
+        assert render_to_string(ascii, bitmap) == "  @@"
+
+    def test_render_large_charset(self):
+        """Charsets longer than 256 characters still index correctly."""
+        charset = "".join(chr(0x100 + i) for i in range(300))
+        bitmap = np.array([[0.0, 0.5, 1.0]] * 2)
+        result = render_to_string(ascii(charset=charset), bitmap)
+        assert result == charset[0] + charset[149] + charset[-1]
+
+    def test_render_non_ascii_charset(self):
+        """render() handles multi-byte charsets such as block shades."""
+        bitmap = np.array([[0.0, 1.0], [0.0, 1.0]], dtype=np.float32)
+        result = render_to_string(ascii(charset=" ░▒▓█"), bitmap)
+        assert result == " █"
+
 
 class TestSixelRenderer:
     """Tests for SixelRenderer."""
@@ -373,6 +762,168 @@ class TestSixelRenderer:
         # 2x should have more data
         assert len(result_2x) > len(result_1x)
 
+    @pytest.mark.parametrize("scale", [2, 3])
+    def test_render_scale_matches_repeated_pixels(self, scale):
+        """Scaling gives the same image as rendering repeated pixels."""
+        bitmap = np.random.rand(5, 7).astype(np.float32)
+        colors = np.random.rand(5, 7, 3).astype(np.float32)
+        big = bitmap.repeat(scale, axis=0).repeat(scale, axis=1)
+        big_colors = colors.repeat(scale, axis=0).repeat(scale, axis=1)
+        assert render_to_string(sixel(scale=scale), bitmap) == render_to_string(sixel, big)
+        assert render_to_string(sixel(scale=scale), bitmap, colors) == (
+            render_to_string(sixel, big, big_colors)
+        )
+
+    def test_render_run_length(self):
+        """Runs longer than 3 columns are repeated, capped at 255 per repeat."""
+        bitmap = np.zeros((6, 300), dtype=np.float32)
+        bitmap[:, 297:] = 1.0
+        result = render_to_string(sixel, bitmap)
+        assert result.endswith("#0!255~!42~???$#63!255?!42?~~~$-\033\\")
+
+    def test_render_skips_absent_colors(self):
+        """Only palette colors that appear in a band are encoded."""
+        bitmap = np.zeros((12, 4), dtype=np.float32)
+        bitmap[6:] = 1.0
+        result = render_to_string(sixel, bitmap)
+        assert result.endswith("#63;2;99;99;99#0!4~$-#63!4~$-\033\\")
+
+    def test_render_writes_per_band(self):
+        """The header, each 6-row band and the terminator are single writes."""
+        writes = []
+
+        class Recorder(StringIO):
+            def write(self, s):
+                writes.append(s)
+                return super().write(s)
+
+        bitmap = np.random.rand(16, 10).astype(np.float32)
+        sixel.render(bitmap, dest=Recorder())
+        assert len(writes) == 5
+        assert writes[0].startswith("\033Pq#0;2;0;0;0#1;2;2;2;2")
+        assert all(band.endswith("$-") for band in writes[1:4])
+        assert writes[4] == "\033\\"
+
+    def test_quantize_palettes(self):
+        """Color palettes hold box means; grayscale palettes hold bin centers."""
+        from dapple.renderers.sixel import _quantize_colors, _quantize_grayscale
+
+        red, blue = [0.9, 0.1, 0.1], [0.1, 0.2, 0.8]
+        colors = np.array([[red, red, blue]], dtype=np.float32)
+        indices, palette = _quantize_colors(colors, 8)
+        assert palette.dtype == np.float32
+        assert len(palette) == 2
+        assert indices[0, 0] == indices[0, 1] != indices[0, 2]
+        np.testing.assert_allclose(palette[indices[0]], colors[0], atol=1e-6)
+
+        # Few colors split along the widest-spread axis first
+        ramp = np.linspace(0.0, 1.0, 64, dtype=np.float32)
+        gradient = np.stack([ramp, np.full(64, 0.5, np.float32), np.zeros(64, np.float32)], -1)
+        indices, palette = _quantize_colors(gradient[np.newaxis], 4)
+        assert len(palette) == 4
+        assert np.all(np.diff(palette[indices[0], 0]) >= 0)
+        np.testing.assert_allclose(palette[:, 1:], [[0.5, 0.0]] * 4, atol=1e-6)
+
+        indices, palette = _quantize_grayscale(np.array([[0.0, 1.0]]), 4)
+        np.testing.assert_allclose(palette, [[v, v, v] for v in (0.125, 0.375, 0.625, 0.875)])
+        assert indices.tolist() == [[0, 3]]
+
+    def test_quantize_empty_image(self):
+        """An empty image gets a single black palette entry."""
+        from dapple.renderers.sixel import _quantize_colors
+
+        indices, palette = _quantize_colors(np.zeros((0, 5, 3), dtype=np.float32), 256)
+        assert indices.shape == (0, 5)
+        assert palette.tolist() == [[0.0, 0.0, 0.0]]
+        result = render_to_string(sixel, np.zeros((0, 5)), np.zeros((0, 5, 3)))
+        assert result == "\033Pq#0;2;0;0;0\033\\"
+
+    def test_quantize_stops_when_close(self):
+        """Splitting stops once the palette is close, not at max_colors."""
+        from dapple.renderers.sixel import _quantize_colors
+
+        rng = np.random.default_rng(0)
+        flat = np.array([[0.9, 0.1, 0.1], [0.1, 0.2, 0.8], [0.2, 0.7, 0.2], [0.95, 0.9, 0.2]])
+        colors = flat[rng.integers(0, 4, (60, 80))] + rng.normal(0, 0.01, (60, 80, 3))
+        _, palette = _quantize_colors(colors.astype(np.float32), 256)
+        assert len(palette) == 4
+
+    def test_render_size_noisy_gradient(self):
+        """Noisy colors are not spread over more palette entries than needed."""
+        rng = np.random.default_rng(0)
+        y, x = np.mgrid[0:60, 0:80]
+        colors = np.stack([x / 80, y / 60, (x + y) / 140], axis=-1)
+        colors = np.clip(colors + rng.normal(0, 0.05, colors.shape), 0, 1).astype(np.float32)
+        result = render_to_string(sixel, colors.mean(axis=-1), colors)
+        # The uniform 216-color palette this quantizer replaced gave 10447
+        assert len(result) < 10447
+
+    def test_encode_band_matches_python(self):
+        """The Numba band encoder agrees with its pure-Python version."""
+        from dapple.renderers.sixel import _encode_band
+
+        band = np.random.randint(0, 4, (6, 400)).astype(np.uint8)
+        band[:, 50:320] = 1  # long run, split at 255 columns
+        band[0, :10] = 200  # outside the palette
+        out = np.empty(3 * 405 + 1, np.uint8)
+        py_out = np.empty_like(out)
+        n = _encode_band(band, np.empty(3, np.bool_), out)
+        assert n == _encode_band.py_func(band, np.empty(3, np.bool_), py_out)
+        assert out[:n].tobytes() == py_out[:n].tobytes()
+        assert out[:n].tobytes().startswith(b"#0")
+        assert b"#3" not in out[:n].tobytes()
+
+    @pytest.mark.parametrize("use_numba", [False, True])
+    def test_render_padding_rows_unpainted(self, monkeypatch, use_numba):
+        """Rows padding the height to a multiple of 6 are not drawn in any color."""
+        import importlib
+
+        monkeypatch.setattr(importlib.import_module("dapple._jit"), "_kernels_enabled", use_numba)
+        colors = np.empty((7, 4, 3), dtype=np.float32)
+        colors[:, :2] = [0.1, 0.8, 0.2]  # green
+        colors[:, 2:] = [0.9, 0.5, 0.1]  # orange
+        result = render_to_string(sixel, np.ones((7, 4), dtype=np.float32), colors)
+
+        palette = [tuple(map(int, entry.split(";")[2:])) for entry in result.split("#")[1:3]]
+        assert (0, 0, 0) not in palette
+        last_band = result.split("-")[1]
+        assert last_band == "#0@@??$#1??@@$"
+
+    @pytest.mark.parametrize("run_len", [3, 4, 255, 256, 510, 514])
+    def test_encode_band_runs_matches_kernel(self, run_len):
+        """The NumPy band encoder gives the same bytes as the kernel."""
+        from dapple.renderers.sixel import _encode_band, _encode_band_runs
+
+        band = np.random.randint(0, 4, (6, run_len + 20)).astype(np.uint8)
+        band[:, 10 : 10 + run_len] = 2
+        band[0, :5] = 200  # outside the palette
+        out = np.empty(3 * (run_len + 25) + 1, np.uint8)
+        n = _encode_band.py_func(band, np.empty(3, np.bool_), out)
+        assert _encode_band_runs(band, 3) == out[:n].tobytes().decode("ascii")
+
+    def test_encode_band_runs_all_padding(self):
+        """A band with no palette colors is just a line feed."""
+        from dapple.renderers.sixel import _encode_band, _encode_band_runs
+
+        band = np.full((6, 5), 200, dtype=np.uint8)
+        out = np.empty(16, np.uint8)
+        n = _encode_band.py_func(band, np.empty(64, np.bool_), out)
+        assert _encode_band_runs(band, 64) == out[:n].tobytes().decode("ascii") == "-"
+
+    @pytest.mark.parametrize("with_colors", [False, True])
+    def test_render_without_numba_matches(self, monkeypatch, with_colors):
+        """The NumPy run encoder gives the same output as the kernel."""
+        import importlib
+
+        jit = importlib.import_module("dapple._jit")
+        bitmap = np.random.rand(13, 600).astype(np.float32)
+        bitmap[:, 100:500] = 0.5  # runs longer than 255 columns
+        colors = np.random.rand(13, 600, 3).astype(np.float32) if with_colors else None
+        monkeypatch.setattr(jit, "_kernels_enabled", True)
+        expected = render_to_string(sixel, bitmap, colors)
+        monkeypatch.setattr(jit, "_kernels_enabled", False)
+        assert render_to_string(sixel, bitmap, colors) == expected
+
 
 class TestKittyRenderer:
     """Tests for KittyRenderer."""
@@ -472,6 +1023,42 @@ class TestKittyRenderer:
         assert "m=1" in result  # At least one continuation chunk
         assert "m=0" in result  # Final chunk
 
+    def test_render_chunks_reassemble(self, monkeypatch):
+        """Chunks carry the whole payload in order, whatever the batch size."""
+        import base64
+        import importlib
+
+        mod = importlib.import_module("dapple.renderers.kitty")
+        # 64x48 RGB = 9216 bytes = exactly three 3072-byte chunks
+        bitmap = np.random.rand(48, 64).astype(np.float32)
+        renderer = kitty(format="rgb", compression=False)
+        expected = (bitmap * 255).astype(np.uint8).repeat(3).tobytes()
+        outputs = []
+        for per_write in (1, 2, 64):
+            monkeypatch.setattr(mod, "_CHUNKS_PER_WRITE", per_write)
+            result = render_to_string(renderer, bitmap)
+            frames = result.split("\033\\")[:-1]
+            assert len(frames) == 3
+            assert all(f.split(";")[0].endswith(f"m={m}") for f, m in zip(frames, (1, 1, 0)))
+            payload = "".join(f.split(";", 1)[1] for f in frames)
+            assert base64.b64decode(payload) == expected
+            outputs.append(result)
+        assert outputs[0] == outputs[1] == outputs[2]
+
+    @pytest.mark.parametrize("compression", [False, True])
+    def test_render_strided_uint8_colors(self, compression):
+        """Non-contiguous uint8 colors are sent in row-major pixel order."""
+        import base64
+        import zlib
+
+        colors = np.random.randint(0, 256, (12, 10, 3), dtype=np.uint8).transpose(1, 0, 2)
+        bitmap = np.zeros(colors.shape[:2], dtype=np.float32)
+        result = render_to_string(kitty(format="rgb", compression=compression), bitmap, colors)
+        data = base64.b64decode(result.split(";", 1)[1].removesuffix("\033\\"))
+        if compression:
+            data = zlib.decompress(data)
+        assert data == colors.tobytes()
+
     def test_call_partial_update(self):
         """__call__() preserves defaults for unspecified params."""
         custom = kitty(format="rgb")
@@ -479,6 +1066,29 @@ class TestKittyRenderer:
         assert custom.compression == kitty.compression  # preserved
         assert custom.columns == kitty.columns  # preserved
         assert custom.rows == kitty.rows  # preserved
+        assert custom.deflate_level == kitty.deflate_level  # preserved
+        assert custom(deflate_level=1)(columns=10).deflate_level == 1
+
+    def test_render_deflate_level(self):
+        """Raw data uses deflate_level, else level 1 on a TTY and 6 elsewhere."""
+        import base64
+
+        from dapple.renderers.kitty import _deflate
+
+        class Terminal(StringIO):
+            def isatty(self):
+                return True
+
+        def payload(renderer, dest):
+            renderer.render(bitmap, dest=dest)
+            return base64.b64decode(dest.getvalue().split(";", 1)[1].removesuffix("\033\\"))
+
+        bitmap = np.tile(np.linspace(0, 1, 40, dtype=np.float32), (30, 1))
+        data = (bitmap * 255).astype(np.uint8).repeat(3).tobytes()
+        renderer = kitty(format="rgb")
+        assert payload(renderer, StringIO()) == _deflate(data, 6)
+        assert payload(renderer, Terminal()) == _deflate(data, 1)
+        assert payload(renderer(deflate_level=9), Terminal()) == _deflate(data, 9)
 
     def test_render_grayscale_bitmap_png(self):
         """render() handles grayscale-only bitmap in PNG format."""
@@ -514,6 +1124,49 @@ class TestKittyRenderer:
             kitty.format = "rgb"
 
 
+class TestDeflate:
+    """Tests for the _deflate helper."""
+
+    def test_output_is_zlib_stream(self):
+        """_deflate() output decompresses with stock zlib."""
+        import zlib
+
+        from dapple.renderers.kitty import _deflate
+
+        data = np.random.randint(0, 8, 10000, dtype=np.uint8).tobytes()
+        assert zlib.decompress(_deflate(data)) == data
+
+    def test_levels(self):
+        """Levels are clamped to 0-9 and None means the default level."""
+        import zlib
+
+        from dapple.renderers.kitty import DEFAULT_DEFLATE_LEVEL, _deflate
+
+        data = bytes(range(256)) * 64
+        for level in (0, 1, 9, 42, None):
+            assert zlib.decompress(_deflate(data, level)) == data
+        assert _deflate(data, 9) == _deflate(data, 12)
+        assert _deflate(data) == _deflate(data, DEFAULT_DEFLATE_LEVEL)
+        assert len(_deflate(data, 9)) < len(_deflate(data, 0))
+
+
+class TestToUint8:
+    """Tests for the _to_uint8 helper."""
+
+    def test_truncates_and_saturates(self):
+        """_to_uint8() truncates like int(v * 255) and clips out-of-range values."""
+        from dapple.renderers.kitty import _to_uint8
+
+        values = np.array([-0.5, 0.0, 0.5, 1.0, 1.5])
+        np.testing.assert_array_equal(_to_uint8(values), [0, 0, 127, 255, 255])
+
+    def test_uint8_passes_through(self):
+        """_to_uint8() returns uint8 input unchanged."""
+        from dapple.renderers.kitty import _to_uint8
+
+        data = np.arange(6, dtype=np.uint8).reshape(2, 3)
+        assert _to_uint8(data) is data
+
 class TestMakePngMinimal:
     """Tests for _make_png_minimal helper."""
 
@@ -579,6 +1232,39 @@ class TestMakePngMinimal:
         assert img.mode == "RGB"
 
 
+    def test_pil_round_trips_pixels(self):
+        """_make_png_minimal() rows decode back to the input pixels."""
+        pytest.importorskip("PIL")
+        from io import BytesIO
+
+        from PIL import Image
+
+        from dapple.renderers.kitty import _make_png_minimal
+
+        colors = np.random.rand(5, 7, 3).astype(np.float32)
+        img = Image.open(BytesIO(_make_png_minimal(np.zeros((5, 7)), colors)))
+        expected = (colors * 255).astype(np.uint8)
+        np.testing.assert_array_equal(np.asarray(img), expected)
+
+    def test_streams_rows_in_blocks(self, monkeypatch):
+        """Compressing scanlines block by block gives a complete image."""
+        import importlib
+        import zlib
+
+        mod = importlib.import_module("dapple.renderers.kitty")
+        bitmap = np.random.rand(23, 9).astype(np.float32)
+        whole = mod._make_png_minimal(bitmap)
+        monkeypatch.setattr(mod, "_PNG_BLOCK_BYTES", 40)  # 4 rows per block
+        png = mod._make_png_minimal(bitmap)
+        idat_len = int.from_bytes(png[33:37], "big")
+        assert png[37:41] == b"IDAT"
+        raw = np.frombuffer(zlib.decompress(png[41 : 41 + idat_len]), dtype=np.uint8)
+        raw = raw.reshape(23, 10)
+        assert (raw[:, 0] == 0).all()
+        np.testing.assert_array_equal(raw[:, 1:], (bitmap * 255).astype(np.uint8))
+        assert png[:33] == whole[:33]
+
+
 class TestTryPilPng:
     """Tests for _try_pil_png helper."""
 
@@ -613,6 +1299,22 @@ class TestTryPilPng:
         assert data is not None
         assert data[:8] == b"\x89PNG\r\n\x1a\n"
 
+    def test_compression_level(self):
+        """_try_pil_png() uses the given zlib level and keeps the pixels."""
+        Image = pytest.importorskip("PIL.Image")
+        import io
+
+        from dapple.renderers.kitty import _try_pil_png
+
+        colors = np.tile(np.linspace(0, 1, 64, dtype=np.float32), (64, 3, 1)).transpose(0, 2, 1)
+        fast = _try_pil_png(colors[:, :, 0], colors, level=0)
+        default = _try_pil_png(colors[:, :, 0], colors)
+        assert len(default) < len(fast)
+        assert default == _try_pil_png(colors[:, :, 0], colors, level=6)
+        for data in (fast, default, _try_pil_png(colors[:, :, 0], colors, optimize=True)):
+            pixels = np.asarray(Image.open(io.BytesIO(data)))
+            np.testing.assert_array_equal(pixels, (colors * 255).astype(np.uint8))
+
     def test_returns_none_without_pil(self):
         """_try_pil_png() returns None when PIL import fails."""
         from unittest.mock import patch
@@ -691,6 +1393,174 @@ class TestFingerprintRenderer:
         result = render_to_string(fingerprint(glyph_set="braille"), bitmap)
         assert len(result) > 0
 
+    @pytest.mark.skipif(
+        not pytest.importorskip("PIL", reason="PIL not installed"),
+        reason="PIL required for fingerprint renderer"
+    )
+    def test_render_mse_matches_brute_force(self):
+        """MSE matching picks the glyph with the smallest squared error."""
+        from dapple.renderers.fingerprint import _get_glyph_cache
+
+        rng = np.random.default_rng(0)
+        bitmap = rng.random((32, 24)).astype(np.float32)
+        result = render_to_string(fingerprint, bitmap)
+
+        cache = _get_glyph_cache("basic", 8, 16)
+        regions = bitmap.reshape(2, 16, 3, 8).transpose(0, 2, 1, 3).reshape(6, -1)
+        diff = regions[:, np.newaxis, :] - cache.bitmap_stack[np.newaxis, :, :]
+        best = (diff ** 2).mean(axis=2).argmin(axis=1)
+        expected = "".join(cache.glyphs[i] for i in best)
+        assert result == expected[:3] + "\n" + expected[3:]
+
+    @pytest.mark.skipif(
+        not pytest.importorskip("PIL", reason="PIL not installed"),
+        reason="PIL required for fingerprint renderer"
+    )
+    def test_render_tiled_matches_untiled(self, monkeypatch):
+        """Splitting regions into small tiles doesn't change the match."""
+        import importlib
+
+        fp = importlib.import_module("dapple.renderers.fingerprint")
+        bitmap = np.random.rand(64, 40).astype(np.float32)
+        for metric in ("mse", "mae"):
+            whole = render_to_string(fingerprint(metric=metric), bitmap)
+            monkeypatch.setattr(fp, "_TILE_BYTES", 1)
+            tiled = render_to_string(fingerprint(metric=metric), bitmap)
+            monkeypatch.undo()
+            assert tiled == whole
+
+    @pytest.mark.skipif(
+        not pytest.importorskip("PIL", reason="PIL not installed"),
+        reason="PIL required for fingerprint renderer"
+    )
+    def test_render_mae_glyph_blocks(self, monkeypatch):
+        """MAE matching is the same with uneven glyph blocks."""
+        import importlib
+
+        fp = importlib.import_module("dapple.renderers.fingerprint")
+        bitmap = np.random.rand(32, 40).astype(np.float32)
+        whole = render_to_string(fingerprint(metric="mae"), bitmap)
+        monkeypatch.setattr(fp, "_MAE_GLYPH_BLOCK", 7)
+        assert render_to_string(fingerprint(metric="mae"), bitmap) == whole
+
+    @pytest.mark.skipif(
+        not pytest.importorskip("PIL", reason="PIL not installed"),
+        reason="PIL required for fingerprint renderer"
+    )
+    def test_glyph_cache_persists_to_disk(self, tmp_path, monkeypatch):
+        """A second GlyphCache loads the saved stack instead of rendering."""
+        import importlib
+
+        fp = importlib.import_module("dapple.renderers.fingerprint")
+        monkeypatch.setattr(fp, "_GLYPH_CACHE_DIR", tmp_path)
+
+        first = fp.GlyphCache("basic", 6, 12)
+        levels = first.level_stack
+        assert len(list(tmp_path.glob("*.npz"))) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("glyph was re-rendered")
+
+        monkeypatch.setattr(fp, "_render_glyph_bitmap", fail)
+        second = fp.GlyphCache("basic", 6, 12)
+        assert second.glyphs == first.glyphs
+        np.testing.assert_array_equal(second.level_stack, levels)
+        np.testing.assert_array_equal(second.squared_norms, first.squared_norms)
+
+    @pytest.mark.skipif(
+        not pytest.importorskip("PIL", reason="PIL not installed"),
+        reason="PIL required for fingerprint renderer"
+    )
+    def test_glyph_cache_ignores_unusable_disk_cache(self, tmp_path, monkeypatch):
+        """Corrupt or unwritable cache locations fall back to rendering."""
+        import importlib
+
+        fp = importlib.import_module("dapple.renderers.fingerprint")
+        monkeypatch.setattr(fp, "_GLYPH_CACHE_DIR", tmp_path)
+        cache = fp.GlyphCache("basic", 6, 12)
+        path = cache._disk_cache_path(fp.GLYPH_SETS["basic"])
+        path.write_bytes(b"not an npz")
+        assert len(cache.glyphs) == 95
+
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setattr(fp, "_GLYPH_CACHE_DIR", blocker / "glyphs")
+        assert len(fp.GlyphCache("basic", 6, 12).glyphs) == 95
+
+    @pytest.mark.skipif(
+        not pytest.importorskip("PIL", reason="PIL not installed"),
+        reason="PIL required for fingerprint renderer"
+    )
+    @pytest.mark.parametrize("size", [0, 100, -1])
+    def test_glyph_cache_rewrites_truncated_file(self, tmp_path, monkeypatch, size):
+        """Empty or truncated cache files are treated as misses and replaced."""
+        import importlib
+
+        fp = importlib.import_module("dapple.renderers.fingerprint")
+        monkeypatch.setattr(fp, "_GLYPH_CACHE_DIR", tmp_path)
+        expected = fp.GlyphCache("basic", 6, 12).level_stack
+        path = next(tmp_path.glob("*.npz"))
+        data = path.read_bytes()
+        path.write_bytes(data[:size] if size >= 0 else data[: len(data) // 2])
+
+        cache = fp.GlyphCache("basic", 6, 12)
+        np.testing.assert_array_equal(cache.level_stack, expected)
+        assert path.read_bytes() == data
+        assert list(tmp_path.iterdir()) == [path]
+
+    @pytest.mark.skipif(
+        not pytest.importorskip("PIL", reason="PIL not installed"),
+        reason="PIL required for fingerprint renderer"
+    )
+    def test_glyph_cache_drops_identical_rasters(self, tmp_path, monkeypatch):
+        """Glyphs that render to the same bitmap are kept only once."""
+        import importlib
+
+        fp = importlib.import_module("dapple.renderers.fingerprint")
+        monkeypatch.setattr(fp, "_GLYPH_CACHE_DIR", tmp_path)
+        cache = fp.GlyphCache("basic", 2, 4)
+        levels = cache.level_stack
+        assert len(np.unique(levels, axis=0)) == len(levels) == len(cache.glyphs)
+        # The first of each group of identical glyphs is the one kept
+        assert cache.glyphs[0] == " "
+
+    @pytest.mark.skipif(
+        not pytest.importorskip("PIL", reason="PIL not installed"),
+        reason="PIL required for fingerprint renderer"
+    )
+    def test_glyph_cache_overlapping_sets(self):
+        """Glyphs shared between sets appear once, keeping bitmaps aligned."""
+        from dapple.renderers.fingerprint import _get_glyph_cache
+
+        cache = _get_glyph_cache("extended", 8, 16)
+        assert len(cache.glyphs) == len(set(cache.glyphs))
+        assert cache.bitmap_stack.shape[0] == len(cache.glyphs)
+
+    @pytest.mark.skipif(
+        not pytest.importorskip("PIL", reason="PIL not installed"),
+        reason="PIL required for fingerprint renderer"
+    )
+    def test_glyph_cache_stacks(self):
+        """GlyphCache keeps 8-bit levels alongside the float32 stack."""
+        from dapple.renderers.fingerprint import _get_glyph_cache
+
+        cache = _get_glyph_cache("basic", 8, 16)
+        assert cache.level_stack.dtype == np.uint8
+        assert cache.bitmap_stack.dtype == np.float32
+        np.testing.assert_allclose(cache.bitmap_stack, cache.level_stack / 255.0, atol=1e-6)
+        assert cache.squared_norms.shape == (len(cache.glyphs),)
+
+    @pytest.mark.skipif(
+        not pytest.importorskip("PIL", reason="PIL not installed"),
+        reason="PIL required for fingerprint renderer"
+    )
+    def test_render_mae_float64_input(self):
+        """MAE and MSE both accept float64 bitmaps."""
+        bitmap = np.random.rand(32, 24)
+        for metric in ("mse", "mae"):
+            result = render_to_string(fingerprint(metric=metric), bitmap)
+            assert [len(line) for line in result.split("\n")] == [3, 3]
+
     def test_call_creates_new_instance(self):
         """__call__ creates new renderer with options."""
         custom = fingerprint(glyph_set="blocks", cell_width=10, cell_height=20)
@@ -787,6 +1657,43 @@ class TestPreprocess:
         unique = np.unique(result)
         assert set(unique) <= {0.0, 1.0}
 
+    def test_floyd_steinberg_does_not_modify_input(self):
+        """floyd_steinberg works on a copy of the input."""
+        from dapple import floyd_steinberg
+
+        bitmap = np.full((4, 4), 0.4, dtype=np.float32)
+        result = floyd_steinberg(bitmap)
+        np.testing.assert_array_equal(bitmap, np.float32(0.4))
+        assert result.dtype == np.float32
+        # Error diffusion keeps average brightness close to the input
+        assert result.mean() == pytest.approx(0.4, abs=0.1)
+
+    def test_floyd_steinberg_compiled_matches_python(self):
+        """The Numba kernel matches its pure-Python definition."""
+        from dapple._jit import HAS_NUMBA
+        from dapple.preprocess import _floyd_steinberg_inplace
+
+        if not HAS_NUMBA:
+            pytest.skip("numba not installed")
+
+        bitmap = np.random.rand(12, 17).astype(np.float32)
+        compiled = bitmap.copy()
+        python = bitmap.copy()
+        _floyd_steinberg_inplace(compiled, np.float32(0.5))
+        _floyd_steinberg_inplace.py_func(python, np.float32(0.5))
+        np.testing.assert_array_equal(compiled, python)
+
+    def test_import_does_not_load_numba(self):
+        """Numba is only imported when a compiled kernel first runs."""
+        import subprocess
+        import sys
+
+        code = "import sys, dapple.extras.vizlib; print('numba' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
     def test_invert(self):
         """invert flips brightness values."""
         from dapple import invert
@@ -813,6 +1720,29 @@ class TestPreprocess:
         result = gamma_correct(bitmap, gamma=2.2)
         # 0.5^2.2 ≈ 0.218
         assert result[0, 0] == pytest.approx(0.218, abs=0.01)
+        assert result.dtype == np.float32
+        assert bitmap[0, 0] == 0.5  # input untouched
+
+    def test_gamma_correct_clamps(self):
+        """gamma_correct clamps out-of-range input before the power."""
+        from dapple import gamma_correct
+
+        bitmap = np.array([[-0.5, 1.5]], dtype=np.float64)
+        np.testing.assert_array_equal(gamma_correct(bitmap), [[0.0, 1.0]])
+
+    def test_sharpen(self):
+        """sharpen boosts a bright spot against its neighbors and clamps."""
+        from dapple.preprocess import sharpen
+
+        bitmap = np.full((3, 3), 0.5, dtype=np.float32)
+        bitmap[1, 1] = 0.6
+        result = sharpen(bitmap, strength=0.5)
+        assert result.dtype == np.float32
+        assert result[1, 1] == pytest.approx(0.6 + 0.5 * 0.4)
+        assert result[0, 1] == pytest.approx(0.5 - 0.5 * 0.1)
+        assert result[0, 0] == pytest.approx(0.5)
+        np.testing.assert_array_equal(sharpen(bitmap, strength=0.0), bitmap)
+        assert sharpen(bitmap, strength=100.0).max() == 1.0
 
     def test_resize(self):
         """resize changes bitmap dimensions."""
@@ -822,6 +1752,17 @@ class TestPreprocess:
         result = resize(bitmap, 5, 10)
         assert result.shape == (5, 10)
 
+    def test_resize_interpolates(self):
+        """resize blends neighboring pixels bilinearly."""
+        from dapple import resize
+
+        bitmap = np.array([[0.0, 1.0], [1.0, 0.0]], dtype=np.float32)
+        result = resize(bitmap, 4, 4)
+        assert result.dtype == np.float32
+        np.testing.assert_array_almost_equal(result[0], [0.0, 0.5, 1.0, 1.0])
+        np.testing.assert_array_almost_equal(result[1], [0.5, 0.5, 0.5, 0.5])
+        np.testing.assert_array_equal(resize(bitmap, 2, 2), bitmap)
+
     def test_crop(self):
         """crop extracts rectangular region."""
         from dapple.preprocess import crop
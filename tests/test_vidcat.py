@@ -14,6 +14,7 @@ from dapple.extras.vidcat.vidcat import (
     VidcatOptions,
     check_ffmpeg,
     extract_frames,
+    frames_select_expr,
     get_video_info,
     parse_frames,
     parse_interval,
@@ -110,6 +111,29 @@ class TestParseFrames:
         assert result == [0, 4, 9]
 
 
+class TestFramesSelectExpr:
+    """Tests for frames_select_expr function."""
+
+    def test_single_frame(self):
+        assert frames_select_expr("5") == "eq(n,4)"
+
+    def test_range(self):
+        assert frames_select_expr("1-5") == "between(n,0,4)"
+
+    def test_first_n_frames(self):
+        assert frames_select_expr("-5") == "lt(n,5)"
+
+    def test_frames_from_n(self):
+        assert frames_select_expr("100-") == "gte(n,99)"
+
+    def test_complex_selection(self):
+        assert frames_select_expr(" 1, 5-7 ,10") == "eq(n,0)+between(n,4,6)+eq(n,9)"
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            frames_select_expr("abc")
+
+
 class TestVidcatOptions:
     """Tests for VidcatOptions dataclass."""
 
@@ -126,6 +150,7 @@ class TestVidcatOptions:
         assert opts.max_frames == 10
         assert opts.frames is None
         assert opts.every is None
+        assert opts.hwaccel == "auto"
 
     def test_custom_values(self):
         opts = VidcatOptions(
@@ -182,6 +207,46 @@ class TestGetVideoInfo:
         assert info["height"] == 1080
         assert info["frame_count"] == 1800
 
+    def test_prefers_nb_frames(self):
+        mock_output = json.dumps({
+            "format": {"duration": "10.0"},
+            "streams": [
+                {
+                    "codec_type": "video",
+                    "r_frame_rate": "30/1",
+                    "nb_frames": "287",
+                    "width": 640,
+                    "height": 480,
+                }
+            ]
+        })
+
+        with mock.patch("subprocess.run") as mock_run:
+            mock_run.return_value = mock.Mock(stdout=mock_output, returncode=0)
+            info = get_video_info(Path("test.mp4"))
+
+        assert info["frame_count"] == 287
+
+    def test_nb_frames_unavailable_falls_back_to_estimate(self):
+        mock_output = json.dumps({
+            "format": {"duration": "10.0"},
+            "streams": [
+                {
+                    "codec_type": "video",
+                    "r_frame_rate": "30/1",
+                    "nb_frames": "N/A",
+                    "width": 640,
+                    "height": 480,
+                }
+            ]
+        })
+
+        with mock.patch("subprocess.run") as mock_run:
+            mock_run.return_value = mock.Mock(stdout=mock_output, returncode=0)
+            info = get_video_info(Path("test.mp4"))
+
+        assert info["frame_count"] == 300
+
     def test_fractional_fps(self):
         mock_output = json.dumps({
             "format": {"duration": "10.0"},
@@ -258,6 +323,50 @@ class TestExtractFrames:
             assert frames[0].name == "frame_0001.png"
             assert frames[1].name == "frame_0002.png"
 
+    def test_frames_skips_ffprobe(self):
+        """Frame selection is evaluated by ffmpeg without probing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            options = VidcatOptions(frames="1,5-7")
+
+            with mock.patch("subprocess.run") as mock_run:
+                with mock.patch("dapple.extras.vidcat.vidcat.get_video_info") as mock_info:
+                    list(extract_frames(Path("test.mp4"), options, Path(tmpdir)))
+
+            mock_info.assert_not_called()
+            cmd = mock_run.call_args[0][0]
+            assert "select='eq(n,0)+between(n,4,6)'" in cmd
+
+    def test_hwaccel_precedes_input(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            options = VidcatOptions(every="1s", hwaccel="auto")
+            with mock.patch("subprocess.run") as mock_run:
+                list(extract_frames(Path("test.mp4"), options, Path(tmpdir)))
+
+            cmd = mock_run.call_args[0][0]
+            assert cmd.index("-hwaccel") < cmd.index("-i")
+            assert cmd[cmd.index("-hwaccel") + 1] == "auto"
+
+    def test_hwaccel_disabled(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            options = VidcatOptions(every="1s", hwaccel=None)
+            with mock.patch("subprocess.run") as mock_run:
+                list(extract_frames(Path("test.mp4"), options, Path(tmpdir)))
+
+            assert "-hwaccel" not in mock_run.call_args[0][0]
+
+    def test_every_skips_ffprobe(self):
+        """Interval extraction does not need video metadata."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            options = VidcatOptions(every="1s")
+
+            with mock.patch("subprocess.run") as mock_run:
+                with mock.patch("dapple.extras.vidcat.vidcat.get_video_info") as mock_info:
+                    list(extract_frames(Path("test.mp4"), options, Path(tmpdir)))
+
+            mock_info.assert_not_called()
+            cmd = mock_run.call_args[0][0]
+            assert "fps=1/1.0" in cmd
+
 
 class TestSkillInstall:
     """Tests for skill_install function."""
@@ -305,6 +414,63 @@ class TestVidcatFunction:
             with pytest.raises(FileNotFoundError, match="Video not found"):
                 vidcat("/nonexistent/video.mp4")
 
+    def test_frame_delay_uses_deadlines(self):
+        """Sleep only until the next deadline, and never when running late."""
+        from dapple.extras.vidcat.vidcat import vidcat
+
+        clock = iter([0.0, 0.4, 2.5, 2.5])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            video = Path(tmpdir) / "video.mp4"
+            video.write_bytes(b"fake")
+            frame_paths = [Path("a.png"), Path("b.png"), Path("c.png")]
+
+            with mock.patch("dapple.extras.vidcat.vidcat.check_ffmpeg", return_value=True), \
+                 mock.patch("dapple.extras.vidcat.vidcat.extract_frames", return_value=iter(frame_paths)), \
+                 mock.patch("dapple.extras.vidcat.vidcat.render_frame"), \
+                 mock.patch("time.perf_counter", side_effect=lambda: next(clock)), \
+                 mock.patch("time.sleep") as mock_sleep:
+                vidcat(video, dest=io.StringIO(), frame_delay=1.0)
+
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(0.6)
+
+    def _run_frames(self, dest, **kwargs):
+        from dapple.extras.vidcat.vidcat import vidcat
+
+        def fake_render(frame_path, options, dest):
+            dest.write(frame_path.stem)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            video = Path(tmpdir) / "video.mp4"
+            video.write_bytes(b"fake")
+            frame_paths = [Path("a.png"), Path("b.png")]
+
+            with mock.patch("dapple.extras.vidcat.vidcat.check_ffmpeg", return_value=True), \
+                 mock.patch("dapple.extras.vidcat.vidcat.extract_frames", return_value=iter(frame_paths)), \
+                 mock.patch("dapple.extras.vidcat.vidcat.render_frame", side_effect=fake_render):
+                vidcat(video, dest=dest, **kwargs)
+        return dest.getvalue()
+
+    def test_in_place_on_tty(self):
+        dest = io.StringIO()
+        dest.isatty = lambda: True
+        out = self._run_frames(dest, in_place=True)
+        assert out == (
+            "\x1b[?2026h\x1b[2J\x1b[Ha\x1b[?2026l"
+            "\x1b[?2026h\x1b[Hb\x1b[?2026l"
+        )
+
+    def test_in_place_ignored_when_not_tty(self):
+        out = self._run_frames(io.StringIO(), in_place=True)
+        assert out == "a\nb"
+
+    def test_enables_kernels(self):
+        from dapple import _jit
+
+        self._run_frames(io.StringIO())
+        assert _jit._kernels_enabled
+
 
 class TestViewFunction:
     """Tests for view() alias function."""
@@ -351,6 +517,36 @@ class TestToAsciinema:
             with pytest.raises(ValueError, match="fps must be positive"):
                 to_asciinema("test.mp4", "output.cast", fps=-1)
 
+    def test_writes_header_and_events(self):
+        from dapple.extras.vidcat.vidcat import to_asciinema
+
+        def fake_render(frame_path, options, dest):
+            dest.write(f"frame {frame_path.name}")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmppath = Path(tmpdir)
+            video = tmppath / "video.mp4"
+            video.write_bytes(b"fake")
+            cast = tmppath / "out.cast"
+            frame_paths = [Path("a.png"), Path("b.png"), Path("c.png")]
+
+            with mock.patch("dapple.extras.vidcat.vidcat.check_ffmpeg", return_value=True), \
+                 mock.patch("dapple.extras.vidcat.vidcat.extract_frames", return_value=iter(frame_paths)), \
+                 mock.patch("dapple.extras.vidcat.vidcat.render_frame", side_effect=fake_render):
+                to_asciinema(video, cast, fps=4, width=40, height=10, title="demo")
+
+            lines = cast.read_text().splitlines()
+
+        header = json.loads(lines[0])
+        assert header["version"] == 2
+        assert header["width"] == 40
+        assert header["title"] == "demo"
+
+        events = [json.loads(line) for line in lines[1:]]
+        assert [e[0] for e in events] == [0.0, 0.25, 0.5]
+        assert all(e[1] == "o" for e in events)
+        assert events[1][2].endswith("frame b.png")
+
 
 class TestCLI:
     """Tests for CLI argument parsing."""
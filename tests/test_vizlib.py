@@ -37,10 +37,31 @@ class TestColors:
     def test_parse_invalid_hex(self):
         with pytest.raises(ValueError, match="Invalid hex"):
             parse_color("#12345")
+        with pytest.raises(ValueError, match="Invalid hex"):
+            parse_color("#gg0000")
+        with pytest.raises(ValueError, match="Invalid hex"):
+            parse_color("#12 34 ")
+
+    def test_parse_hex_exact_channels(self):
+        assert parse_color("#80ff01") == (128 / 255, 1.0, 1 / 255)
+
+    def test_ansi_escapes(self):
+        from dapple.extras.vizlib.colors import ANSI_RESET, ansi_fg, ansi_reset
+
+        assert ansi_fg(1.0, 0.5, 0.0) == "\033[38;2;255;127;0m"
+        assert ansi_fg(1.0, 0.5, 0.0) is ansi_fg(1.0, 0.5, 0.0)
+        assert ansi_reset() == ANSI_RESET == "\033[0m"
 
     def test_palette_length(self):
         assert len(COLOR_PALETTE) == 8
 
+    def test_palette_array_matches_palette(self):
+        from dapple.extras.vizlib.colors import COLOR_PALETTE_ARR
+
+        assert COLOR_PALETTE_ARR.shape == (len(COLOR_PALETTE), 3)
+        assert COLOR_PALETTE_ARR.dtype == np.float32
+        np.testing.assert_array_almost_equal(COLOR_PALETTE_ARR, COLOR_PALETTE)
+
 
 # ── Renderer tests ───────────────────────────────────────────────────
 
@@ -51,6 +72,11 @@ class TestRender:
         assert r.cell_width == 2
         assert r.cell_height == 4
 
+    def test_get_renderer_reuses_instance(self):
+        r = get_renderer("quadrants")
+        assert r.true_color is True
+        assert get_renderer("quadrants") is r
+
     def test_get_renderer_unknown(self):
         with pytest.raises(ValueError, match="Unknown renderer"):
             get_renderer("nonexistent")
@@ -106,10 +132,24 @@ class TestSparkline:
         canvas = sparkline([], width=20, height=10)
         assert canvas.bitmap.max() == 0
 
+    def test_empty_canvases_share_buffer(self):
+        a = sparkline([], width=20, height=10)
+        b = histogram([], width=20, height=10)
+        assert a._bitmap is b._bitmap
+        assert not a._bitmap.flags.writeable
+        assert a.to_bitmap().flags.writeable
+
     def test_negative_values(self):
         canvas = sparkline([-3, -1, 0, 1, 3], width=40, height=20)
         assert canvas.bitmap.max() > 0
 
+    def test_numpy_input_matches_list(self):
+        data = np.array([3.0, 1.0, 4.0, 1.0, 5.0])
+        canvas = sparkline(data, width=40, height=20)
+        expected = sparkline(data.tolist(), width=40, height=20)
+        np.testing.assert_array_equal(canvas.bitmap, expected.bitmap)
+        np.testing.assert_array_equal(data, [3.0, 1.0, 4.0, 1.0, 5.0])
+
 
 # ── Line plot tests ──────────────────────────────────────────────────
 
@@ -136,6 +176,46 @@ class TestLinePlot:
         assert canvas.bitmap.max() == 0
 
 
+# ── Line rasterization tests ─────────────────────────────────────────
+
+
+def _bresenham(x0, y0, x1, y1):
+    """Reference step-by-step Bresenham line."""
+    dx, dy = abs(x1 - x0), abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    err = dx - dy
+    points = []
+    while True:
+        points.append((x0, y0))
+        if x0 == x1 and y0 == y1:
+            return points
+        e2 = 2 * err
+        if e2 > -dy:
+            err -= dy
+            x0 += sx
+        if e2 < dx:
+            err += dx
+            y0 += sy
+
+
+class TestLinePixels:
+    def test_matches_bresenham_all_octants(self):
+        from dapple.extras.vizlib.charts import _line_pixels
+
+        ends = [(x, y) for x in range(-6, 7) for y in range(-6, 7)]
+        segs = np.array([(0, 0, x, y) for x, y in ends] + [(3, -2, x, y) for x, y in ends])
+        xs, ys = _line_pixels(segs[:, 0], segs[:, 1], segs[:, 2], segs[:, 3])
+
+        expected = [p for seg in segs.tolist() for p in _bresenham(*seg)]
+        assert list(zip(xs.tolist(), ys.tolist())) == expected
+
+    def test_polyline_connects_points(self):
+        canvas = sparkline([0, 10], width=5, height=5)
+        lit = set(zip(*np.nonzero(canvas.bitmap)))
+        assert lit == {(4, 0), (3, 1), (2, 2), (1, 3), (0, 4)}
+
+
 # ── Bar chart tests ──────────────────────────────────────────────────
 
 
@@ -167,6 +247,14 @@ class TestBarChart:
         canvas = bar_chart([], [], width=20, height=10)
         assert canvas.bitmap.max() == 0
 
+    def test_vertical_layout(self):
+        canvas = bar_chart(["a", "b"], [1, 2], width=10, height=5, horizontal=False)
+        heights = canvas.bitmap.sum(axis=0)
+        # Bars 4px wide separated by a 1px gap, bottom-aligned
+        np.testing.assert_array_equal(heights, [2, 2, 2, 2, 0, 4, 4, 4, 4, 0])
+        assert canvas.bitmap[-1, 0] == 1.0 and canvas.bitmap[0, 0] == 0.0
+        np.testing.assert_array_almost_equal(canvas.colors[-1, 5], COLOR_PALETTE[1])
+
     def test_zero_values(self):
         canvas = bar_chart(["a", "b"], [0, 0], width=40, height=20)
         assert isinstance(canvas, Canvas)
@@ -196,6 +284,20 @@ class TestHistogram:
         canvas = histogram([], width=20, height=10)
         assert canvas.bitmap.max() == 0
 
+    def test_bin_counts_match_numpy(self):
+        from dapple.extras.vizlib.charts import _bin_counts
+
+        rng = np.random.default_rng(0)
+        for data in (np.arange(50.0), rng.normal(size=1000), np.full(10, 3.0)):
+            np.testing.assert_array_equal(
+                _bin_counts(data, 10), np.histogram(data, bins=10)[0]
+            )
+
+    def test_bar_layout(self):
+        canvas = histogram([0, 1, 1], width=8, height=5, bins=2)
+        # Two 4px bins, each with a 1px gap on the right; taller bar for 2 counts
+        np.testing.assert_array_equal(canvas.bitmap.sum(axis=0), [2, 2, 2, 0, 4, 4, 4, 0])
+
 
 # ── Heatmap tests ────────────────────────────────────────────────────
 
@@ -232,6 +334,25 @@ class TestHeatmap:
         assert isinstance(canvas, Canvas)
 
 
+# ── Grayscale fast path ──────────────────────────────────────────────
+
+
+class TestWithoutColors:
+    @pytest.mark.parametrize("chart, args", [
+        (sparkline, ([1, 3, 2],)),
+        (line_plot, ([-1, 3, 2],)),
+        (bar_chart, (["a", "b"], [1, 2])),
+        (histogram, ([1, 2, 2, 3],)),
+        (heatmap, ([[1, 2], [3, 4]],)),
+    ])
+    def test_same_bitmap_no_colors(self, chart, args):
+        gray = chart(*args, width=20, height=12, with_colors=False)
+        full = chart(*args, width=20, height=12)
+        assert gray.colors is None
+        assert full.colors is not None
+        np.testing.assert_array_equal(gray.bitmap, full.bitmap)
+
+
 # ── Integration: Canvas renders with dapple ──────────────────────────
 
 